@@ -20,6 +20,8 @@ from app.models import (
     Post,
     Comment,
     Reaction,
+    CategoryPostCount,
+    UserSession,
 )
 
 # this is the Alembic Config object
@@ -0,0 +1,36 @@
+"""add composite indexes for post feed keyset pagination
+
+Revision ID: c7e2a9f4b1d3
+Revises: 9b3d1c0d4f42
+Create Date: 2026-03-20 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "c7e2a9f4b1d3"
+down_revision = "9b3d1c0d4f42"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_posts_category_created_id",
+        "posts",
+        ["category_id", sa.text("created_at DESC"), sa.text("id DESC")],
+        unique=False,
+    )
+    op.create_index(
+        "ix_posts_created_id",
+        "posts",
+        [sa.text("created_at DESC"), sa.text("id DESC")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_posts_created_id", table_name="posts")
+    op.drop_index("ix_posts_category_created_id", table_name="posts")
@@ -0,0 +1,39 @@
+"""add category post counts
+
+Revision ID: 5e8b3d2a6c91
+Revises: c7e2a9f4b1d3
+Create Date: 2026-03-25 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "5e8b3d2a6c91"
+down_revision = "c7e2a9f4b1d3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "category_post_counts",
+        sa.Column("category_id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("post_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.PrimaryKeyConstraint("category_id"),
+    )
+    # 기존 게시글 수 백필 (미분류 게시글은 0번 키)
+    op.execute(
+        """
+        INSERT INTO category_post_counts (category_id, post_count)
+        SELECT COALESCE(category_id, 0), COUNT(*)
+        FROM posts
+        GROUP BY COALESCE(category_id, 0)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("category_post_counts")
@@ -0,0 +1,31 @@
+"""add trigram search index on posts
+
+Revision ID: 2b6f0e7d9a48
+Revises: 5e8b3d2a6c91
+Create Date: 2026-04-01 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "2b6f0e7d9a48"
+down_revision = "5e8b3d2a6c91"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # CONCURRENTLY는 트랜잭션 밖에서만 실행 가능 (쓰기 차단 없이 인덱스 생성)
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_posts_search_trgm "
+            "ON posts USING gin ((title || ' ' || content) gin_trgm_ops)"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_posts_search_trgm")
@@ -0,0 +1,54 @@
+"""add hot score to posts
+
+Revision ID: 8d4c1f6e2b57
+Revises: 2b6f0e7d9a48
+Create Date: 2026-04-05 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "8d4c1f6e2b57"
+down_revision = "2b6f0e7d9a48"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "posts",
+        sa.Column("hot_score", sa.Float(), server_default="0", nullable=False),
+    )
+    # 기존 게시글 점수 백필 (app/utils/hot_score.py와 동일한 식)
+    op.execute(
+        """
+        UPDATE posts SET hot_score =
+            log(greatest(
+                like_count * 3.0
+                + (SELECT count(*) FROM comments WHERE comments.post_id = posts.id) * 2.0
+                + view_count * 0.1,
+                1.0
+            ))
+            + (extract(epoch FROM created_at)::float - 1767225600) / 45000
+        """
+    )
+    op.create_index(
+        "ix_posts_category_hot_id",
+        "posts",
+        ["category_id", sa.text("hot_score DESC"), sa.text("id DESC")],
+        unique=False,
+    )
+    op.create_index(
+        "ix_posts_hot_id",
+        "posts",
+        [sa.text("hot_score DESC"), sa.text("id DESC")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_posts_hot_id", table_name="posts")
+    op.drop_index("ix_posts_category_hot_id", table_name="posts")
+    op.drop_column("posts", "hot_score")
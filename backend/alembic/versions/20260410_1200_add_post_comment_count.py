@@ -0,0 +1,39 @@
+"""add comment count to posts
+
+Revision ID: 3a9e5c7b1f02
+Revises: 8d4c1f6e2b57
+Create Date: 2026-04-10 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "3a9e5c7b1f02"
+down_revision = "8d4c1f6e2b57"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "posts",
+        sa.Column("comment_count", sa.Integer(), server_default="0", nullable=False),
+    )
+    # 기존 댓글 수 백필
+    op.execute(
+        """
+        UPDATE posts SET comment_count = counts.comment_count
+        FROM (
+            SELECT post_id, COUNT(*) AS comment_count
+            FROM comments
+            GROUP BY post_id
+        ) AS counts
+        WHERE posts.id = counts.post_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("posts", "comment_count")
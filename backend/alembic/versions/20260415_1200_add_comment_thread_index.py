@@ -0,0 +1,29 @@
+"""add composite index for comment thread keyset pagination
+
+Revision ID: 6f1d8b3e4c29
+Revises: 3a9e5c7b1f02
+Create Date: 2026-04-15 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "6f1d8b3e4c29"
+down_revision = "3a9e5c7b1f02"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_comments_post_created_id",
+        "comments",
+        ["post_id", "created_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_comments_post_created_id", table_name="comments")
@@ -0,0 +1,45 @@
+"""respace post image sort order for sparse reordering
+
+Revision ID: 7c2e4a9d5b16
+Revises: 6f1d8b3e4c29
+Create Date: 2026-04-20 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "7c2e4a9d5b16"
+down_revision = "6f1d8b3e4c29"
+branch_labels = None
+depends_on = None
+
+SORT_ORDER_GAP = 1024
+
+
+def upgrade() -> None:
+    # 연속 값(0, 1, 2, ...)을 희소 값(0, 1024, 2048, ...)으로 재배정
+    op.execute(
+        f"""
+        UPDATE post_images SET sort_order = ranked.position * {SORT_ORDER_GAP}
+        FROM (
+            SELECT id, ROW_NUMBER() OVER (PARTITION BY post_id ORDER BY sort_order, id) - 1 AS position
+            FROM post_images
+        ) AS ranked
+        WHERE post_images.id = ranked.id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        UPDATE post_images SET sort_order = ranked.position
+        FROM (
+            SELECT id, ROW_NUMBER() OVER (PARTITION BY post_id ORDER BY sort_order, id) - 1 AS position
+            FROM post_images
+        ) AS ranked
+        WHERE post_images.id = ranked.id
+        """
+    )
@@ -0,0 +1,34 @@
+"""add token version to users for signed session revocation
+
+Revision ID: 4b8f2d6a9e13
+Revises: 7c2e4a9d5b16
+Create Date: 2026-04-25 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "4b8f2d6a9e13"
+down_revision = "7c2e4a9d5b16"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "users",
+        sa.Column("token_version", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.create_index(
+        "ix_users_revoked_updated_at",
+        "users",
+        ["updated_at"],
+        postgresql_where=sa.text("token_version > 0"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_users_revoked_updated_at", table_name="users")
+    op.drop_column("users", "token_version")
@@ -0,0 +1,60 @@
+"""add sessions table for multi-device login
+
+Revision ID: 9e3a7c1d5f28
+Revises: 4b8f2d6a9e13
+Create Date: 2026-05-01 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "9e3a7c1d5f28"
+down_revision = "4b8f2d6a9e13"
+branch_labels = None
+depends_on = None
+
+SESSION_EXPIRE_HOURS = 720
+
+
+def upgrade() -> None:
+    op.create_table(
+        "sessions",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("token_hash", sa.String(length=64), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("last_seen_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_sessions_id"), "sessions", ["id"], unique=False)
+    op.create_index(op.f("ix_sessions_user_id"), "sessions", ["user_id"], unique=False)
+    op.create_index(op.f("ix_sessions_token_hash"), "sessions", ["token_hash"], unique=True)
+    op.create_index(op.f("ix_sessions_expires_at"), "sessions", ["expires_at"], unique=False)
+
+    # 기존 users.session_token 세션 이전 (만료되지 않은 것만)
+    op.execute(
+        f"""
+        INSERT INTO sessions (user_id, token_hash, created_at, last_seen_at, expires_at)
+        SELECT
+            id,
+            encode(sha256(convert_to(session_token, 'UTF8')), 'hex'),
+            COALESCE(session_created_at, created_at),
+            COALESCE(session_created_at, created_at),
+            COALESCE(session_created_at, created_at) + INTERVAL '{SESSION_EXPIRE_HOURS} hours'
+        FROM users
+        WHERE session_token IS NOT NULL
+          AND COALESCE(session_created_at, created_at) + INTERVAL '{SESSION_EXPIRE_HOURS} hours' > now()
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_sessions_expires_at"), table_name="sessions")
+    op.drop_index(op.f("ix_sessions_token_hash"), table_name="sessions")
+    op.drop_index(op.f("ix_sessions_user_id"), table_name="sessions")
+    op.drop_index(op.f("ix_sessions_id"), table_name="sessions")
+    op.drop_table("sessions")
@@ -0,0 +1,41 @@
+"""add comments updated at to posts
+
+Revision ID: 6c2f8a4d1e37
+Revises: 9e3a7c1d5f28
+Create Date: 2026-05-05 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "6c2f8a4d1e37"
+down_revision = "9e3a7c1d5f28"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "posts",
+        sa.Column(
+            "comments_updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+    )
+    # 기존 게시글은 마지막 댓글 수정 시각(없으면 게시글 작성 시각)으로 백필
+    op.execute(
+        """
+        UPDATE posts SET comments_updated_at = COALESCE(
+            (SELECT MAX(comments.updated_at) FROM comments WHERE comments.post_id = posts.id),
+            posts.created_at
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("posts", "comments_updated_at")
@@ -0,0 +1,140 @@
+# app/core/cache.py
+"""
+프로세스 내 TTL + LRU 캐시
+"""
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+from app.core.config import settings
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """최대 항목 수(LRU 제거)와 만료 시간(TTL)을 가진 캐시"""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[K, Tuple[float, V]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: K) -> Optional[V]:
+        """캐시 조회 (만료된 항목은 제거 후 None)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: K, value: V, ttl_seconds: Optional[float] = None) -> None:
+        """캐시 저장 (최대 항목 수 초과 시 가장 오래 사용되지 않은 항목 제거)"""
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: K) -> None:
+        self._entries.pop(key, None)
+
+    def delete_where(self, predicate: Callable[[K], bool]) -> int:
+        """조건에 맞는 키 일괄 제거"""
+        keys = [key for key in self._entries if predicate(key)]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+# 게시글 목록 응답 캐시 키: (category_id, sort, page, cursor, page_size)
+FeedCacheKey = Tuple[Optional[int], str, int, Optional[str], int]
+
+_feed_cache = None
+
+def get_feed_cache() -> TTLCache[FeedCacheKey, bytes]:
+    """게시글 목록 응답 캐시 인스턴스 반환"""
+    global _feed_cache
+    if _feed_cache is None:
+        _feed_cache = TTLCache(
+            max_entries=settings.FEED_CACHE_MAX_ENTRIES,
+            ttl_seconds=settings.FEED_CACHE_TTL_SECONDS,
+        )
+    return _feed_cache
+
+
+def invalidate_feed_cache(*category_ids: Optional[int]) -> int:
+    """
+    카테고리 목록 캐시와 전체 목록 캐시를 무효화합니다
+
+    Returns:
+        제거된 항목 수
+    """
+    affected = set(category_ids) | {None}
+    return get_feed_cache().delete_where(lambda key: key[0] in affected)
+
+
+# 세션 토큰 해시 -> 사용자 ID (항목 TTL은 세션 만료 시각을 넘지 않음)
+_session_cache = None
+
+def get_session_cache() -> TTLCache[str, int]:
+    """세션 조회 캐시 인스턴스 반환"""
+    global _session_cache
+    if _session_cache is None:
+        _session_cache = TTLCache(
+            max_entries=settings.SESSION_CACHE_MAX_ENTRIES,
+            ttl_seconds=settings.SESSION_CACHE_TTL_SECONDS,
+        )
+    return _session_cache
+
+
+def invalidate_session_cache(*token_hashes: Optional[str]) -> None:
+    """세션 캐시 항목 제거 (None은 무시)"""
+    cache = get_session_cache()
+    for token_hash in token_hashes:
+        if token_hash:
+            cache.delete(token_hash)
+
+
+# 사용자 ID -> 사용자 스냅샷 (password_hash 제외 컬럼 값)
+_user_snapshot_cache = None
+
+def get_user_snapshot_cache() -> TTLCache[int, Dict[str, Any]]:
+    """인증 사용자 스냅샷 캐시 인스턴스 반환"""
+    global _user_snapshot_cache
+    if _user_snapshot_cache is None:
+        _user_snapshot_cache = TTLCache(
+            max_entries=settings.SESSION_CACHE_MAX_ENTRIES,
+            ttl_seconds=settings.SESSION_CACHE_TTL_SECONDS,
+        )
+    return _user_snapshot_cache
+
+
+def invalidate_user_snapshot_cache(*user_ids: int) -> None:
+    cache = get_user_snapshot_cache()
+    for user_id in user_ids:
+        cache.delete(user_id)
@@ -34,6 +34,11 @@ class Settings(BaseSettings):
     JWT_SECRET_KEY: str = ""
     JWT_ALGORITHM: str = "HS256"
     SESSION_EXPIRE_HOURS: int = 720  # 30 days
+    SESSION_TOKEN_MODE: str = "opaque"  # "opaque" (DB 조회) 또는 "signed" (JWT_SECRET_KEY 서명, 메모리 검증)
+    TOKEN_REVOCATION_SYNC_INTERVAL_SECONDS: float = 30.0
+    PASSWORD_HASH_MAX_WORKERS: int = 2  # 동시에 실행할 PBKDF2 해싱 수 (CPU 코어 수 이하 권장)
+    PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS: float = 5.0  # 초과 시 503
+    ADMIN_API_TOKEN: str = ""  # 비어 있으면 관리자 API 비활성화 (X-Admin-Token)
 
     # OpenAI API (추가)
     OPENAI_API_KEY: str = ""
@@ -42,6 +47,48 @@ class Settings(BaseSettings):
     UPLOAD_DIR: str = "uploads"
     UPLOAD_URL_PATH: str = "/uploads"
 
+    # Caches
+    FEED_CACHE_TTL_SECONDS: float = 10.0
+    FEED_CACHE_MAX_ENTRIES: int = 512
+    FEED_CACHE_MAX_PAGES: int = 3  # 캐시할 page 기반 목록의 최대 페이지 번호
+    SESSION_CACHE_TTL_SECONDS: float = 60.0  # 세션 만료 시각을 넘지 않도록 항목별로 단축됨
+    SESSION_CACHE_MAX_ENTRIES: int = 10000
+
+    # OCR result cache (디스크)
+    OCR_CACHE_ENABLED: bool = True
+    OCR_CACHE_DIR: str = "cache/ocr"
+    OCR_CACHE_MAX_BYTES: int = 200 * 1024 * 1024
+    OCR_CACHE_TTL_SECONDS: float = 30 * 24 * 3600
+    OCR_IMAGE_MAX_WORKERS: int = 2  # 업로드 전 이미지 전처리 스레드 수
+    OCR_IMAGE_JPEG_QUALITY: int = 85
+
+    # OCR jobs (비동기 분석)
+    OCR_JOB_MAX_WORKERS: int = 2  # 작업 워커 수이자 GPT-4o 동시 호출 상한 (/ocr/analyze, /ocr/analyze/stream 포함)
+    OCR_JOB_MAX_PENDING: int = 50  # 초과 시 503
+    OCR_JOB_MAX_PENDING_BYTES: int = 200 * 1024 * 1024  # 대기/실행 중 작업이 메모리에 보관하는 이미지 총량, 초과 시 503
+    OCR_JOB_RETENTION_SECONDS: float = 600.0  # 완료된 작업 결과 보관 시간
+
+    # Nickname index (블룸 필터)
+    NICKNAME_INDEX_CAPACITY: int = 100000
+    NICKNAME_INDEX_ERROR_RATE: float = 0.01
+
+    # Rate limiting
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_MAX_KEYS: int = 100000
+    RATE_LIMIT_TRUST_FORWARDED_FOR: bool = False  # 리버스 프록시 뒤에서만 True
+
+    # Feed
+    FEED_CONTENT_EXCERPT_LENGTH: int = 300  # 목록 응답의 본문 발췌 길이 (문자)
+
+    # Background jobs
+    POST_COUNT_RECONCILE_INTERVAL_SECONDS: int = 3600  # 0이면 비활성화
+    VIEW_COUNT_FLUSH_INTERVAL_SECONDS: float = 5.0
+    HOT_SCORE_REFRESH_INTERVAL_SECONDS: float = 60.0
+    NICKNAME_INDEX_SYNC_INTERVAL_SECONDS: float = 30.0
+    NICKNAME_INDEX_REBUILD_INTERVAL_SECONDS: float = 3600.0
+    SESSION_SWEEP_INTERVAL_SECONDS: int = 600  # 0이면 비활성화
+    SESSION_SWEEP_BATCH_SIZE: int = 1000
+
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -67,6 +114,9 @@ class Settings(BaseSettings):
                 raise ValueError("SECRET_KEY must be set in production")
             object.__setattr__(self, "SECRET_KEY", "dev-secret-change-me")
         
+        if self.SESSION_TOKEN_MODE not in ("opaque", "signed"):
+            raise ValueError("SESSION_TOKEN_MODE must be 'opaque' or 'signed'")
+
         # OpenAI API Key 검증 (선택사항)
         if not self.OPENAI_API_KEY:
             import logging
@@ -1,5 +1,8 @@
+from typing import Any, Callable
+
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy.orm import declarative_base
+from sqlalchemy.orm import Session, declarative_base
 from app.core.config import settings
 
 # Create async engine
@@ -23,6 +26,34 @@ AsyncSessionLocal = async_sessionmaker(
 Base = declarative_base()
 
 
+# 커밋 후 실행할 작업 (session.info에 보관)
+_AFTER_COMMIT_CALLBACKS = "after_commit_callbacks"
+
+
+def run_after_commit(session: AsyncSession, callback: Callable[..., Any], *args: Any) -> None:
+    """
+    트랜잭션이 커밋된 뒤 callback(*args) 실행 (롤백되면 버림)
+    - 캐시 무효화 등 프로세스 메모리 작업용: 커밋 전에 실행하면 동시 요청이 이전 상태를 다시 캐시할 수 있음
+    """
+    session.info.setdefault(_AFTER_COMMIT_CALLBACKS, []).append((callback, args))
+
+
+@event.listens_for(Session, "after_commit")
+def _run_after_commit_callbacks(session: Session) -> None:
+    # 세이브포인트 커밋은 건너뜀 (바깥 트랜잭션 커밋 시 실행)
+    if session.in_nested_transaction():
+        return
+    for callback, args in session.info.pop(_AFTER_COMMIT_CALLBACKS, []):
+        callback(*args)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_commit_callbacks(session: Session) -> None:
+    if session.in_nested_transaction():
+        return
+    session.info.pop(_AFTER_COMMIT_CALLBACKS, None)
+
+
 # Dependency
 async def get_db() -> AsyncSession:
     async with AsyncSessionLocal() as session:
@@ -1,9 +1,12 @@
+import hmac
 from fastapi import Depends, HTTPException, status, Header
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 
+from app.core.config import settings
 from app.core.database import get_db
 from app.repositories.user_repository import UserRepository
+from app.repositories.session_repository import SessionRepository
 from app.services.auth_service import AuthService
 from app.models.user import User
 
@@ -18,8 +21,7 @@ async def get_current_user_optional(
     if not session_token:
         return None
 
-    repo = UserRepository(db)
-    auth_service = AuthService(repo)
+    auth_service = AuthService(UserRepository(db), SessionRepository(db))
     user = await auth_service.validate_session(session_token)
     return user
 
@@ -37,8 +39,7 @@ async def get_current_user(
             detail="Session token required",
         )
 
-    repo = UserRepository(db)
-    auth_service = AuthService(repo)
+    auth_service = AuthService(UserRepository(db), SessionRepository(db))
     user = await auth_service.validate_session(session_token)
     if not user:
         raise HTTPException(
@@ -46,3 +47,18 @@ async def get_current_user(
             detail="Invalid session token",
         )
     return user
+
+
+async def require_admin(
+    admin_token: Optional[str] = Header(None, alias="X-Admin-Token"),
+) -> None:
+    """
+    관리자 인증: ADMIN_API_TOKEN이 설정되지 않았거나 토큰이 다르면 403 에러
+    """
+    if not settings.ADMIN_API_TOKEN or not admin_token or not hmac.compare_digest(
+        admin_token.encode(), settings.ADMIN_API_TOKEN.encode()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required",
+        )
@@ -0,0 +1,83 @@
+# app/core/hot_score_refresher.py
+"""
+인기(hot) 점수 증분 갱신기
+- 좋아요/댓글/조회수가 바뀐 게시글만 기록해 두었다가 주기적으로 점수 재계산
+"""
+import asyncio
+import logging
+from typing import Set
+
+from app.core.database import AsyncSessionLocal
+from app.repositories.post_repository import PostRepository
+
+logger = logging.getLogger(__name__)
+
+
+class HotScoreRefresher:
+    """프로세스 내 인기 점수 갱신 대상 추적기"""
+
+    def __init__(self):
+        self._dirty: Set[int] = set()
+        self._refresh_lock = asyncio.Lock()
+
+    def mark(self, post_id: int) -> None:
+        """참여도가 바뀐 게시글 기록"""
+        self._dirty.add(post_id)
+
+    def mark_many(self, post_ids) -> None:
+        self._dirty.update(post_ids)
+
+    async def refresh(self) -> int:
+        """
+        기록된 게시글의 인기 점수를 재계산합니다
+
+        Returns:
+            갱신된 게시글 수
+        """
+        async with self._refresh_lock:
+            if not self._dirty:
+                return 0
+            batch, self._dirty = self._dirty, set()
+
+            try:
+                async with AsyncSessionLocal() as session:
+                    updated = await PostRepository(session).refresh_hot_scores(sorted(batch))
+                    await session.commit()
+            except BaseException:
+                # 실패(또는 취소)된 게시글은 다음 갱신에서 재시도
+                self._dirty.update(batch)
+                raise
+
+            return updated
+
+    async def run(self, interval_seconds: float) -> None:
+        """interval_seconds 간격으로 갱신 반복 (태스크 취소 시 종료)"""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error(f"❌ 인기 점수 갱신 실패: {str(e)}")
+
+
+_hot_score_refresher = None
+
+def get_hot_score_refresher() -> HotScoreRefresher:
+    """인기 점수 갱신기 인스턴스 반환"""
+    global _hot_score_refresher
+    if _hot_score_refresher is None:
+        _hot_score_refresher = HotScoreRefresher()
+    return _hot_score_refresher
+
+
+async def refresh_all_hot_scores() -> int:
+    """전체 게시글 인기 점수 재계산 (가중치 변경 시 수동 실행)"""
+    async with AsyncSessionLocal() as session:
+        updated = await PostRepository(session).refresh_hot_scores()
+        await session.commit()
+    logger.info(f"✅ 인기 점수 전체 재계산: {updated}건")
+    return updated
+
+
+if __name__ == "__main__":
+    asyncio.run(refresh_all_hot_scores())
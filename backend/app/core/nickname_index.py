@@ -0,0 +1,133 @@
+# app/core/nickname_index.py
+"""
+닉네임 사용 여부 블룸 필터 인덱스
+- 시작 시 전체 닉네임으로 구성하고, 가입/닉네임 변경 시 추가
+- 다른 프로세스의 신규 가입은 주기적 증분 동기화(ID 기준)로, 닉네임 변경은 전체 재구성으로 반영
+  (ID는 커밋 순서와 다를 수 있으므로 마지막 ID 이전 SYNC_ID_OVERLAP건을 다시 읽음,
+  그보다 오래 커밋이 늦어진 가입은 다음 전체 재구성에서 반영)
+- 준비 전이거나 "있을 수도 있음"이면 DB(유니크 인덱스)로 확인하므로 결과의 정확성은 DB가 보장
+"""
+import asyncio
+import logging
+import time
+from typing import Optional
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.repositories.user_repository import UserRepository
+from app.utils.bloom_filter import BloomFilter
+
+logger = logging.getLogger(__name__)
+
+# 증분 동기화 시 다시 읽는 ID 범위 (먼저 ID를 받고 늦게 커밋된 가입 반영용)
+SYNC_ID_OVERLAP = 1000
+
+
+class NicknameIndex:
+    """프로세스 내 닉네임 블룸 필터"""
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._filter: Optional[BloomFilter] = None
+        self._max_user_id = 0
+        self._rebuild_lock = asyncio.Lock()
+
+    @property
+    def ready(self) -> bool:
+        return self._filter is not None
+
+    def might_exist(self, nickname: str) -> bool:
+        """False면 사용 중이 아님이 확실, True면 DB 확인 필요"""
+        if self._filter is None:
+            return True
+        return self._filter.might_contain(nickname)
+
+    def add(self, nickname: str) -> None:
+        if self._filter is None:
+            return
+        self._filter.add(nickname)
+        if self._filter.count > self._filter.capacity:
+            # 용량 초과 시 오탐률이 올라가므로 다음 재구성에서 크기를 늘림
+            self.capacity = self._filter.count * 2
+
+    async def rebuild(self) -> int:
+        """
+        전체 닉네임으로 필터를 다시 구성합니다
+
+        Returns:
+            추가된 닉네임 수
+        """
+        async with self._rebuild_lock:
+            started = time.monotonic()
+            async with AsyncSessionLocal() as session:
+                user_repo = UserRepository(session)
+                capacity = max(self.capacity, await user_repo.count() * 2)
+                bloom = BloomFilter(capacity, self.error_rate)
+                max_user_id = 0
+                async for user_id, nickname in user_repo.stream_nicknames():
+                    bloom.add(nickname)
+                    max_user_id = max(max_user_id, user_id)
+
+            self.capacity = capacity
+            self._filter = bloom
+            self._max_user_id = max_user_id
+            logger.info(
+                f"✅ 닉네임 인덱스 구성: {bloom.count}건 "
+                f"({bloom.size_bytes // 1024} KiB, {time.monotonic() - started:.2f}s)"
+            )
+            return bloom.count
+
+    async def sync(self) -> int:
+        """마지막 동기화 이후 가입한 사용자의 닉네임 추가 (겹치는 범위 포함, 이미 있는 닉네임은 건너뜀)"""
+        if self._filter is None:
+            return await self.rebuild()
+
+        async with self._rebuild_lock:
+            added = 0
+            after_id = max(0, self._max_user_id - SYNC_ID_OVERLAP)
+            async with AsyncSessionLocal() as session:
+                async for user_id, nickname in UserRepository(session).stream_nicknames(after_id):
+                    self._max_user_id = max(self._max_user_id, user_id)
+                    if self.might_exist(nickname):
+                        continue
+                    self.add(nickname)
+                    added += 1
+            return added
+
+    async def run(self, sync_interval_seconds: float, rebuild_interval_seconds: float) -> None:
+        """증분 동기화와 전체 재구성을 주기적으로 반복 (태스크 취소 시 종료)"""
+        last_rebuild = 0.0
+        while True:
+            try:
+                if time.monotonic() - last_rebuild >= rebuild_interval_seconds:
+                    await self.rebuild()
+                    last_rebuild = time.monotonic()
+                else:
+                    await self.sync()
+            except Exception as e:
+                logger.error(f"❌ 닉네임 인덱스 갱신 실패: {str(e)}")
+            await asyncio.sleep(sync_interval_seconds)
+
+    def stats(self) -> dict:
+        if self._filter is None:
+            return {"ready": False}
+        return {
+            "ready": True,
+            "nicknames": self._filter.count,
+            "capacity": self._filter.capacity,
+            "bytes": self._filter.size_bytes,
+        }
+
+
+_nickname_index = None
+
+def get_nickname_index() -> NicknameIndex:
+    """닉네임 인덱스 인스턴스 반환"""
+    global _nickname_index
+    if _nickname_index is None:
+        _nickname_index = NicknameIndex(
+            capacity=settings.NICKNAME_INDEX_CAPACITY,
+            error_rate=settings.NICKNAME_INDEX_ERROR_RATE,
+        )
+    return _nickname_index
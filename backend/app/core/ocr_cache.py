@@ -0,0 +1,160 @@
+# app/core/ocr_cache.py
+"""
+OCR 분석 결과 디스크 캐시 (내용 주소 기반)
+- 키: SHA-256(이미지 바이트) + source_lang + target_lang (+ 프롬프트 버전)
+- 항목마다 JSON 파일 하나 ({dir}/{키 앞 2자}/{키}.json), 파일 수정 시각을 최근 사용 시각으로 사용
+- 전체 크기가 max_bytes를 넘으면 가장 오래 사용되지 않은 항목부터 제거 (LRU), ttl 지난 항목은 미스 처리 후 제거
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 프롬프트/응답 형식이 바뀌면 올려서 기존 캐시를 무효화
+OCR_CACHE_VERSION = "2"
+
+
+def make_ocr_cache_key(image_data: bytes, source_lang: str, target_lang: str) -> str:
+    digest = hashlib.sha256(image_data).hexdigest()
+    return hashlib.sha256(f"{OCR_CACHE_VERSION}:{digest}:{source_lang}:{target_lang}".encode()).hexdigest()
+
+
+class OCRResultCache:
+    """크기 제한 LRU + TTL 디스크 캐시 (인덱스는 프로세스 메모리에 보관)"""
+
+    def __init__(self, directory: str, max_bytes: int, ttl_seconds: float):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        # 키 -> 파일 크기, 최근 사용 순
+        self._index: "OrderedDict[str, int]" = OrderedDict()
+        self._total_bytes = 0
+        self._loaded = False
+        self._lock = asyncio.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _load_index(self) -> None:
+        """디스크의 기존 항목을 최근 사용 순으로 인덱스에 적재"""
+        entries = []
+        for path in self.directory.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, path.stem, stat.st_size))
+
+        for _, key, size in sorted(entries):
+            self._index[key] = size
+            self._total_bytes += size
+        self._loaded = True
+
+    def _remove(self, key: str) -> None:
+        size = self._index.pop(key, None)
+        if size is not None:
+            self._total_bytes -= size
+        try:
+            self._path(key).unlink()
+        except FileNotFoundError:
+            pass
+
+    def _read(self, key: str) -> Optional[Dict[str, Any]]:
+        if not self._loaded:
+            self._load_index()
+        if key not in self._index:
+            return None
+
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            self._remove(key)
+            return None
+
+        if time.time() - entry.get("created_at", 0) > self.ttl_seconds:
+            self._remove(key)
+            return None
+
+        # 최근 사용 시각 갱신 (재시작 후에도 LRU 순서 유지)
+        os.utime(path)
+        self._index.move_to_end(key)
+        return entry["result"]
+
+    def _write(self, key: str, result: Dict[str, Any]) -> None:
+        if not self._loaded:
+            self._load_index()
+
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = json.dumps({"created_at": time.time(), "result": result}, ensure_ascii=False).encode("utf-8")
+        temp_path = path.with_suffix(".tmp")
+        temp_path.write_bytes(data)
+        os.replace(temp_path, path)
+
+        self._total_bytes -= self._index.pop(key, 0)
+        self._index[key] = len(data)
+        self._total_bytes += len(data)
+
+        while self._total_bytes > self.max_bytes and len(self._index) > 1:
+            oldest_key = next(iter(self._index))
+            self._remove(oldest_key)
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """캐시 조회 (디스크 오류는 미스로 처리)"""
+        try:
+            async with self._lock:
+                result = await asyncio.to_thread(self._read, key)
+        except OSError as e:
+            logger.warning(f"⚠️ OCR 캐시 조회 실패: {str(e)}")
+            result = None
+        if result is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return result
+
+    async def set(self, key: str, result: Dict[str, Any]) -> None:
+        try:
+            async with self._lock:
+                await asyncio.to_thread(self._write, key, result)
+        except OSError as e:
+            logger.warning(f"⚠️ OCR 캐시 저장 실패: {str(e)}")
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._index),
+            "bytes": self._total_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+_ocr_cache = None
+
+def get_ocr_cache() -> Optional[OCRResultCache]:
+    """OCR 결과 캐시 인스턴스 반환 (비활성화 시 None)"""
+    global _ocr_cache
+    if not settings.OCR_CACHE_ENABLED:
+        return None
+    if _ocr_cache is None:
+        _ocr_cache = OCRResultCache(
+            directory=settings.OCR_CACHE_DIR,
+            max_bytes=settings.OCR_CACHE_MAX_BYTES,
+            ttl_seconds=settings.OCR_CACHE_TTL_SECONDS,
+        )
+    return _ocr_cache
@@ -0,0 +1,170 @@
+# app/core/ocr_job_queue.py
+"""
+비동기 OCR 작업 큐
+- 요청 핸들러는 작업을 등록하고 바로 작업 ID를 반환, 분석은 고정 개수의 워커가 실행
+- 워커 수만큼 동시에 분석 (GPT-4o 동시 호출 상한은 동기 경로와 공유, GPTVisionService 참고)
+- 대기 작업 수나 보관 중인 이미지 총 바이트(대기 + 실행 중)가 상한을 넘으면 OCRJobQueueFullError
+- 끝난 작업 결과는 retention_seconds 동안만 보관 (프로세스 메모리)
+"""
+import asyncio
+import logging
+import secrets
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from app.core.config import settings
+from app.services.gpt_vision_service import get_gpt_vision_service
+
+logger = logging.getLogger(__name__)
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+
+
+class OCRJobQueueFullError(Exception):
+    """대기 중인 작업 수 초과"""
+
+
+@dataclass
+class OCRJob:
+    id: str
+    source_lang: str
+    target_lang: str
+    image_data: Optional[bytes]  # 실행 후 메모리 해제
+    status: str = JOB_QUEUED
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+
+class OCRJobQueue:
+    """고정 워커 수로 analyze_document를 실행하는 작업 큐"""
+
+    def __init__(self, max_workers: int, max_pending: int, max_pending_bytes: int, retention_seconds: float):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.max_pending_bytes = max_pending_bytes
+        self.retention_seconds = retention_seconds
+        # 아직 해제되지 않은 업로드 이미지 총 바이트 (대기 + 실행 중)
+        self.pending_bytes = 0
+        self._queue: "asyncio.Queue[str]" = asyncio.Queue(maxsize=max_pending)
+        # 작업 ID -> 작업, 등록 순
+        self._jobs: "OrderedDict[str, OCRJob]" = OrderedDict()
+        self.running = 0
+        self.succeeded = 0
+        self.failed = 0
+
+    def submit(self, image_data: bytes, source_lang: str, target_lang: str) -> OCRJob:
+        """작업 등록 (대기열이나 이미지 바이트 상한이 가득 차면 OCRJobQueueFullError)"""
+        # 비어 있으면 상한보다 큰 이미지 하나는 받음 (업로드 크기는 MAX_IMAGE_BYTES로 따로 제한)
+        if self.pending_bytes and self.pending_bytes + len(image_data) > self.max_pending_bytes:
+            raise OCRJobQueueFullError("OCR job queue byte budget is exhausted")
+        job = OCRJob(
+            id=secrets.token_urlsafe(16),
+            source_lang=source_lang,
+            target_lang=target_lang,
+            image_data=image_data,
+        )
+        try:
+            self._queue.put_nowait(job.id)
+        except asyncio.QueueFull as e:
+            raise OCRJobQueueFullError("OCR job queue is full") from e
+        self._jobs[job.id] = job
+        self.pending_bytes += len(image_data)
+        return job
+
+    def get(self, job_id: str) -> Optional[OCRJob]:
+        self._expire(time.time())
+        return self._jobs.get(job_id)
+
+    def _expire(self, now: float) -> None:
+        """보관 기간이 지난 완료 작업 제거"""
+        expired = [
+            job_id
+            for job_id, job in self._jobs.items()
+            if job.finished_at is not None and now - job.finished_at > self.retention_seconds
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    async def _execute(self, job: OCRJob) -> None:
+        job.status = JOB_RUNNING
+        job.started_at = time.time()
+        self.running += 1
+        try:
+            # 실패를 테스트용 Mock 결과로 감추지 않고 failed로 기록
+            job.result = await get_gpt_vision_service().analyze_document(
+                job.image_data,
+                job.source_lang,
+                job.target_lang,
+                fallback_to_mock=False,
+            )
+            job.status = JOB_SUCCEEDED
+            self.succeeded += 1
+        except Exception as e:
+            logger.error(f"❌ OCR 작업 실패 ({job.id}): {str(e)}")
+            job.error = "문서 분석 실패"
+            job.status = JOB_FAILED
+            self.failed += 1
+        finally:
+            self.running -= 1
+            self.pending_bytes -= len(job.image_data)
+            job.image_data = None
+            job.finished_at = time.time()
+
+    async def _worker(self) -> None:
+        while True:
+            job_id = await self._queue.get()
+            try:
+                job = self._jobs.get(job_id)
+                if job is not None:
+                    await self._execute(job)
+            finally:
+                self._queue.task_done()
+
+    async def run(self, expire_interval_seconds: float) -> None:
+        """워커 실행 및 만료 작업 정리 반복 (태스크 취소 시 워커도 종료)"""
+        workers: List[asyncio.Task] = [
+            asyncio.create_task(self._worker()) for _ in range(self.max_workers)
+        ]
+        try:
+            while True:
+                await asyncio.sleep(expire_interval_seconds)
+                self._expire(time.time())
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": self.max_workers,
+            "queued": self._queue.qsize(),
+            "pending_bytes": self.pending_bytes,
+            "running": self.running,
+            "retained": len(self._jobs),
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+        }
+
+
+_ocr_job_queue: Optional[OCRJobQueue] = None
+
+
+def get_ocr_job_queue() -> OCRJobQueue:
+    """OCR 작업 큐 인스턴스 반환"""
+    global _ocr_job_queue
+    if _ocr_job_queue is None:
+        _ocr_job_queue = OCRJobQueue(
+            max_workers=settings.OCR_JOB_MAX_WORKERS,
+            max_pending=settings.OCR_JOB_MAX_PENDING,
+            max_pending_bytes=settings.OCR_JOB_MAX_PENDING_BYTES,
+            retention_seconds=settings.OCR_JOB_RETENTION_SECONDS,
+        )
+    return _ocr_job_queue
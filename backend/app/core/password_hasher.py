@@ -0,0 +1,87 @@
+# app/core/password_hasher.py
+"""
+비밀번호 해싱 작업 풀
+- PBKDF2는 CPU를 오래 사용하므로 이벤트 루프가 아닌 전용 스레드 풀에서 실행
+  (hashlib.pbkdf2_hmac은 계산 중 GIL을 해제하므로 스레드로 병렬 처리됨)
+- 동시 실행 수를 워커 수로 제한하고, 대기 시간이 길어지면 PasswordHasherBusyError
+"""
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+
+from app.core.config import settings
+from app.utils.password import hash_password, verify_password
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class PasswordHasherBusyError(Exception):
+    """해싱 대기 시간 초과 (동시 요청 과다)"""
+
+
+class PasswordHasher:
+    """전용 스레드 풀에서 비밀번호 해싱/검증을 실행"""
+
+    def __init__(self, max_workers: int, queue_timeout_seconds: float):
+        self.max_workers = max_workers
+        self.queue_timeout_seconds = queue_timeout_seconds
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="password-hasher")
+        # 실행 중인 작업 수를 워커 수로 제한 (풀 내부 큐에는 쌓이지 않도록)
+        self._slots = asyncio.Semaphore(max_workers)
+
+    async def _run(self, func: Callable[..., T], *args) -> T:
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout=self.queue_timeout_seconds)
+        except asyncio.TimeoutError as e:
+            logger.warning("⚠️ 비밀번호 해싱 대기 시간 초과")
+            raise PasswordHasherBusyError("Password hashing is busy") from e
+
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
+        finally:
+            self._slots.release()
+
+    async def hash(self, password: str) -> str:
+        return await self._run(hash_password, password)
+
+    async def verify(self, password: str, password_hash: str) -> bool:
+        return await self._run(verify_password, password, password_hash)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_password_hasher: Optional[PasswordHasher] = None
+
+
+def get_password_hasher() -> PasswordHasher:
+    """비밀번호 해싱 풀 인스턴스 반환"""
+    global _password_hasher
+    if _password_hasher is None:
+        _password_hasher = PasswordHasher(
+            max_workers=settings.PASSWORD_HASH_MAX_WORKERS,
+            queue_timeout_seconds=settings.PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS,
+        )
+    return _password_hasher
+
+
+def shutdown_password_hasher() -> None:
+    """해싱 풀 종료 (생성된 경우에만)"""
+    global _password_hasher
+    if _password_hasher is not None:
+        _password_hasher.shutdown()
+        _password_hasher = None
+
+
+async def hash_password_async(password: str) -> str:
+    """비밀번호 해싱 (이벤트 루프 차단 없음)"""
+    return await get_password_hasher().hash(password)
+
+
+async def verify_password_async(password: str, password_hash: str) -> bool:
+    """비밀번호 검증 (이벤트 루프 차단 없음)"""
+    return await get_password_hasher().verify(password, password_hash)
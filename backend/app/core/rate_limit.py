@@ -0,0 +1,208 @@
+# app/core/rate_limit.py
+"""
+프로세스 내 토큰 버킷 요청 제한
+- 비용이 큰 엔드포인트(PBKDF2, GPT 호출, 글 작성)에 경로별 정책 적용
+- 키: 검증된 세션의 사용자 ID(인증이 필요한 경로만) 또는 클라이언트 IP
+- 키마다 (남은 토큰, 마지막 갱신 시각)만 보관하고, 버킷이 가득 찰 만큼 쉰 키는 제거
+- 키 수가 상한에 도달하면 사용 중인 버킷은 밀어내지 않고, 새 키는 정책별 공용 버킷을 함께 사용
+"""
+import json
+import math
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from app.core.cache import get_session_cache
+from app.core.config import settings
+from app.utils.password import hash_session_token
+from app.utils.signed_token import decode_signed_token, is_signed_token
+
+
+@dataclass(frozen=True)
+class RateLimitPolicy:
+    name: str
+    method: str
+    path_pattern: str
+    capacity: int  # 최대 연속 요청 수
+    refill_per_second: float
+    key_by_session: bool = True  # get_current_user가 필요한 경로만 True (그 외는 항상 IP 기준)
+    bucket: Optional[str] = None  # 같은 값이면 버킷 공유 (용량/충전 속도도 같아야 함)
+
+    @property
+    def bucket_name(self) -> str:
+        return self.bucket or self.name
+
+    @property
+    def full_refill_seconds(self) -> float:
+        return self.capacity / self.refill_per_second
+
+
+API_PREFIX = "/api/v1"
+
+# 키 수 상한 도달 후 새로 들어온 키들이 함께 쓰는 버킷 키
+OVERFLOW_KEY = "overflow"
+
+RATE_LIMIT_POLICIES: List[RateLimitPolicy] = [
+    RateLimitPolicy("auth_login", "POST", rf"{API_PREFIX}/auth/login", 5, 5 / 60, key_by_session=False),
+    RateLimitPolicy("auth_register", "POST", rf"{API_PREFIX}/auth/register", 3, 3 / 600, key_by_session=False),
+    RateLimitPolicy("auth_anonymous", "POST", rf"{API_PREFIX}/auth/anonymous", 5, 5 / 60, key_by_session=False),
+    # GPT-4o 호출 경로는 한 버킷을 공유 (경로를 바꿔 가며 한도를 늘릴 수 없도록)
+    RateLimitPolicy("ocr", "POST", rf"{API_PREFIX}/ocr/analyze", 3, 20 / 3600, key_by_session=False, bucket="ocr"),
+    RateLimitPolicy("ocr_stream", "POST", rf"{API_PREFIX}/ocr/analyze/stream", 3, 20 / 3600, key_by_session=False, bucket="ocr"),
+    RateLimitPolicy("ocr_job", "POST", rf"{API_PREFIX}/ocr/jobs", 3, 20 / 3600, key_by_session=False, bucket="ocr"),
+    RateLimitPolicy("post_create", "POST", rf"{API_PREFIX}/posts", 5, 10 / 60),
+    RateLimitPolicy("comment_create", "POST", rf"{API_PREFIX}/posts/\d+/comments", 10, 20 / 60),
+]
+
+
+class TokenBucketLimiter:
+    """정책별 토큰 버킷 (키 단위)"""
+
+    def __init__(self, policies: List[RateLimitPolicy], max_keys: int):
+        self.policies = policies
+        self.max_keys = max_keys
+        self._policies_by_bucket = {policy.bucket_name: policy for policy in policies}
+        self._patterns = [
+            (re.compile(policy.path_pattern + r"/?"), policy) for policy in policies
+        ]
+        # (버킷 이름, 키) -> [남은 토큰, 마지막 갱신 시각], 최근 사용 순
+        self._buckets: "OrderedDict[Tuple[str, str], List[float]]" = OrderedDict()
+        self.allowed: Dict[str, int] = {policy.name: 0 for policy in policies}
+        self.rejected: Dict[str, int] = {policy.name: 0 for policy in policies}
+        self.overflowed = 0
+
+    def match(self, method: str, path: str) -> Optional[RateLimitPolicy]:
+        for pattern, policy in self._patterns:
+            if policy.method == method and pattern.fullmatch(path):
+                return policy
+        return None
+
+    def _evict_idle(self, now: float) -> None:
+        # 가장 오래 사용되지 않은 키부터 확인 (버킷이 다시 가득 찼으면 새 버킷과 동일하므로 제거해도 무방)
+        while self._buckets:
+            (bucket_name, _), bucket = next(iter(self._buckets.items()))
+            policy = self._policies_by_bucket[bucket_name]
+            if now - bucket[1] < policy.full_refill_seconds:
+                break
+            self._buckets.popitem(last=False)
+
+    def acquire(self, policy: RateLimitPolicy, key: str) -> float:
+        """
+        토큰 1개 사용 시도
+
+        Returns:
+            0이면 허용, 아니면 재시도까지 기다려야 하는 초
+        """
+        now = time.monotonic()
+        self._evict_idle(now)
+
+        bucket_key = (policy.bucket_name, key)
+        bucket = self._buckets.get(bucket_key)
+        if bucket is None and len(self._buckets) >= self.max_keys:
+            # 사용 중인 버킷(부분 소진 포함)은 유지하고, 새 키는 공용 버킷으로 제한
+            bucket_key = (policy.bucket_name, OVERFLOW_KEY)
+            bucket = self._buckets.get(bucket_key)
+            self.overflowed += 1
+        if bucket is None:
+            bucket = [float(policy.capacity), now]
+            self._buckets[bucket_key] = bucket
+        else:
+            bucket[0] = min(policy.capacity, bucket[0] + (now - bucket[1]) * policy.refill_per_second)
+            bucket[1] = now
+            self._buckets.move_to_end(bucket_key)
+
+        if bucket[0] >= 1:
+            bucket[0] -= 1
+            self.allowed[policy.name] += 1
+            return 0.0
+
+        self.rejected[policy.name] += 1
+        return (1 - bucket[0]) / policy.refill_per_second
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "keys": len(self._buckets),
+            "allowed": dict(self.allowed),
+            "rejected": dict(self.rejected),
+            "overflowed": self.overflowed,
+        }
+
+
+_rate_limiter = None
+
+def get_rate_limiter() -> TokenBucketLimiter:
+    """요청 제한기 인스턴스 반환"""
+    global _rate_limiter
+    if _rate_limiter is None:
+        _rate_limiter = TokenBucketLimiter(RATE_LIMIT_POLICIES, settings.RATE_LIMIT_MAX_KEYS)
+    return _rate_limiter
+
+
+class RateLimitMiddleware:
+    """정책에 해당하는 요청만 토큰 버킷으로 제한하는 ASGI 미들웨어 (초과 시 429 + Retry-After)"""
+
+    def __init__(self, app):
+        self.app = app
+
+    @staticmethod
+    def _session_key(session_token: str) -> Optional[str]:
+        """
+        검증된 세션이면 사용자 기준 키 반환
+        - 검증 전 헤더 값은 클라이언트가 마음대로 바꿀 수 있어 키로 쓰지 않음
+        - 불투명 토큰은 세션 캐시에 있는(최근 검증된) 것만, 서명 토큰은 서명 확인 후 사용
+        """
+        if settings.SESSION_TOKEN_MODE == "signed" and is_signed_token(session_token):
+            try:
+                payload = decode_signed_token(session_token, settings.JWT_SECRET_KEY, settings.JWT_ALGORITHM)
+                return f"user:{int(payload['sub'])}"
+            except (ValueError, KeyError, TypeError):
+                return None
+        user_id = get_session_cache().get(hash_session_token(session_token))
+        return None if user_id is None else f"user:{user_id}"
+
+    @classmethod
+    def _client_key(cls, scope, policy: RateLimitPolicy) -> str:
+        headers = dict(scope.get("headers") or [])
+        if policy.key_by_session:
+            session_token = headers.get(b"x-session-token")
+            if session_token:
+                session_key = cls._session_key(session_token.decode("latin-1"))
+                if session_key:
+                    return session_key
+        if settings.RATE_LIMIT_TRUST_FORWARDED_FOR:
+            forwarded_for = headers.get(b"x-forwarded-for")
+            if forwarded_for:
+                # 가장 오른쪽 값이 바로 앞 프록시가 본 주소 (앞쪽 값은 클라이언트가 조작 가능)
+                return "ip:" + forwarded_for.decode("latin-1").split(",")[-1].strip()
+        client = scope.get("client")
+        return "ip:" + (client[0] if client else "unknown")
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not settings.RATE_LIMIT_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        limiter = get_rate_limiter()
+        policy = limiter.match(scope["method"], scope["path"])
+        if policy is None:
+            await self.app(scope, receive, send)
+            return
+
+        retry_after = limiter.acquire(policy, self._client_key(scope, policy))
+        if retry_after <= 0:
+            await self.app(scope, receive, send)
+            return
+
+        body = json.dumps({"detail": "Too many requests"}).encode()
+        await send({
+            "type": "http.response.start",
+            "status": 429,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(math.ceil(retry_after)).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
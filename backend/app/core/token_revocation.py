@@ -0,0 +1,99 @@
+# app/core/token_revocation.py
+"""
+서명된 세션 토큰 폐기 목록
+- 사용자별 토큰 버전(users.token_version)을 메모리에 보관하고, 토큰의 ver가 이보다 작으면 폐기된 것으로 처리
+- 버전이 올라간 적 있는 사용자만, 토큰 최대 수명 동안만 보관
+  (그보다 오래전에 폐기된 버전의 토큰은 이미 만료되었으므로 항목이 필요 없음)
+- 다른 프로세스에서 폐기한 토큰은 주기적 동기화로 반영 (최대 sync 간격만큼 지연)
+"""
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional, Tuple
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.repositories.user_repository import UserRepository
+
+logger = logging.getLogger(__name__)
+
+# 동기화 시점에 아직 커밋되지 않은 변경을 놓치지 않도록 겹쳐서 조회
+SYNC_OVERLAP = timedelta(seconds=60)
+
+
+class TokenRevocationList:
+    """프로세스 내 사용자별 최소 유효 토큰 버전"""
+
+    def __init__(self, max_token_age_seconds: float):
+        self.max_token_age_seconds = max_token_age_seconds
+        # 사용자 ID -> (최소 유효 버전, 기록 시각), 기록 순
+        self._versions: "OrderedDict[int, Tuple[int, float]]" = OrderedDict()
+        self._synced_at: Optional[datetime] = None
+        self._sync_lock = asyncio.Lock()
+
+    def _prune(self, now: float) -> None:
+        """토큰 최대 수명보다 오래된 항목 제거"""
+        while self._versions:
+            _, (_, recorded_at) = next(iter(self._versions.items()))
+            if now - recorded_at <= self.max_token_age_seconds:
+                break
+            self._versions.popitem(last=False)
+
+    def is_revoked(self, user_id: int, version: int) -> bool:
+        entry = self._versions.get(user_id)
+        return entry is not None and version < entry[0]
+
+    def set_version(self, user_id: int, version: int) -> None:
+        """사용자의 최소 유효 버전 갱신 (낮아지지 않음)"""
+        now = time.monotonic()
+        entry = self._versions.get(user_id)
+        if entry is None or version > entry[0]:
+            self._versions[user_id] = (version, now)
+            self._versions.move_to_end(user_id)
+        self._prune(now)
+
+    async def sync(self) -> int:
+        """
+        마지막 동기화 이후 변경된 토큰 버전을 DB에서 가져옵니다
+
+        Returns:
+            반영된 사용자 수
+        """
+        async with self._sync_lock:
+            since = self._synced_at
+            if since is None:
+                # 처음에는 아직 만료되지 않은 토큰이 있을 수 있는 기간만 조회
+                since = datetime.now(timezone.utc) - timedelta(seconds=self.max_token_age_seconds) - SYNC_OVERLAP
+            async with AsyncSessionLocal() as session:
+                versions, synced_at = await UserRepository(session).get_token_versions_since(since)
+            for user_id, version in versions:
+                self.set_version(user_id, version)
+            self._synced_at = synced_at - SYNC_OVERLAP
+            self._prune(time.monotonic())
+            return len(versions)
+
+    async def run(self, interval_seconds: float) -> None:
+        """interval_seconds 간격으로 동기화 반복 (태스크 취소 시 종료)"""
+        while True:
+            try:
+                await self.sync()
+            except Exception as e:
+                logger.error(f"❌ 토큰 폐기 목록 동기화 실패: {str(e)}")
+            await asyncio.sleep(interval_seconds)
+
+    def stats(self) -> Dict[str, int]:
+        return {"revoked_users": len(self._versions)}
+
+
+_token_revocation_list = None
+
+def get_token_revocation_list() -> TokenRevocationList:
+    """토큰 폐기 목록 인스턴스 반환"""
+    global _token_revocation_list
+    if _token_revocation_list is None:
+        _token_revocation_list = TokenRevocationList(
+            max_token_age_seconds=settings.SESSION_EXPIRE_HOURS * 3600,
+        )
+    return _token_revocation_list
@@ -0,0 +1,74 @@
+# app/core/view_count_buffer.py
+"""
+게시글 조회수 write-behind 버퍼
+- 조회 시 메모리에만 누적하고, 주기적으로 게시글별 증가분을 한 번에 반영
+"""
+import asyncio
+import logging
+from typing import Dict
+
+from app.core.database import AsyncSessionLocal
+from app.core.hot_score_refresher import get_hot_score_refresher
+from app.repositories.post_repository import PostRepository
+
+logger = logging.getLogger(__name__)
+
+
+class ViewCountBuffer:
+    """프로세스 내 조회수 누적기"""
+
+    def __init__(self):
+        self._pending: Dict[int, int] = {}
+        self._flush_lock = asyncio.Lock()
+
+    def add(self, post_id: int, increment: int = 1) -> None:
+        """조회수 증가분 누적"""
+        self._pending[post_id] = self._pending.get(post_id, 0) + increment
+
+    def pending(self, post_id: int) -> int:
+        """아직 DB에 반영되지 않은 증가분"""
+        return self._pending.get(post_id, 0)
+
+    async def flush(self) -> int:
+        """
+        누적된 증가분을 DB에 반영합니다
+
+        Returns:
+            반영된 게시글 수
+        """
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+            batch, self._pending = self._pending, {}
+
+            try:
+                async with AsyncSessionLocal() as session:
+                    await PostRepository(session).add_view_counts(batch)
+                    await session.commit()
+            except BaseException:
+                # 실패(또는 취소)된 증가분은 다음 flush에서 재시도
+                for post_id, increment in batch.items():
+                    self.add(post_id, increment)
+                raise
+
+            get_hot_score_refresher().mark_many(batch)
+            return len(batch)
+
+    async def run(self, interval_seconds: float) -> None:
+        """interval_seconds 간격으로 flush 반복 (태스크 취소 시 종료)"""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"❌ 조회수 반영 실패: {str(e)}")
+
+
+_view_count_buffer = None
+
+def get_view_count_buffer() -> ViewCountBuffer:
+    """조회수 버퍼 인스턴스 반환"""
+    global _view_count_buffer
+    if _view_count_buffer is None:
+        _view_count_buffer = ViewCountBuffer()
+    return _view_count_buffer
@@ -1,8 +1,10 @@
+import asyncio
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from pathlib import Path
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
+from app.core.rate_limit import RateLimitMiddleware
 from app.routers import ocr_router
 from app.routers import (
     health_router,
@@ -10,6 +12,7 @@ from app.routers import (
     category_router,
     post_router,
     comment_router,
+    admin_router,
 )
 import logging
 
@@ -20,6 +23,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 백그라운드 작업 (종료 시 취소)
+background_tasks: list[asyncio.Task] = []
+
 app = FastAPI(
     title="WeWorkHere API",
     description="외국인 노동자 익명 커뮤니티 플랫폼 API",
@@ -30,6 +36,9 @@ upload_dir = Path(settings.UPLOAD_DIR)
 upload_dir.mkdir(parents=True, exist_ok=True)
 app.mount(settings.UPLOAD_URL_PATH, StaticFiles(directory=upload_dir), name="uploads")
 
+# Rate limiting (CORS 안쪽에 두어 429 응답에도 CORS 헤더가 붙도록 먼저 등록)
+app.add_middleware(RateLimitMiddleware)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -37,6 +46,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "Last-Modified", "X-Next-Cursor", "Retry-After"],
 )
 
 # Include routers
@@ -46,6 +56,7 @@ app.include_router(category_router.router, prefix="/api/v1")
 app.include_router(post_router.router, prefix="/api/v1")
 app.include_router(comment_router.router, prefix="/api/v1")
 app.include_router(ocr_router.router, prefix="/api/v1")
+app.include_router(admin_router.router, prefix="/api/v1")
 
 # 👈 시작 이벤트 추가
 @app.on_event("startup")
@@ -60,7 +71,75 @@ async def startup_event():
     service = get_gpt_vision_service()
     logger.info("✅ GPT Vision 서비스 로드 완료")
 
+    # 게시글 수 카운터 보정 작업
+    if settings.POST_COUNT_RECONCILE_INTERVAL_SECONDS > 0:
+        from app.tasks.post_count_reconciler import run_post_count_reconciler
+        background_tasks.append(asyncio.create_task(
+            run_post_count_reconciler(settings.POST_COUNT_RECONCILE_INTERVAL_SECONDS)
+        ))
+
+    # 조회수 버퍼 flush 작업
+    from app.core.view_count_buffer import get_view_count_buffer
+    background_tasks.append(asyncio.create_task(
+        get_view_count_buffer().run(settings.VIEW_COUNT_FLUSH_INTERVAL_SECONDS)
+    ))
+
+    # 인기 점수 증분 갱신 작업
+    from app.core.hot_score_refresher import get_hot_score_refresher
+    background_tasks.append(asyncio.create_task(
+        get_hot_score_refresher().run(settings.HOT_SCORE_REFRESH_INTERVAL_SECONDS)
+    ))
+
+    # 닉네임 인덱스 구성 및 동기화 작업
+    from app.core.nickname_index import get_nickname_index
+    background_tasks.append(asyncio.create_task(
+        get_nickname_index().run(
+            settings.NICKNAME_INDEX_SYNC_INTERVAL_SECONDS,
+            settings.NICKNAME_INDEX_REBUILD_INTERVAL_SECONDS,
+        )
+    ))
+
+    # 만료 세션 정리 작업
+    if settings.SESSION_SWEEP_INTERVAL_SECONDS > 0:
+        from app.tasks.session_sweeper import run_session_sweeper
+        background_tasks.append(asyncio.create_task(
+            run_session_sweeper(settings.SESSION_SWEEP_INTERVAL_SECONDS, settings.SESSION_SWEEP_BATCH_SIZE)
+        ))
+
+    # OCR 작업 워커
+    from app.core.ocr_job_queue import get_ocr_job_queue
+    background_tasks.append(asyncio.create_task(
+        get_ocr_job_queue().run(settings.OCR_JOB_RETENTION_SECONDS / 10)
+    ))
+
+    # 서명 토큰 폐기 목록 동기화 작업
+    if settings.SESSION_TOKEN_MODE == "signed":
+        from app.core.token_revocation import get_token_revocation_list
+        background_tasks.append(asyncio.create_task(
+            get_token_revocation_list().run(settings.TOKEN_REVOCATION_SYNC_INTERVAL_SECONDS)
+        ))
+
 @app.on_event("shutdown")
 async def shutdown_event():
     """서버 종료 시 실행"""
+    for task in background_tasks:
+        task.cancel()
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+    background_tasks.clear()
+
+    # 남은 조회수 및 인기 점수 반영
+    from app.core.view_count_buffer import get_view_count_buffer
+    from app.core.hot_score_refresher import get_hot_score_refresher
+    try:
+        await get_view_count_buffer().flush()
+        await get_hot_score_refresher().refresh()
+    except Exception as e:
+        logger.error(f"❌ 종료 시 조회수/인기 점수 반영 실패: {str(e)}")
+
+    from app.core.password_hasher import shutdown_password_hasher
+    shutdown_password_hasher()
+
+    from app.core.image_preprocessor import shutdown_image_preprocessor
+    shutdown_image_preprocessor()
+
     logger.info("👋 WeWorkHere API 서버 종료")
\ No newline at end of file
@@ -4,6 +4,8 @@ from app.models.post import Post
 from app.models.post_image import PostImage
 from app.models.comment import Comment
 from app.models.reaction import Reaction
+from app.models.category_post_count import CategoryPostCount
+from app.models.user_session import UserSession
 
 __all__ = [
     "User",
@@ -12,4 +14,6 @@ __all__ = [
     "PostImage",
     "Comment",
     "Reaction",
+    "CategoryPostCount",
+    "UserSession",
 ]
@@ -0,0 +1,15 @@
+from sqlalchemy import Column, Integer, DateTime
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+# category_id가 NULL인 게시글(미분류)의 카운터 키
+UNCATEGORIZED_COUNT_KEY = 0
+
+
+class CategoryPostCount(Base):
+    __tablename__ = "category_post_counts"
+
+    # 카테고리 ID (미분류 게시글은 UNCATEGORIZED_COUNT_KEY)
+    category_id = Column(Integer, primary_key=True, autoincrement=False)
+    post_count = Column(Integer, nullable=False, default=0, server_default="0")
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Text, DateTime, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, Text, DateTime, ForeignKey, Boolean, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.core.database import Base
@@ -18,3 +18,8 @@ class Comment(Base):
     # Relationships
     post = relationship("Post", back_populates="comments")
     user = relationship("User", back_populates="comments")
+
+    # Composite index for keyset pagination of comment threads
+    __table_args__ = (
+        Index("ix_comments_post_created_id", post_id, created_at, id),
+    )
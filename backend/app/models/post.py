@@ -1,6 +1,6 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean, Index, Float, literal_column
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, column_property
 from app.core.database import Base
 
 
@@ -16,9 +16,19 @@ class Post(Base):
     is_anonymous = Column(Boolean, nullable=False, default=False, server_default="false")
     view_count = Column(Integer, nullable=False, default=0, server_default="0")
     like_count = Column(Integer, nullable=False, default=0, server_default="0")
+    comment_count = Column(Integer, nullable=False, default=0, server_default="0")
+    hot_score = Column(Float, nullable=False, default=0, server_default="0")  # app/utils/hot_score.py
+    # 댓글 작성/수정/삭제 시각 (댓글 목록 ETag / Last-Modified)
+    comments_updated_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
+    # 검색 대상 문서 (제목 + 본문), 트라이그램 인덱스와 동일한 표현식
+    search_document = column_property(
+        title + literal_column("' '", Text) + content,
+        deferred=True,
+    )
+
     # Relationships
     user = relationship("User", back_populates="posts")
     category = relationship("Category", back_populates="posts")
@@ -31,6 +41,22 @@ class Post(Base):
         order_by="PostImage.sort_order",
     )
 
+    # Composite indexes for keyset (cursor) pagination of the feed
+    __table_args__ = (
+        Index("ix_posts_category_created_id", category_id, created_at.desc(), id.desc()),
+        Index("ix_posts_created_id", created_at.desc(), id.desc()),
+        # Composite indexes for the hot feed
+        Index("ix_posts_category_hot_id", category_id, hot_score.desc(), id.desc()),
+        Index("ix_posts_hot_id", hot_score.desc(), id.desc()),
+        # Trigram index for multilingual (ko/vi/ne/km/en) substring search
+        Index(
+            "ix_posts_search_trgm",
+            (title + literal_column("' '", Text) + content).label("search_document"),
+            postgresql_using="gin",
+            postgresql_ops={"search_document": "gin_trgm_ops"},
+        ),
+    )
+
     @property
     def image_urls(self) -> list[str]:
         urls = [image.url for image in self.images] if self.images else []
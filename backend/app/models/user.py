@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy import Column, Integer, String, DateTime, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.core.database import Base
@@ -10,9 +10,10 @@ class User(Base):
     id = Column(Integer, primary_key=True, index=True)
     nickname = Column(String(50), unique=True, nullable=False, index=True)
     password_hash = Column(String(255), nullable=False)
-    session_token = Column(String(255), unique=True, nullable=True, index=True)
+    session_token = Column(String(255), unique=True, nullable=True, index=True)  # 레거시 (sessions 테이블로 이전됨)
     session_created_at = Column(DateTime(timezone=True), nullable=True)
     preferred_language = Column(String(5), nullable=False, server_default="ko")
+    token_version = Column(Integer, nullable=False, default=0, server_default="0")  # 서명 토큰 폐기용
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
@@ -20,3 +21,13 @@ class User(Base):
     posts = relationship("Post", back_populates="user", cascade="all, delete-orphan")
     comments = relationship("Comment", back_populates="user", cascade="all, delete-orphan")
     reactions = relationship("Reaction", back_populates="user", cascade="all, delete-orphan")
+    sessions = relationship("UserSession", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+
+    # 토큰 폐기 목록 동기화용 (버전이 올라간 사용자만)
+    __table_args__ = (
+        Index(
+            "ix_users_revoked_updated_at",
+            updated_at,
+            postgresql_where=token_version > 0,
+        ),
+    )
@@ -5,6 +5,8 @@ from app.repositories.post_repository import PostRepository
 from app.repositories.comment_repository import CommentRepository
 from app.repositories.post_image_repository import PostImageRepository
 from app.repositories.reaction_repository import ReactionRepository
+from app.repositories.category_post_count_repository import CategoryPostCountRepository
+from app.repositories.session_repository import SessionRepository
 
 __all__ = [
     "BaseRepository",
@@ -14,4 +16,6 @@ __all__ = [
     "CommentRepository",
     "PostImageRepository",
     "ReactionRepository",
+    "CategoryPostCountRepository",
+    "SessionRepository",
 ]
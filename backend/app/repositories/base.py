@@ -1,8 +1,8 @@
-from typing import Generic, TypeVar, Type, Optional, List
+from typing import Any, Callable, Generic, TypeVar, Type, Optional, List
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import Base
+from app.core.database import Base, run_after_commit
 
 ModelType = TypeVar("ModelType", bound=Base)
 
@@ -14,6 +14,10 @@ class BaseRepository(Generic[ModelType]):
         self.model = model
         self.db = db
 
+    def run_after_commit(self, callback: Callable[..., Any], *args: Any) -> None:
+        """현재 트랜잭션 커밋 후 callback(*args) 실행"""
+        run_after_commit(self.db, callback, *args)
+
     async def get_by_id(self, id: int) -> Optional[ModelType]:
         """ID로 단일 레코드 조회"""
         result = await self.db.execute(
@@ -0,0 +1,99 @@
+from typing import Dict, List, Optional
+from sqlalchemy import select, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.category_post_count import CategoryPostCount, UNCATEGORIZED_COUNT_KEY
+from app.models.post import Post
+from app.repositories.base import BaseRepository
+
+
+class CategoryPostCountRepository(BaseRepository[CategoryPostCount]):
+    def __init__(self, db: AsyncSession):
+        super().__init__(CategoryPostCount, db)
+
+    @staticmethod
+    def _key(category_id: Optional[int]) -> int:
+        return category_id if category_id is not None else UNCATEGORIZED_COUNT_KEY
+
+    async def adjust(self, category_id: Optional[int], delta: int) -> None:
+        """카테고리 게시글 수 증감 (현재 트랜잭션 내에서 반영)"""
+        if delta == 0:
+            return
+        stmt = insert(CategoryPostCount).values(
+            category_id=self._key(category_id),
+            post_count=max(delta, 0),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[CategoryPostCount.category_id],
+            set_={
+                "post_count": func.greatest(CategoryPostCount.post_count + delta, 0),
+                "updated_at": func.now(),
+            },
+        )
+        await self.db.execute(stmt)
+
+    async def get_count(self, category_id: Optional[int] = None) -> int:
+        """게시글 수 조회 (category_id가 없으면 전체)"""
+        query = select(func.coalesce(func.sum(CategoryPostCount.post_count), 0))
+        if category_id is not None:
+            query = query.where(CategoryPostCount.category_id == category_id)
+
+        result = await self.db.execute(query)
+        return int(result.scalar_one())
+
+    async def get_all_counts(self) -> List[CategoryPostCount]:
+        """전체 카테고리별 게시글 수 조회"""
+        result = await self.db.execute(
+            select(CategoryPostCount).order_by(CategoryPostCount.category_id)
+        )
+        return list(result.scalars().all())
+
+    async def reconcile(self) -> Dict[int, int]:
+        """
+        실제 게시글 수와 카운터를 비교해 보정합니다
+        - 게시글 수 집계와 카운터를 한 쿼리(같은 스냅샷)로 읽어 차이만 계산하므로 테이블을 잠그지 않음
+          (게시글 생성/삭제와 adjust는 같은 트랜잭션이라 한 스냅샷 안에서는 항상 함께 보이거나 함께 안 보임)
+        - 차이는 post_count + 차이로 반영하므로 집계 이후 커밋된 증감분이 사라지지 않음
+          (행 잠금은 보정할 카운터 행에만, 트랜잭션 종료 시 해제)
+
+        Returns:
+            보정된 카운터 {category_id: 집계 시점의 실제 게시글 수}
+        """
+        key = func.coalesce(Post.category_id, UNCATEGORIZED_COUNT_KEY)
+        actual = (
+            select(key.label("category_id"), func.count().label("post_count"))
+            .select_from(Post)
+            .group_by(key)
+            .subquery()
+        )
+        counts = CategoryPostCount.__table__
+        result = await self.db.execute(
+            select(
+                func.coalesce(actual.c.category_id, counts.c.category_id),
+                func.coalesce(actual.c.post_count, 0),
+                func.coalesce(counts.c.post_count, 0),
+            )
+            .select_from(
+                actual.join(counts, actual.c.category_id == counts.c.category_id, full=True)
+            )
+            .where(func.coalesce(actual.c.post_count, 0) != func.coalesce(counts.c.post_count, 0))
+        )
+        rows = result.all()
+        if not rows:
+            return {}
+
+        stmt = insert(CategoryPostCount).values([
+            {"category_id": category_id, "post_count": actual_count - stored_count}
+            for category_id, actual_count, stored_count in rows
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[CategoryPostCount.category_id],
+            set_={
+                "post_count": func.greatest(CategoryPostCount.post_count + stmt.excluded.post_count, 0),
+                "updated_at": func.now(),
+            },
+        )
+        await self.db.execute(stmt)
+        await self.db.flush()
+        return {category_id: actual_count for category_id, actual_count, _ in rows}
@@ -1,5 +1,6 @@
-from typing import List
-from sqlalchemy import select, desc
+from datetime import datetime
+from typing import Any, AsyncIterator, List, Mapping, Optional, Tuple
+from sqlalchemy import select, desc, tuple_, literal
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.comment import Comment
@@ -14,14 +15,62 @@ class CommentRepository(BaseRepository[Comment]):
         self,
         post_id: int,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        cursor: Optional[Tuple[datetime, int]] = None,
     ) -> List[Comment]:
-        """게시글별 댓글 조회 (최신순)"""
+        """게시글별 댓글 조회 (최신순, cursor 지정 시 키셋 페이지네이션)"""
+        query = select(Comment).where(Comment.post_id == post_id)
+        if cursor is not None:
+            cursor_created_at, cursor_id = cursor
+            query = query.where(
+                tuple_(Comment.created_at, Comment.id)
+                < tuple_(
+                    literal(cursor_created_at, Comment.created_at.type),
+                    literal(cursor_id, Comment.id.type),
+                )
+            )
+
         result = await self.db.execute(
-            select(Comment)
-            .where(Comment.post_id == post_id)
-            .order_by(desc(Comment.created_at))
+            query
+            .order_by(desc(Comment.created_at), desc(Comment.id))
             .offset(skip)
             .limit(limit)
         )
         return list(result.scalars().all())
+
+    async def stream_by_post_id(
+        self,
+        post_id: int,
+        batch_size: int = 500,
+    ) -> AsyncIterator[Mapping[str, Any]]:
+        """게시글별 전체 댓글 스트리밍 조회 (최신순, 서버 측 커서로 batch_size씩)"""
+        comments = Comment.__table__
+        result = await self.db.stream(
+            select(comments)
+            .where(comments.c.post_id == post_id)
+            .order_by(desc(comments.c.created_at), desc(comments.c.id))
+            .execution_options(yield_per=batch_size)
+        )
+        async for row in result.mappings():
+            yield row
+
+    async def stream_for_export(
+        self,
+        since: Optional[datetime] = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Mapping[str, Any]]:
+        """
+        내보내기용 전체 댓글 스트리밍 조회 (ID순, since 이후 수정분만)
+
+        - since는 updated_at 기준이므로 내용 수정만 반영 (좋아요 수 등 카운터 변경은 포함되지 않음)
+        """
+        comments = Comment.__table__
+        query = select(comments)
+        if since is not None:
+            query = query.where(comments.c.updated_at >= since)
+
+        result = await self.db.stream(
+            query.order_by(comments.c.id).execution_options(yield_per=batch_size)
+        )
+        async for row in result.mappings():
+            yield row
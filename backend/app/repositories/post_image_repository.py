@@ -4,6 +4,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.post_image import PostImage
 from app.repositories.base import BaseRepository
+from app.utils.sort_order import SORT_ORDER_GAP
 
 
 class PostImageRepository(BaseRepository[PostImage]):
@@ -31,7 +32,7 @@ class PostImageRepository(BaseRepository[PostImage]):
         start_order: int = 0,
     ) -> List[PostImage]:
         images = [
-            PostImage(post_id=post_id, url=url, sort_order=start_order + index)
+            PostImage(post_id=post_id, url=url, sort_order=start_order + index * SORT_ORDER_GAP)
             for index, url in enumerate(urls)
         ]
         self.db.add_all(images)
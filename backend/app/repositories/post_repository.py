@@ -1,43 +1,183 @@
-from typing import List, Optional
-from sqlalchemy import select, func, desc
-from sqlalchemy.orm import selectinload
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Mapping, Optional, Tuple, Union
+from sqlalchemy import Float, Text, select, func, desc, tuple_, update, bindparam, literal
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.orm import selectinload, joinedload
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.comment import Comment
 from app.models.post import Post
+from app.models.post_image import PostImage
 from app.repositories.base import BaseRepository
+from app.utils.hot_score import hot_score_expression
+
+# ILIKE '%q%'에서 트라이그램을 뽑으려면 최소 3자 필요 (그보다 짧으면 인덱스를 쓰지 못하고 전체 검사)
+SEARCH_SUBSTRING_MIN_LENGTH = 3
+
+
+@dataclass(slots=True)
+class PostFeedRow:
+    """목록 조회용 게시글 행 (ORM 객체 없이 필요한 컬럼만)"""
+    id: int
+    user_id: int
+    category_id: Optional[int]
+    title: str
+    content: str  # 본문 발췌
+    content_truncated: bool
+    image_url: Optional[str]
+    image_urls: List[str]
+    is_anonymous: bool
+    view_count: int
+    like_count: int
+    comment_count: int
+    hot_score: float
+    created_at: datetime
+    updated_at: datetime
 
 
 class PostRepository(BaseRepository[Post]):
     def __init__(self, db: AsyncSession):
         super().__init__(Post, db)
 
-    async def get_by_category(
+    async def get_feed_rows(
         self,
-        category_id: int,
         skip: int = 0,
-        limit: int = 20
-    ) -> List[Post]:
-        """카테고리별 게시글 조회 (최신순)"""
+        limit: int = 20,
+        category_id: Optional[int] = None,
+        sort: str = "recent",
+        cursor: Optional[Union[Tuple[datetime, int], Tuple[float, int]]] = None,
+        *,
+        excerpt_length: int,
+    ) -> List[PostFeedRow]:
+        """
+        게시글 목록 조회 (Core 단일 쿼리, 본문 발췌 + 이미지 URL 집계)
+        - sort: recent(created_at, id) 또는 hot(hot_score, id) 내림차순
+        - cursor: 정렬 키 기준 키셋 페이지네이션
+        - excerpt_length: 본문 발췌 길이 (settings.FEED_CONTENT_EXCERPT_LENGTH를 전달)
+        """
+        image_urls = (
+            select(func.array_agg(aggregate_order_by(PostImage.url, PostImage.sort_order)))
+            .where(PostImage.post_id == Post.id)
+            .scalar_subquery()
+        )
+        query = select(
+            Post.id,
+            Post.user_id,
+            Post.category_id,
+            Post.title,
+            func.left(Post.content, excerpt_length).label("content"),
+            (func.char_length(Post.content) > excerpt_length).label("content_truncated"),
+            Post.image_url,
+            image_urls.label("image_urls"),
+            Post.is_anonymous,
+            Post.view_count,
+            Post.like_count,
+            Post.comment_count,
+            Post.hot_score,
+            Post.created_at,
+            Post.updated_at,
+        )
+        if category_id is not None:
+            query = query.where(Post.category_id == category_id)
+
+        sort_key = (Post.hot_score, Post.id) if sort == "hot" else (Post.created_at, Post.id)
+        if cursor is not None:
+            query = query.where(
+                tuple_(*sort_key)
+                < tuple_(*(literal(value, column.type) for value, column in zip(cursor, sort_key)))
+            )
+
         result = await self.db.execute(
-            select(Post)
-            .options(selectinload(Post.images))
-            .where(Post.category_id == category_id)
-            .order_by(desc(Post.created_at))
+            query
+            .order_by(*(desc(column) for column in sort_key))
             .offset(skip)
             .limit(limit)
         )
-        return list(result.scalars().all())
 
-    async def get_all_ordered(self, skip: int = 0, limit: int = 20) -> List[Post]:
-        """모든 게시글 조회 (최신순)"""
-        result = await self.db.execute(
-            select(Post)
+        rows = []
+        for row in result.mappings():
+            values = dict(row)
+            if not values["image_urls"]:
+                values["image_urls"] = [values["image_url"]] if values["image_url"] else []
+            rows.append(PostFeedRow(**values))
+        return rows
+
+    async def refresh_hot_scores(self, post_ids: Optional[List[int]] = None) -> int:
+        """
+        인기 점수 재계산 (post_ids가 없으면 전체)
+
+        Returns:
+            갱신된 게시글 수
+        """
+        posts = Post.__table__
+        stmt = update(posts).values(
+            hot_score=hot_score_expression(
+                posts.c.like_count,
+                posts.c.view_count,
+                posts.c.comment_count,
+                posts.c.created_at,
+            ),
+            # 점수 갱신은 수정 시각(updated_at)을 바꾸지 않음
+            updated_at=posts.c.updated_at,
+        )
+        if post_ids is not None:
+            if not post_ids:
+                return 0
+            stmt = stmt.where(posts.c.id.in_(post_ids))
+
+        result = await self.db.execute(stmt)
+        return result.rowcount
+
+    async def search(
+        self,
+        query: str,
+        limit: int = 20,
+        category_id: Optional[int] = None,
+        cursor: Optional[Tuple[float, datetime, int]] = None,
+    ) -> List[Tuple[Post, float]]:
+        """
+        제목 + 본문 검색 (트라이그램 인덱스 사용, 유사도순)
+        - 3자 이상: 부분 문자열 검색 (ILIKE)
+        - 2자: 단어 앞부분 일치 검색 (word_similarity 연산자 <%, 인덱스 사용)
+          예: "비자"는 "비자를", "비자 연장"과 일치하지만 "학생비자"처럼 단어 중간은 찾지 못함
+
+        Returns:
+            [(게시글, 유사도)] 목록
+        """
+        rank = func.word_similarity(query, Post.search_document)
+
+        if len(query) >= SEARCH_SUBSTRING_MIN_LENGTH:
+            escaped = query.replace("/", "//").replace("%", "/%").replace("_", "/_")
+            condition = Post.search_document.ilike(f"%{escaped}%", escape="/")
+        else:
+            # <%와 ||는 우선순위가 같으므로 문서 표현식을 괄호로 묶음
+            condition = literal(query, Text).op("<%")(Post.search_document.self_group())
+
+        stmt = (
+            select(Post, rank.label("rank"))
             .options(selectinload(Post.images))
-            .order_by(desc(Post.created_at))
-            .offset(skip)
+            .where(condition)
+        )
+        if category_id is not None:
+            stmt = stmt.where(Post.category_id == category_id)
+        if cursor is not None:
+            cursor_rank, cursor_created_at, cursor_id = cursor
+            stmt = stmt.where(
+                tuple_(rank, Post.created_at, Post.id)
+                < tuple_(
+                    literal(cursor_rank, Float),
+                    literal(cursor_created_at, Post.created_at.type),
+                    literal(cursor_id, Post.id.type),
+                )
+            )
+
+        result = await self.db.execute(
+            stmt
+            .order_by(desc(rank), desc(Post.created_at), desc(Post.id))
             .limit(limit)
         )
-        return list(result.scalars().all())
+        return [(row[0], row[1]) for row in result.all()]
 
     async def get_by_id(self, id: int) -> Optional[Post]:
         result = await self.db.execute(
@@ -47,6 +187,22 @@ class PostRepository(BaseRepository[Post]):
         )
         return result.scalar_one_or_none()
 
+    async def exists(self, id: int) -> bool:
+        """게시글 존재 여부 (이미지 등은 로드하지 않음)"""
+        result = await self.db.execute(select(literal(True)).where(Post.id == id))
+        return result.scalar_one_or_none() is not None
+
+    async def get_by_ids(self, ids: List[int]) -> List[Post]:
+        """ID 목록으로 게시글 일괄 조회 (이미지 포함 단일 쿼리, 순서 보장 안 됨)"""
+        if not ids:
+            return []
+        result = await self.db.execute(
+            select(Post)
+            .options(joinedload(Post.images))
+            .where(Post.id.in_(ids))
+        )
+        return list(result.unique().scalars().all())
+
     async def count_by_category(self, category_id: Optional[int] = None) -> int:
         """카테고리별 게시글 수 조회"""
         query = select(func.count()).select_from(Post)
@@ -56,32 +212,122 @@ class PostRepository(BaseRepository[Post]):
         result = await self.db.execute(query)
         return result.scalar_one()
 
-    async def increment_view_count(self, post_id: int) -> Optional[int]:
-        """조회수 증가"""
-        post = await self.get_by_id(post_id)
-        if post:
-            post.view_count += 1
-            await self.db.flush()
-            await self.db.refresh(post)
-            return post.view_count
-        return None
-
-    async def increment_like_count(self, post_id: int) -> Optional[int]:
-        """좋아요 수 증가"""
-        post = await self.get_by_id(post_id)
-        if post:
-            post.like_count += 1
-            await self.db.flush()
-            await self.db.refresh(post)
-            return post.like_count
-        return None
-
-    async def decrement_like_count(self, post_id: int) -> Optional[int]:
-        """좋아요 수 감소"""
-        post = await self.get_by_id(post_id)
-        if post and post.like_count > 0:
-            post.like_count -= 1
-            await self.db.flush()
-            await self.db.refresh(post)
-            return post.like_count
-        return None
+    async def adjust_comment_count(self, post_id: int, delta: int) -> None:
+        """댓글 수 증감 및 댓글 변경 시각 갱신 (현재 트랜잭션 내에서 반영)"""
+        posts = Post.__table__
+        await self.db.execute(
+            update(posts)
+            .where(posts.c.id == post_id)
+            # 댓글 수 반영은 수정 시각(updated_at)을 바꾸지 않음
+            .values(
+                comment_count=func.greatest(posts.c.comment_count + delta, 0),
+                comments_updated_at=func.now(),
+                updated_at=posts.c.updated_at,
+            )
+        )
+
+    async def touch_comments(self, post_id: int) -> None:
+        """댓글 변경 시각만 갱신 (댓글 수정 시)"""
+        posts = Post.__table__
+        await self.db.execute(
+            update(posts)
+            .where(posts.c.id == post_id)
+            .values(comments_updated_at=func.now(), updated_at=posts.c.updated_at)
+        )
+
+    async def get_comments_version(self, post_id: int) -> Tuple[int, Optional[datetime]]:
+        """
+        게시글 댓글 목록의 버전 정보 조회 (댓글 수, 댓글 변경 시각)
+        - 게시글 행 하나만 읽으므로 스레드 크기와 무관 (게시글이 없으면 (0, None))
+        """
+        posts = Post.__table__
+        result = await self.db.execute(
+            select(posts.c.comment_count, posts.c.comments_updated_at)
+            .where(posts.c.id == post_id)
+        )
+        row = result.one_or_none()
+        if row is None:
+            return 0, None
+        return row[0], row[1]
+
+    async def reconcile_comment_counts(self) -> int:
+        """
+        댓글 수를 실제 댓글 수로 보정합니다
+        - 어긋난 게시글 행을 먼저 FOR UPDATE로 잠근 뒤 다시 집계해 덮어씀
+          (잠금 대기로 진행 중이던 댓글 작성/삭제가 커밋된 뒤 새 스냅샷에서 집계하고,
+          이후의 adjust_comment_count는 보정이 커밋될 때까지 대기하므로 증감분이 사라지지 않음)
+        - 잠금은 트랜잭션 종료 시 해제
+
+        Returns:
+            보정된 게시글 수
+        """
+        posts = Post.__table__
+        actual_count = (
+            select(func.count(Comment.id))
+            .where(Comment.post_id == posts.c.id)
+            .scalar_subquery()
+        )
+        candidate_result = await self.db.execute(
+            select(posts.c.id).where(posts.c.comment_count != actual_count)
+        )
+        candidate_ids = list(candidate_result.scalars().all())
+        if not candidate_ids:
+            return 0
+
+        await self.db.execute(
+            select(posts.c.id)
+            .where(posts.c.id.in_(candidate_ids))
+            .order_by(posts.c.id)
+            .with_for_update()
+        )
+        result = await self.db.execute(
+            update(posts)
+            .where(posts.c.id.in_(candidate_ids), posts.c.comment_count != actual_count)
+            .values(
+                comment_count=actual_count,
+                comments_updated_at=func.now(),
+                updated_at=posts.c.updated_at,
+            )
+        )
+        return result.rowcount
+
+    async def add_view_counts(self, increments: Dict[int, int]) -> None:
+        """조회수 일괄 증가 (게시글별 UPDATE ... SET view_count = view_count + n, 1회 왕복)"""
+        if not increments:
+            return
+        posts = Post.__table__
+        await self.db.execute(
+            update(posts)
+            .where(posts.c.id == bindparam("b_post_id"))
+            # 조회수 반영은 수정 시각(updated_at)을 바꾸지 않음
+            .values(
+                view_count=posts.c.view_count + bindparam("b_increment"),
+                updated_at=posts.c.updated_at,
+            ),
+            [
+                {"b_post_id": post_id, "b_increment": increment}
+                for post_id, increment in increments.items()
+            ],
+        )
+
+    async def stream_for_export(
+        self,
+        since: Optional[datetime] = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Mapping[str, Any]]:
+        """
+        내보내기용 전체 게시글 스트리밍 조회 (ID순, since 이후 수정분만)
+
+        - since는 updated_at 기준이므로 본문/제목 등 내용 수정만 반영
+          (조회수/좋아요/댓글 수 카운터 변경은 updated_at을 바꾸지 않아 포함되지 않음)
+        """
+        posts = Post.__table__
+        query = select(posts)
+        if since is not None:
+            query = query.where(posts.c.updated_at >= since)
+
+        result = await self.db.stream(
+            query.order_by(posts.c.id).execution_options(yield_per=batch_size)
+        )
+        async for row in result.mappings():
+            yield row
@@ -1,7 +1,9 @@
-from typing import Optional
-from sqlalchemy import select
+from typing import Any, AsyncIterator, Mapping, Optional, Tuple
+from sqlalchemy import select, delete, update, func, literal, exists
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.post import Post
 from app.models.reaction import Reaction
 from app.repositories.base import BaseRepository
 
@@ -27,3 +29,91 @@ class ReactionRepository(BaseRepository[Reaction]):
     async def delete_reaction(self, reaction: Reaction) -> None:
         await self.db.delete(reaction)
         await self.db.flush()
+
+    async def toggle_like(self, post_id: int, user_id: int) -> Optional[Tuple[int, bool]]:
+        """
+        좋아요 토글 (단일 SQL 문으로 원자적 처리)
+        - 기존 좋아요가 있으면 삭제, 없으면 추가하고 posts.like_count를 함께 갱신
+        - 동시 요청은 uq_post_user_reaction_type 제약으로 중복 없이 처리
+        - 같은 사용자의 첫 좋아요가 동시에 들어와 INSERT가 충돌로 건너뛰어지면(추가/삭제 모두 0건)
+          다른 요청이 추가한 행이 실제로 있는지 다시 조회해 좋아요 여부를 결정
+
+        Returns:
+            (갱신된 좋아요 수, 좋아요 상태), 게시글이 없으면 None
+        """
+        reactions = Reaction.__table__
+        posts = Post.__table__
+
+        deleted = (
+            delete(reactions)
+            .where(reactions.c.post_id == post_id)
+            .where(reactions.c.user_id == user_id)
+            .where(reactions.c.type == "like")
+            .returning(reactions.c.id)
+            .cte("deleted")
+        )
+        inserted = (
+            insert(reactions)
+            .from_select(
+                ["post_id", "user_id", "type"],
+                select(literal(post_id), literal(user_id), literal("like"))
+                .where(~exists(select(deleted.c.id)))
+                .where(exists(select(posts.c.id).where(posts.c.id == post_id))),
+            )
+            .on_conflict_do_nothing(constraint="uq_post_user_reaction_type")
+            .returning(reactions.c.id)
+            .cte("inserted")
+        )
+        added_count = select(func.count()).select_from(inserted).scalar_subquery()
+        removed_count = select(func.count()).select_from(deleted).scalar_subquery()
+
+        result = await self.db.execute(
+            update(posts)
+            .where(posts.c.id == post_id)
+            # 좋아요 반영은 수정 시각(updated_at)을 바꾸지 않음
+            .values(
+                like_count=func.greatest(posts.c.like_count + added_count - removed_count, 0),
+                updated_at=posts.c.updated_at,
+            )
+            .returning(
+                posts.c.like_count,
+                added_count.label("added"),
+                removed_count.label("removed"),
+            )
+        )
+        row = result.one_or_none()
+        if row is None:
+            return None
+        if row.added or row.removed:
+            return row.like_count, row.added > 0
+
+        # 충돌한 동시 요청의 행은 위 문장의 스냅샷에 보이지 않으므로 새 문장으로 확인
+        liked = await self.db.scalar(
+            select(
+                exists()
+                .where(reactions.c.post_id == post_id)
+                .where(reactions.c.user_id == user_id)
+                .where(reactions.c.type == "like")
+            )
+        )
+        return row.like_count, bool(liked)
+
+    async def stream_for_export(
+        self,
+        after_id: Optional[int] = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Mapping[str, Any]]:
+        """
+        내보내기용 전체 반응 스트리밍 조회 (ID순)
+        - reactions에는 시각 컬럼이 없으므로 after_id로 증분 조회
+        """
+        reactions = Reaction.__table__
+        query = select(reactions)
+        if after_id is not None:
+            query = query.where(reactions.c.id > after_id)
+
+        result = await self.db.stream(
+            query.order_by(reactions.c.id).execution_options(yield_per=batch_size)
+        )
+        async for row in result.mappings():
+            yield row
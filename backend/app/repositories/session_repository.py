@@ -0,0 +1,77 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import select, delete, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.user import User
+from app.models.user_session import UserSession
+from app.repositories.base import BaseRepository
+
+
+class SessionRepository(BaseRepository[UserSession]):
+    def __init__(self, db: AsyncSession):
+        super().__init__(UserSession, db)
+
+    async def create_many(self, rows: List[Dict[str, Any]]) -> None:
+        """세션 일괄 생성 (단일 multi-row INSERT)"""
+        if rows:
+            await self.db.execute(UserSession.__table__.insert().values(rows))
+
+    async def get_active_with_user(
+        self,
+        token_hash: str,
+        now: datetime,
+    ) -> Optional[Tuple[UserSession, User]]:
+        """토큰 해시로 만료되지 않은 세션과 사용자 조회 (단일 쿼리)"""
+        result = await self.db.execute(
+            select(UserSession, User)
+            .join(User, User.id == UserSession.user_id)
+            .where(UserSession.token_hash == token_hash, UserSession.expires_at > now)
+        )
+        row = result.one_or_none()
+        return (row[0], row[1]) if row else None
+
+    async def touch(self, session_id: int, now: datetime) -> None:
+        """마지막 사용 시각 갱신"""
+        await self.db.execute(
+            update(UserSession).where(UserSession.id == session_id).values(last_seen_at=now)
+        )
+
+    async def delete_by_token_hash(self, token_hash: str) -> bool:
+        result = await self.db.execute(
+            delete(UserSession).where(UserSession.token_hash == token_hash)
+        )
+        return result.rowcount > 0
+
+    async def delete_by_user_id(self, user_id: int) -> List[str]:
+        """
+        사용자의 모든 세션 삭제
+
+        Returns:
+            삭제된 세션의 토큰 해시 목록 (캐시 무효화용)
+        """
+        result = await self.db.execute(
+            delete(UserSession)
+            .where(UserSession.user_id == user_id)
+            .returning(UserSession.token_hash)
+        )
+        return list(result.scalars().all())
+
+    async def delete_expired(self, now: datetime, batch_size: int) -> int:
+        """
+        만료된 세션을 최대 batch_size개 삭제
+
+        Returns:
+            삭제된 세션 수
+        """
+        expired_ids = (
+            select(UserSession.id)
+            .where(UserSession.expires_at <= now)
+            .order_by(UserSession.expires_at)
+            .limit(batch_size)
+            .scalar_subquery()
+        )
+        result = await self.db.execute(
+            delete(UserSession).where(UserSession.id.in_(expired_ids))
+        )
+        return result.rowcount
@@ -1,5 +1,8 @@
-from typing import Optional
-from sqlalchemy import select
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from sqlalchemy import select, update, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.user import User
@@ -10,16 +13,93 @@ class UserRepository(BaseRepository[User]):
     def __init__(self, db: AsyncSession):
         super().__init__(User, db)
 
-    async def get_by_session_token(self, session_token: str) -> Optional[User]:
-        """세션 토큰으로 사용자 조회"""
+    async def get_by_nickname(self, nickname: str) -> Optional[User]:
+        """닉네임으로 사용자 조회"""
         result = await self.db.execute(
-            select(User).where(User.session_token == session_token)
+            select(User).where(User.nickname == nickname)
         )
         return result.scalar_one_or_none()
 
-    async def get_by_nickname(self, nickname: str) -> Optional[User]:
-        """닉네임으로 사용자 조회"""
+    async def stream_nicknames(
+        self,
+        after_id: Optional[int] = None,
+        batch_size: int = 5000,
+    ) -> AsyncIterator[Tuple[int, str]]:
+        """(id, nickname) 스트리밍 조회 (ID순, after_id 이후만)"""
+        query = select(User.id, User.nickname)
+        if after_id is not None:
+            query = query.where(User.id > after_id)
+
+        result = await self.db.stream(
+            query.order_by(User.id).execution_options(yield_per=batch_size)
+        )
+        async for user_id, nickname in result:
+            yield user_id, nickname
+
+    async def create_many_skip_existing(self, rows: List[Dict[str, Any]]) -> List[User]:
+        """
+        사용자 일괄 생성 (단일 multi-row INSERT)
+        - 이미 존재하는 닉네임은 건너뜀
+
+        Returns:
+            생성된 사용자 목록
+        """
+        if not rows:
+            return []
+        result = await self.db.scalars(
+            insert(User)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=[User.nickname])
+            .returning(User)
+        )
+        return list(result.all())
+
+    async def rename(self, user: User, nickname: str) -> bool:
+        """
+        닉네임 변경 (세이브포인트 안에서 flush)
+
+        Returns:
+            다른 사용자가 이미 사용 중이면 False (바깥 트랜잭션은 유지)
+        """
+        try:
+            async with self.db.begin_nested():
+                user.nickname = nickname
+                await self.db.flush()
+        except IntegrityError:
+            return False
+        return True
+
+    async def increment_token_version(self, user_id: int) -> Optional[int]:
+        """
+        토큰 버전 증가 (발급된 서명 토큰 전체 폐기)
+
+        Returns:
+            새 토큰 버전 (사용자가 없으면 None)
+        """
         result = await self.db.execute(
-            select(User).where(User.nickname == nickname)
+            update(User)
+            .where(User.id == user_id)
+            .values(token_version=User.token_version + 1)
+            .returning(User.token_version)
         )
         return result.scalar_one_or_none()
+
+    async def get_token_versions_since(
+        self,
+        since: Optional[datetime] = None,
+    ) -> Tuple[List[Tuple[int, int]], datetime]:
+        """
+        since 이후 변경된 사용자 중 토큰 버전이 0보다 큰 사용자 조회
+
+        Returns:
+            ([(user_id, token_version)], 조회 기준 DB 시각)
+        """
+        query = select(User.id, User.token_version, func.now()).where(User.token_version > 0)
+        if since is not None:
+            query = query.where(User.updated_at >= since)
+
+        rows = (await self.db.execute(query)).all()
+        if rows:
+            return [(row[0], row[1]) for row in rows], rows[0][2]
+        now = (await self.db.execute(select(func.now()))).scalar_one()
+        return [], now
@@ -1,4 +1,4 @@
-from app.routers import health_router, auth_router, category_router, post_router, comment_router
+from app.routers import health_router, auth_router, category_router, post_router, comment_router, admin_router
 
 __all__ = [
     "health_router",
@@ -6,4 +6,5 @@ __all__ = [
     "category_router",
     "post_router",
     "comment_router",
+    "admin_router",
 ]
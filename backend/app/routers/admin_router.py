@@ -0,0 +1,41 @@
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+
+from app.core.dependencies import require_admin
+from app.services.export_service import EXPORT_TYPES, export_ndjson
+
+router = APIRouter(prefix="/admin", tags=["Admin"], dependencies=[Depends(require_admin)])
+
+
+@router.get("/export")
+async def export_data(
+    types: str = Query(",".join(EXPORT_TYPES), description="내보낼 데이터 (쉼표 구분: posts,comments,reactions)"),
+    since: Optional[datetime] = Query(None, description="이 시각 이후 내용이 수정된 게시글/댓글만 (조회수/좋아요/댓글 수 변경은 제외)"),
+    reactions_after_id: Optional[int] = Query(None, ge=0, description="이 ID 이후의 반응만"),
+    gzip: bool = Query(False, description="gzip 압축 여부"),
+):
+    """
+    게시글/댓글/반응 NDJSON 내보내기 (분석용)
+    - 관리자 인증 필요 (X-Admin-Token)
+    - 한 줄에 레코드 하나, "type" 필드로 post/comment/reaction 구분
+    """
+    requested = [value.strip() for value in types.split(",") if value.strip()]
+    invalid = [value for value in requested if value not in EXPORT_TYPES]
+    if not requested or invalid:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"types must be a comma-separated subset of {','.join(EXPORT_TYPES)}",
+        )
+
+    headers = {"Content-Disposition": f'attachment; filename="export.ndjson{".gz" if gzip else ""}"'}
+    if gzip:
+        headers["Content-Encoding"] = "gzip"
+
+    return StreamingResponse(
+        export_ndjson(requested, since, reactions_after_id, compress=gzip),
+        media_type="application/x-ndjson",
+        headers=headers,
+    )
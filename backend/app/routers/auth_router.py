@@ -1,15 +1,43 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Header, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
-from app.core.dependencies import get_current_user
+from app.core.dependencies import get_current_user, require_admin
+from app.core.password_hasher import PasswordHasherBusyError
 from app.models.user import User
 from app.repositories.user_repository import UserRepository
+from app.repositories.session_repository import SessionRepository
 from app.services.auth_service import AuthService
-from app.schemas.user_schema import UserRegister, UserLogin, AnonymousUserCreate, UserUpdate, UserResponse
+from app.schemas.user_schema import (
+    UserRegister,
+    UserLogin,
+    AnonymousUserCreate,
+    AnonymousUserBatchCreate,
+    AnonymousUserBatchResponse,
+    NicknameAvailabilityResponse,
+    UserUpdate,
+    UserResponse,
+)
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
+PASSWORD_HASHER_RETRY_AFTER_SECONDS = "1"
+
+
+def _password_hasher_busy() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Too many authentication requests, please retry",
+        headers={"Retry-After": PASSWORD_HASHER_RETRY_AFTER_SECONDS},
+    )
+
+
+def _user_response(user: User, session_token: str) -> UserResponse:
+    """세션 토큰은 sessions 테이블에 해시로만 저장되므로 응답에 직접 채움"""
+    response = UserResponse.model_validate(user)
+    response.session_token = session_token
+    return response
+
 
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def register(
@@ -22,13 +50,35 @@ async def register(
     - 로그인 필요 (별도의 /login 엔드포인트 사용)
     """
     user_repo = UserRepository(db)
-    auth_service = AuthService(user_repo)
+    session_repo = SessionRepository(db)
+    auth_service = AuthService(user_repo, session_repo)
 
     try:
         new_user = await auth_service.register(user_data)
         return new_user
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except PasswordHasherBusyError:
+        raise _password_hasher_busy()
+
+
+@router.get("/nickname-available", response_model=NicknameAvailabilityResponse)
+async def check_nickname_available(
+    nickname: str = Query(..., min_length=2, max_length=50, description="확인할 닉네임"),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    닉네임 사용 가능 여부 확인
+    - 인증 불필요
+    - 대부분 블룸 필터만으로 응답 (사용 중일 수 있는 경우에만 DB 확인)
+    """
+    user_repo = UserRepository(db)
+    session_repo = SessionRepository(db)
+    auth_service = AuthService(user_repo, session_repo)
+
+    available = await auth_service.is_nickname_available(nickname)
+
+    return {"nickname": nickname, "available": available}
 
 
 @router.post("/login", response_model=UserResponse)
@@ -40,15 +90,19 @@ async def login(
     로그인
     - 닉네임 + 비밀번호로 로그인
     - 세션 토큰 반환 (클라이언트가 저장하여 인증에 사용)
+    - 다른 기기의 세션은 유지됨
     """
     user_repo = UserRepository(db)
-    auth_service = AuthService(user_repo)
+    session_repo = SessionRepository(db)
+    auth_service = AuthService(user_repo, session_repo)
 
     try:
-        user = await auth_service.login(login_data)
-        return user
+        user, session_token = await auth_service.login(login_data)
+        return _user_response(user, session_token)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
+    except PasswordHasherBusyError:
+        raise _password_hasher_busy()
 
 
 @router.post("/anonymous", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
@@ -62,28 +116,58 @@ async def create_anonymous_user(
     - 세션 토큰 즉시 반환
     """
     user_repo = UserRepository(db)
-    auth_service = AuthService(user_repo)
+    session_repo = SessionRepository(db)
+    auth_service = AuthService(user_repo, session_repo)
 
-    new_user = await auth_service.create_anonymous_user(user_data)
+    new_user, session_token = await auth_service.create_anonymous_user(user_data)
 
-    return new_user
+    return _user_response(new_user, session_token)
+
+
+@router.post(
+    "/anonymous/batch",
+    response_model=AnonymousUserBatchResponse,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(require_admin)],
+)
+async def create_anonymous_users(
+    batch_data: AnonymousUserBatchCreate,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    익명 사용자 일괄 생성 (최대 100명, 단일 INSERT)
+    - 관리자 인증 필요 (X-Admin-Token)
+    - 이미 사용 중인 닉네임은 skipped로 반환
+    """
+    user_repo = UserRepository(db)
+    session_repo = SessionRepository(db)
+    auth_service = AuthService(user_repo, session_repo)
+
+    created, skipped = await auth_service.create_anonymous_users(batch_data)
+
+    return {
+        "users": [_user_response(user, session_token) for user, session_token in created],
+        "skipped": skipped,
+    }
 
 
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_info(
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    session_token: str = Header(..., alias="X-Session-Token"),
 ):
     """
     현재 로그인한 사용자 정보 조회
     - 헤더: X-Session-Token 필요
     """
-    return current_user
+    return _user_response(current_user, session_token)
 
 
 @router.patch("/me", response_model=UserResponse)
 async def update_current_user(
     update_data: UserUpdate,
     current_user: User = Depends(get_current_user),
+    session_token: str = Header(..., alias="X-Session-Token"),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -92,12 +176,35 @@ async def update_current_user(
     - 닉네임 및 선호 언어 변경 가능
     """
     user_repo = UserRepository(db)
-    auth_service = AuthService(user_repo)
+    session_repo = SessionRepository(db)
+    auth_service = AuthService(user_repo, session_repo)
 
     try:
         updated_user = await auth_service.update_user(current_user.id, update_data)
         if not updated_user:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
-        return updated_user
+        return _user_response(updated_user, session_token)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(
+    all_devices: bool = Query(False, description="모든 기기에서 로그아웃"),
+    current_user: User = Depends(get_current_user),
+    session_token: str = Header(..., alias="X-Session-Token"),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    로그아웃
+    - 헤더: X-Session-Token 필요
+    - 현재 기기 세션만 종료 (all_devices=true면 모든 기기)
+    - 서명 토큰은 해당 사용자에게 발급된 토큰이 모두 폐기됨
+    """
+    user_repo = UserRepository(db)
+    session_repo = SessionRepository(db)
+    auth_service = AuthService(user_repo, session_repo)
+
+    await auth_service.logout(current_user.id, session_token, all_devices)
+
+    return None
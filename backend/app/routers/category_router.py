@@ -1,22 +1,70 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import List, Optional
 
 from app.core.database import get_db
+from app.models.category_post_count import UNCATEGORIZED_COUNT_KEY
 from app.repositories.category_repository import CategoryRepository
-from app.schemas.category_schema import CategoryResponse
+from app.repositories.category_post_count_repository import CategoryPostCountRepository
+from app.schemas.category_schema import CategoryResponse, CategoryStatsResponse
+from app.utils.http_cache import make_etag, etag_matches, cache_headers
 
 router = APIRouter(prefix="/categories", tags=["Categories"])
 
+CATEGORIES_CACHE_CONTROL = "public, max-age=300"
+
 
 @router.get("", response_model=List[CategoryResponse])
 async def get_all_categories(
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
     db: AsyncSession = Depends(get_db)
 ):
     """
     모든 카테고리 조회
+    - ETag 일치 시 304 반환 (If-None-Match)
     """
     category_repo = CategoryRepository(db)
     categories = await category_repo.get_all()
 
+    etag = make_etag(*(
+        (
+            category.id,
+            category.slug,
+            category.name_ko,
+            category.name_en,
+            category.name_vi,
+            category.name_ne,
+            category.name_km,
+        )
+        for category in categories
+    ))
+    headers = cache_headers(etag, CATEGORIES_CACHE_CONTROL)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
     return categories
+
+
+@router.get("/stats", response_model=CategoryStatsResponse)
+async def get_category_stats(
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    카테고리별 게시글 수 조회
+    - 집계 테이블에서 한 번에 조회 (COUNT(*) 없음)
+    """
+    post_count_repo = CategoryPostCountRepository(db)
+    counts = await post_count_repo.get_all_counts()
+
+    return {
+        "categories": [
+            {
+                "category_id": None if count.category_id == UNCATEGORIZED_COUNT_KEY else count.category_id,
+                "post_count": count.post_count,
+            }
+            for count in counts
+        ],
+        "total": sum(count.post_count for count in counts),
+    }
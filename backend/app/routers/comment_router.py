@@ -1,14 +1,18 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Header, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import List, Optional
 
-from app.core.database import get_db
+from app.core.database import get_db, AsyncSessionLocal
 from app.core.dependencies import get_current_user
 from app.models.user import User
 from app.repositories.comment_repository import CommentRepository
 from app.repositories.post_repository import PostRepository
 from app.services.comment_service import CommentService
 from app.schemas.comment_schema import CommentCreate, CommentResponse
+from app.utils.http_cache import make_etag, etag_matches, cache_headers
+
+COMMENTS_CACHE_CONTROL = "no-cache"
 
 router = APIRouter(prefix="/posts/{post_id}/comments", tags=["Comments"])
 
@@ -36,21 +40,59 @@ async def create_comment(
 @router.get("", response_model=List[CommentResponse])
 async def get_comments(
     post_id: int,
+    response: Response,
     skip: int = Query(0, ge=0, description="건너뛸 댓글 수"),
     limit: int = Query(100, ge=1, le=200, description="가져올 댓글 수"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (X-Next-Cursor 헤더)"),
+    if_none_match: Optional[str] = Header(None),
     db: AsyncSession = Depends(get_db)
 ):
     """
     게시글별 댓글 목록 조회
     - 인증 불필요
+    - ETag 일치 시 304 반환 (If-None-Match, 게시글의 댓글 수와 댓글 변경 시각 기준)
+    - 다음 페이지가 있으면 X-Next-Cursor 헤더 반환, cursor로 전달 시 키셋 페이지네이션
     """
     comment_repo = CommentRepository(db)
     post_repo = PostRepository(db)
     comment_service = CommentService(comment_repo, post_repo)
 
-    comments = await comment_service.get_comments_by_post(post_id, skip, limit)
+    count, comments_updated_at = await comment_service.get_comments_version(post_id)
+    etag = make_etag("comments", post_id, skip, limit, cursor, count, comments_updated_at)
+    headers = cache_headers(etag, COMMENTS_CACHE_CONTROL, comments_updated_at)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    result = await comment_service.get_comments_by_post(post_id, skip, limit, cursor)
+
+    response.headers.update(headers)
+    if result["next_cursor"]:
+        response.headers["X-Next-Cursor"] = result["next_cursor"]
+    return result["comments"]
+
+
+@router.get("/stream")
+async def stream_comments(
+    post_id: int,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    게시글별 전체 댓글 스트리밍 조회 (NDJSON, 최신순)
+    - 인증 불필요
+    - 한 줄에 댓글 하나 (CommentResponse 형식)
+    - 게시글이 없으면 404 (응답 시작 전에 확인)
+    """
+    comment_service = CommentService(CommentRepository(db), PostRepository(db))
+    await comment_service.ensure_post_exists(post_id)
+
+    async def _generate():
+        # 응답 전송 중에도 유지되도록 별도 세션 사용
+        async with AsyncSessionLocal() as session:
+            comment_service = CommentService(CommentRepository(session), PostRepository(session))
+            async for line in comment_service.stream_comments_ndjson(post_id):
+                yield line
 
-    return comments
+    return StreamingResponse(_generate(), media_type="application/x-ndjson")
 
 
 @router.delete("/{comment_id}", status_code=status.HTTP_204_NO_CONTENT)
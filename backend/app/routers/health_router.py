@@ -20,3 +20,25 @@ async def health_check():
         "status": "healthy",
         "service": "LinkON API",
     }
+
+
+@router.get("/health/stats")
+async def health_stats():
+    """프로세스 내 캐시 통계"""
+    from app.core.cache import get_feed_cache, get_session_cache, get_user_snapshot_cache
+    from app.core.nickname_index import get_nickname_index
+    from app.core.ocr_cache import get_ocr_cache
+    from app.core.ocr_job_queue import get_ocr_job_queue
+    from app.core.rate_limit import get_rate_limiter
+    from app.core.token_revocation import get_token_revocation_list
+
+    return {
+        "feed_cache": get_feed_cache().stats(),
+        "session_cache": get_session_cache().stats(),
+        "user_snapshot_cache": get_user_snapshot_cache().stats(),
+        "token_revocation": get_token_revocation_list().stats(),
+        "rate_limit": get_rate_limiter().stats(),
+        "nickname_index": get_nickname_index().stats(),
+        "ocr_cache": get_ocr_cache().stats() if get_ocr_cache() else None,
+        "ocr_jobs": get_ocr_job_queue().stats(),
+    }
@@ -2,9 +2,17 @@
 """
 OCR 라우터
 """
-from fastapi import APIRouter, UploadFile, File, HTTPException, Query
+import json
+from datetime import datetime, timezone
+from typing import Any, Dict
+
+from fastapi import APIRouter, UploadFile, File, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from app.core.image_preprocessor import get_image_preprocessor
+from app.core.ocr_cache import get_ocr_cache
+from app.core.ocr_job_queue import JOB_SUCCEEDED, OCRJob, OCRJobQueueFullError, get_ocr_job_queue
 from app.services.gpt_vision_service import get_gpt_vision_service
-from app.schemas.ocr_schema import OCRResponse, OCRAnalyzeResponse, KeyInfo
+from app.schemas.ocr_schema import OCRResponse, OCRAnalyzeResponse, OCRJobResponse, KeyInfo
 import logging
 
 logger = logging.getLogger(__name__)
@@ -12,6 +20,55 @@ logger = logging.getLogger(__name__)
 # prefix를 /ocr로 변경 (/api/v1은 main.py에서 추가됨)
 router = APIRouter(prefix="/ocr", tags=["OCR"])
 
+MAX_IMAGE_BYTES = 20 * 1024 * 1024
+OCR_JOB_RETRY_AFTER_SECONDS = "10"
+
+
+async def _read_image(file: UploadFile) -> bytes:
+    """업로드 이미지 검증 후 읽기 (이미지 형식, 20MB 이하)"""
+    if not file.content_type or not file.content_type.startswith("image/"):
+        raise HTTPException(
+            status_code=400,
+            detail="이미지 파일만 업로드 가능합니다"
+        )
+
+    image_data = await file.read()
+    if len(image_data) > MAX_IMAGE_BYTES:
+        raise HTTPException(
+            status_code=400,
+            detail="파일 크기는 20MB 이하여야 합니다"
+        )
+    return image_data
+
+
+def _analyze_response(result: Dict[str, Any]) -> OCRAnalyzeResponse:
+    return OCRAnalyzeResponse(
+        document_type=result["document_type"],
+        original_text=result["original_text"],
+        translated_text=result["translated_text"],
+        summary=result["summary"],
+        key_info=KeyInfo(**result["key_info"]),
+        confidence=result["confidence"],
+        source_lang=result["source_lang"],
+        target_lang=result["target_lang"]
+    )
+
+
+def _sse(event: str, data: Any) -> str:
+    """Server-Sent Events 메시지 한 개"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def _job_response(job: OCRJob) -> OCRJobResponse:
+    return OCRJobResponse(
+        job_id=job.id,
+        status=job.status,
+        created_at=datetime.fromtimestamp(job.created_at, timezone.utc),
+        finished_at=datetime.fromtimestamp(job.finished_at, timezone.utc) if job.finished_at else None,
+        data=_analyze_response(job.result) if job.status == JOB_SUCCEEDED else None,
+        error=job.error,
+    )
+
 
 @router.post("/analyze", response_model=OCRResponse)
 async def analyze_document(
@@ -33,24 +90,9 @@ async def analyze_document(
     - en: 영어
     - ne: 네팔어
     """
-    # 파일 검증
-    if not file.content_type or not file.content_type.startswith("image/"):
-        raise HTTPException(
-            status_code=400,
-            detail="이미지 파일만 업로드 가능합니다"
-        )
-    
     try:
-        # 파일 읽기
-        image_data = await file.read()
-        
-        # 크기 검증 (20MB)
-        max_size = 20 * 1024 * 1024
-        if len(image_data) > max_size:
-            raise HTTPException(
-                status_code=400,
-                detail="파일 크기는 20MB 이하여야 합니다"
-            )
+        # 파일 검증 및 읽기
+        image_data = await _read_image(file)
         
         # GPT-4o 분석
         service = get_gpt_vision_service()
@@ -64,16 +106,7 @@ async def analyze_document(
         return OCRResponse(
             success=True,
             message="문서 분석 완료",
-            data=OCRAnalyzeResponse(
-                document_type=result["document_type"],
-                original_text=result["original_text"],
-                translated_text=result["translated_text"],
-                summary=result["summary"],
-                key_info=KeyInfo(**result["key_info"]),
-                confidence=result["confidence"],
-                source_lang=result["source_lang"],
-                target_lang=result["target_lang"]
-            )
+            data=_analyze_response(result)
         )
         
     except HTTPException:
@@ -86,15 +119,104 @@ async def analyze_document(
         )
 
 
+@router.post("/analyze/stream")
+async def analyze_document_stream(
+    file: UploadFile = File(..., description="분석할 이미지 파일"),
+    source_lang: str = Query(default="ko", description="원본 언어 (ko, vi, en, ne)"),
+    target_lang: str = Query(default="vi", description="번역 언어 (ko, vi, en, ne)")
+):
+    """
+    문서 이미지 분석 (GPT-4o Vision, Server-Sent Events)
+
+    분석 중인 필드를 도착하는 대로 전송:
+    - `event: delta` - `{"field", "text"}` 문자열 필드의 새로 도착한 부분
+    - `event: field` - `{"field", "value"}` 완성된 필드
+    - `event: result` - /ocr/analyze와 같은 최종 응답 (마지막 이벤트)
+    - `event: error` - 결과 생성 실패 (마지막 이벤트)
+    """
+    image_data = await _read_image(file)
+    service = get_gpt_vision_service()
+
+    async def events():
+        async for event in service.stream_document(image_data, source_lang, target_lang):
+            if event["event"] == "delta":
+                yield _sse("delta", {"field": event["field"], "text": event["text"]})
+            elif event["event"] == "field":
+                yield _sse("field", {"field": event["field"], "value": event["value"]})
+            elif event["event"] == "error":
+                yield _sse("error", {"detail": event["detail"]})
+            else:
+                try:
+                    response = OCRResponse(
+                        success=True,
+                        message="문서 분석 완료",
+                        data=_analyze_response(event["data"])
+                    )
+                except Exception as e:
+                    logger.error(f"❌ OCR 분석 실패: {str(e)}")
+                    yield _sse("error", {"detail": "문서 분석 실패"})
+                else:
+                    yield _sse("result", response.model_dump())
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        # 프록시 버퍼링을 끄고 이벤트를 바로 전달
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post("/jobs", response_model=OCRJobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def create_ocr_job(
+    file: UploadFile = File(..., description="분석할 이미지 파일"),
+    source_lang: str = Query(default="ko", description="원본 언어 (ko, vi, en, ne)"),
+    target_lang: str = Query(default="vi", description="번역 언어 (ko, vi, en, ne)")
+):
+    """
+    문서 이미지 분석 작업 등록 (비동기)
+
+    - 바로 작업 ID를 반환하고 분석은 백그라운드 워커가 실행
+    - GET /ocr/jobs/{job_id}로 상태/결과 조회 (완료 후 일정 시간 보관)
+    """
+    image_data = await _read_image(file)
+
+    try:
+        job = get_ocr_job_queue().submit(image_data, source_lang, target_lang)
+    except OCRJobQueueFullError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="분석 대기 중인 작업이 너무 많습니다. 잠시 후 다시 시도해주세요",
+            headers={"Retry-After": OCR_JOB_RETRY_AFTER_SECONDS},
+        )
+
+    return _job_response(job)
+
+
+@router.get("/jobs/{job_id}", response_model=OCRJobResponse)
+async def get_ocr_job(job_id: str):
+    """OCR 작업 상태/결과 조회"""
+    job = get_ocr_job_queue().get(job_id)
+    if not job:
+        raise HTTPException(
+            status_code=404,
+            detail="작업을 찾을 수 없습니다 (보관 기간 만료 포함)"
+        )
+    return _job_response(job)
+
+
 @router.get("/health")
 async def ocr_health():
     """OCR 서비스 상태 확인"""
     try:
         service = get_gpt_vision_service()
+        cache = get_ocr_cache()
         return {
             "status": "healthy",
             "engine": "GPT-4o Vision",
-            "supported_languages": ["ko", "vi", "en", "ne"]
+            "supported_languages": ["ko", "vi", "en", "ne"],
+            "cache": cache.stats() if cache else None,
+            "preprocessing": get_image_preprocessor().stats(),
+            "jobs": get_ocr_job_queue().stats()
         }
     except Exception as e:
         raise HTTPException(
@@ -1,6 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File, Response, Header
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Optional
+from typing import Optional, Literal
 
 from app.core.database import get_db
 from app.core.dependencies import get_current_user
@@ -8,13 +8,25 @@ from app.models.user import User
 from app.repositories.post_repository import PostRepository
 from app.repositories.post_image_repository import PostImageRepository
 from app.repositories.reaction_repository import ReactionRepository
+from app.repositories.category_post_count_repository import CategoryPostCountRepository
 from app.services.post_service import PostService
 from app.services.post_image_service import PostImageService
-from app.schemas.post_schema import PostCreate, PostResponse, PostUpdate, PostListResponse
-from app.schemas.post_image_schema import PostImageListResponse
+from app.schemas.post_schema import (
+    PostCreate,
+    PostResponse,
+    PostUpdate,
+    PostListResponse,
+    PostSearchResponse,
+    PostBatchResponse,
+)
+from app.schemas.post_image_schema import PostImageListResponse, PostImageReorder
+from app.utils.http_cache import make_etag, etag_matches, cache_headers
 
 router = APIRouter(prefix="/posts", tags=["Posts"])
 
+POST_DETAIL_CACHE_CONTROL = "no-cache"
+POST_BATCH_MAX_IDS = 50
+
 
 @router.post("", response_model=PostResponse, status_code=status.HTTP_201_CREATED)
 async def create_post(
@@ -29,7 +41,8 @@ async def create_post(
     post_repo = PostRepository(db)
     post_image_repo = PostImageRepository(db)
     reaction_repo = ReactionRepository(db)
-    post_service = PostService(post_repo, post_image_repo, reaction_repo)
+    post_count_repo = CategoryPostCountRepository(db)
+    post_service = PostService(post_repo, post_image_repo, reaction_repo, post_count_repo)
 
     new_post = await post_service.create_post(current_user.id, post_data)
 
@@ -41,37 +54,116 @@ async def get_posts(
     page: int = Query(1, ge=1, description="페이지 번호 (1부터 시작)"),
     page_size: int = Query(20, ge=1, le=100, description="페이지당 게시글 수"),
     category_id: Optional[int] = Query(None, description="카테고리 ID (선택)"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (응답의 next_cursor)"),
+    sort: Literal["recent", "hot"] = Query("recent", description="정렬 (recent: 최신순, hot: 인기순)"),
     db: AsyncSession = Depends(get_db)
 ):
     """
     게시글 목록 조회 (페이지네이션)
     - 인증 불필요
     - category_id로 필터링 가능
+    - cursor 지정 시 키셋 페이지네이션 (무한 스크롤용, page 무시)
+    - sort=hot: 좋아요/댓글/조회수와 작성 시각 기반 인기순
+    """
+    post_repo = PostRepository(db)
+    post_image_repo = PostImageRepository(db)
+    reaction_repo = ReactionRepository(db)
+    post_count_repo = CategoryPostCountRepository(db)
+    post_service = PostService(post_repo, post_image_repo, reaction_repo, post_count_repo)
+
+    body = await post_service.get_posts_page_json(page, page_size, category_id, cursor, sort)
+
+    return Response(content=body, media_type="application/json")
+
+
+@router.get("/search", response_model=PostSearchResponse)
+async def search_posts(
+    q: str = Query(..., min_length=2, max_length=100, description="검색어 (제목 + 본문)"),
+    page_size: int = Query(20, ge=1, le=100, description="페이지당 게시글 수"),
+    category_id: Optional[int] = Query(None, description="카테고리 ID (선택)"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (응답의 next_cursor)"),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    게시글 검색
+    - 인증 불필요
+    - 한국어/베트남어/네팔어/크메르어/영어 부분 문자열 검색 (트라이그램)
+    - 2자 검색어는 단어 앞부분 일치만 검색 (트라이그램 인덱스를 쓰기 위해, PostRepository.search 참고)
+    - 유사도순 정렬, cursor로 다음 페이지 조회
     """
     post_repo = PostRepository(db)
     post_image_repo = PostImageRepository(db)
     reaction_repo = ReactionRepository(db)
-    post_service = PostService(post_repo, post_image_repo, reaction_repo)
+    post_count_repo = CategoryPostCountRepository(db)
+    post_service = PostService(post_repo, post_image_repo, reaction_repo, post_count_repo)
 
-    result = await post_service.get_posts_paginated(page, page_size, category_id)
+    result = await post_service.search_posts(q, page_size, category_id, cursor)
 
     return result
 
 
+@router.get("/batch", response_model=PostBatchResponse)
+async def get_posts_batch(
+    ids: str = Query(..., description=f"쉼표로 구분된 게시글 ID 목록 (최대 {POST_BATCH_MAX_IDS}개)"),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    게시글 일괄 조회 (알림/북마크 화면용)
+    - 인증 불필요
+    - 요청한 순서대로 반환, 존재하지 않는 게시글은 제외
+    - 조회수 증가 없음
+    """
+    try:
+        post_ids = list(dict.fromkeys(int(value) for value in ids.split(",") if value.strip()))
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="ids must be comma-separated integers"
+        )
+
+    if not post_ids:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="ids is required"
+        )
+    if len(post_ids) > POST_BATCH_MAX_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {POST_BATCH_MAX_IDS} ids are allowed"
+        )
+
+    post_repo = PostRepository(db)
+    post_image_repo = PostImageRepository(db)
+    reaction_repo = ReactionRepository(db)
+    post_count_repo = CategoryPostCountRepository(db)
+    post_service = PostService(post_repo, post_image_repo, reaction_repo, post_count_repo)
+
+    posts = await post_service.get_posts_by_ids(post_ids)
+
+    return {"posts": posts}
+
+
 @router.get("/{post_id}", response_model=PostResponse)
 async def get_post(
     post_id: int,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
     db: AsyncSession = Depends(get_db)
 ):
     """
     게시글 상세 조회
     - 조회수 자동 증가
     - 인증 불필요
+    - ETag 일치 시 304 반환 (If-None-Match, 조회수는 증가)
+    - ETag는 약한 ETag: 본문의 view_count는 이 요청의 증가분까지 포함해 매 요청 달라지므로
+      본문 바이트 기준 강한 ETag로는 304가 발생하지 않음. 조회수를 제외한 내용이 같으면
+      의미상 같은 표현으로 보고 약한 비교(If-None-Match)에만 사용 (If-Match/Range 용도 아님)
     """
     post_repo = PostRepository(db)
     post_image_repo = PostImageRepository(db)
     reaction_repo = ReactionRepository(db)
-    post_service = PostService(post_repo, post_image_repo, reaction_repo)
+    post_count_repo = CategoryPostCountRepository(db)
+    post_service = PostService(post_repo, post_image_repo, reaction_repo, post_count_repo)
 
     post = await post_service.get_post_by_id(post_id, increment_view=True)
 
@@ -81,6 +173,21 @@ async def get_post(
             detail="Post not found"
         )
 
+    # 조회수를 제외한 응답 필드 기준 (약한 ETag, 위 설명 참고)
+    etag = make_etag(
+        "post",
+        post.id,
+        post.updated_at,
+        post.like_count,
+        post.comment_count,
+        [(image.id, image.sort_order) for image in post.images],
+        weak=True,
+    )
+    headers = cache_headers(etag, POST_DETAIL_CACHE_CONTROL, post.updated_at)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
     return post
 
 
@@ -99,7 +206,8 @@ async def update_post(
     post_repo = PostRepository(db)
     post_image_repo = PostImageRepository(db)
     reaction_repo = ReactionRepository(db)
-    post_service = PostService(post_repo, post_image_repo, reaction_repo)
+    post_count_repo = CategoryPostCountRepository(db)
+    post_service = PostService(post_repo, post_image_repo, reaction_repo, post_count_repo)
 
     updated_post = await post_service.update_post(post_id, current_user.id, post_data)
 
@@ -126,7 +234,8 @@ async def delete_post(
     post_repo = PostRepository(db)
     post_image_repo = PostImageRepository(db)
     reaction_repo = ReactionRepository(db)
-    post_service = PostService(post_repo, post_image_repo, reaction_repo)
+    post_count_repo = CategoryPostCountRepository(db)
+    post_service = PostService(post_repo, post_image_repo, reaction_repo, post_count_repo)
 
     success = await post_service.delete_post(post_id, current_user.id)
 
@@ -148,12 +257,13 @@ async def toggle_like(
     """
     게시글 좋아요 토글
     - 인증 필요 (X-Session-Token)
-    - 현재는 단순 카운트만 증가 (향후 Reaction 모델과 연동)
+    - 단일 SQL 문으로 Reaction 추가/삭제와 좋아요 수 갱신을 원자적으로 처리
     """
     post_repo = PostRepository(db)
     post_image_repo = PostImageRepository(db)
     reaction_repo = ReactionRepository(db)
-    post_service = PostService(post_repo, post_image_repo, reaction_repo)
+    post_count_repo = CategoryPostCountRepository(db)
+    post_service = PostService(post_repo, post_image_repo, reaction_repo, post_count_repo)
 
     result = await post_service.toggle_like(post_id, current_user.id)
 
@@ -183,3 +293,31 @@ async def upload_post_images(
     images = await image_service.upload_post_images(post_id, current_user.id, files)
 
     return {"images": images}
+
+
+@router.put("/{post_id}/images/{image_id}/position", response_model=PostImageListResponse)
+async def reorder_post_image(
+    post_id: int,
+    image_id: int,
+    reorder_data: PostImageReorder,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    게시글 이미지 순서 변경
+    - 작성자만 변경 가능
+    - 인증 필요 (X-Session-Token)
+    - 변경된 전체 이미지 목록 반환
+    """
+    post_repo = PostRepository(db)
+    post_image_repo = PostImageRepository(db)
+    image_service = PostImageService(post_repo, post_image_repo)
+
+    images = await image_service.reorder_image(
+        post_id,
+        current_user.id,
+        image_id,
+        reorder_data.position,
+    )
+
+    return {"images": images}
@@ -1,23 +1,49 @@
-from app.schemas.user_schema import UserRegister, UserLogin, AnonymousUserCreate, UserResponse, UserUpdate
-from app.schemas.category_schema import CategoryResponse, CategoryCreate
-from app.schemas.post_schema import PostCreate, PostResponse, PostUpdate, PostListResponse
+from app.schemas.user_schema import (
+    UserRegister,
+    UserLogin,
+    AnonymousUserCreate,
+    AnonymousUserBatchCreate,
+    UserResponse,
+    AnonymousUserBatchResponse,
+    NicknameAvailabilityResponse,
+    UserUpdate,
+)
+from app.schemas.category_schema import CategoryResponse, CategoryCreate, CategoryPostCountResponse, CategoryStatsResponse
+from app.schemas.post_schema import (
+    PostCreate,
+    PostResponse,
+    PostUpdate,
+    PostListItemResponse,
+    PostListResponse,
+    PostSearchResponse,
+    PostBatchResponse,
+)
 from app.schemas.comment_schema import CommentCreate, CommentResponse
-from app.schemas.post_image_schema import PostImageResponse, PostImageListResponse
+from app.schemas.post_image_schema import PostImageResponse, PostImageListResponse, PostImageReorder
 
 __all__ = [
     "UserRegister",
     "UserLogin",
     "AnonymousUserCreate",
     "UserResponse",
+    "AnonymousUserBatchCreate",
+    "AnonymousUserBatchResponse",
+    "NicknameAvailabilityResponse",
     "UserUpdate",
     "CategoryResponse",
     "CategoryCreate",
+    "CategoryPostCountResponse",
+    "CategoryStatsResponse",
     "PostCreate",
     "PostResponse",
     "PostUpdate",
+    "PostListItemResponse",
     "PostListResponse",
+    "PostSearchResponse",
+    "PostBatchResponse",
     "CommentCreate",
     "CommentResponse",
     "PostImageResponse",
     "PostImageListResponse",
+    "PostImageReorder",
 ]
@@ -1,3 +1,4 @@
+from typing import List, Optional
 from pydantic import BaseModel, Field
 
 
@@ -21,3 +22,13 @@ class CategoryResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class CategoryPostCountResponse(BaseModel):
+    category_id: Optional[int] = Field(None, description="카테고리 ID (미분류는 null)")
+    post_count: int
+
+
+class CategoryStatsResponse(BaseModel):
+    categories: List[CategoryPostCountResponse]
+    total: int
@@ -1,3 +1,4 @@
+from datetime import datetime
 from pydantic import BaseModel, Field
 from typing import Optional, List
 
@@ -27,4 +28,13 @@ class OCRResponse(BaseModel):
     """OCR API 응답"""
     success: bool = Field(..., description="성공 여부")
     message: str = Field(..., description="응답 메시지")
-    data: Optional[OCRAnalyzeResponse] = Field(None, description="분석 결과")
\ No newline at end of file
+    data: Optional[OCRAnalyzeResponse] = Field(None, description="분석 결과")
+
+class OCRJobResponse(BaseModel):
+    """비동기 OCR 작업 상태"""
+    job_id: str = Field(..., description="작업 ID")
+    status: str = Field(..., description="queued, running, succeeded, failed")
+    created_at: datetime = Field(..., description="등록 시각")
+    finished_at: Optional[datetime] = Field(None, description="완료 시각")
+    data: Optional[OCRAnalyzeResponse] = Field(None, description="분석 결과 (succeeded일 때)")
+    error: Optional[str] = Field(None, description="실패 사유 (failed일 때)")
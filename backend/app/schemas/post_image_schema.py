@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import List
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class PostImageResponse(BaseModel):
@@ -16,3 +16,7 @@ class PostImageResponse(BaseModel):
 
 class PostImageListResponse(BaseModel):
     images: List[PostImageResponse]
+
+
+class PostImageReorder(BaseModel):
+    position: int = Field(..., ge=0, description="이동할 위치 (0부터 시작)")
@@ -21,7 +21,8 @@ class PostUpdate(BaseModel):
     is_anonymous: Optional[bool] = Field(None, description="익명 여부")
 
 
-class PostResponse(BaseModel):
+class PostResponseBase(BaseModel):
+    """상세/목록 응답 공통 필드"""
     id: int
     user_id: int
     category_id: Optional[int]
@@ -32,6 +33,7 @@ class PostResponse(BaseModel):
     is_anonymous: bool
     view_count: int
     like_count: int
+    comment_count: int
     created_at: datetime
     updated_at: datetime
 
@@ -39,9 +41,30 @@ class PostResponse(BaseModel):
         from_attributes = True
 
 
+class PostResponse(PostResponseBase):
+    pass
+
+
+class PostListItemResponse(PostResponseBase):
+    content: str = Field(..., description="본문 발췌 (전체 본문은 상세 조회)")
+    content_truncated: bool = Field(..., description="본문 발췌 여부")
+
+
 class PostListResponse(BaseModel):
-    posts: List[PostResponse]
+    posts: List[PostListItemResponse]
     total: int
     page: int
     page_size: int
     total_pages: int
+    next_cursor: Optional[str] = None
+
+
+class PostSearchResponse(BaseModel):
+    posts: List[PostResponse]
+    query: str
+    page_size: int
+    next_cursor: Optional[str] = None
+
+
+class PostBatchResponse(BaseModel):
+    posts: List[PostResponse]
@@ -1,6 +1,6 @@
 from pydantic import BaseModel, Field
 from datetime import datetime
-from typing import Optional, Literal
+from typing import Annotated, List, Optional, Literal
 
 
 class UserRegister(BaseModel):
@@ -20,6 +20,13 @@ class AnonymousUserCreate(BaseModel):
     nickname: str = Field(..., min_length=2, max_length=50, description="사용자 닉네임")
 
 
+class AnonymousUserBatchCreate(BaseModel):
+    """익명 사용자 일괄 생성"""
+    nicknames: List[Annotated[str, Field(min_length=2, max_length=50)]] = Field(
+        ..., min_length=1, max_length=100, description="생성할 사용자 닉네임 목록"
+    )
+
+
 class UserUpdate(BaseModel):
     nickname: Optional[str] = Field(None, min_length=2, max_length=50, description="사용자 닉네임")
     preferred_language: Optional[Literal["ko", "en", "vi", "ne", "km"]] = Field(
@@ -37,3 +44,13 @@ class UserResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class AnonymousUserBatchResponse(BaseModel):
+    users: List[UserResponse]
+    skipped: List[str]
+
+
+class NicknameAvailabilityResponse(BaseModel):
+    nickname: str
+    available: bool
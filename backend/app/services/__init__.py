@@ -2,10 +2,12 @@ from app.services.auth_service import AuthService
 from app.services.post_service import PostService
 from app.services.comment_service import CommentService
 from app.services.post_image_service import PostImageService
+from app.services.export_service import ExportService
 
 __all__ = [
     "AuthService",
     "PostService",
     "CommentService",
     "PostImageService",
+    "ExportService",
 ]
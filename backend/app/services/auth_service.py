@@ -1,95 +1,287 @@
 import secrets
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from app.models.user import User
 from app.repositories.user_repository import UserRepository
-from app.schemas.user_schema import UserRegister, UserLogin, AnonymousUserCreate, UserUpdate
+from app.repositories.session_repository import SessionRepository
+from app.schemas.user_schema import (
+    UserRegister,
+    UserLogin,
+    AnonymousUserCreate,
+    AnonymousUserBatchCreate,
+    UserUpdate,
+)
+from app.core.cache import (
+    get_session_cache,
+    get_user_snapshot_cache,
+    invalidate_session_cache,
+    invalidate_user_snapshot_cache,
+)
 from app.core.config import settings
-from app.utils.password import hash_password, verify_password
+from app.core.nickname_index import get_nickname_index
+from app.core.password_hasher import hash_password_async, verify_password_async
+from app.core.token_revocation import get_token_revocation_list
+from app.utils.password import UNUSABLE_PASSWORD, is_password_usable, hash_session_token
+from app.utils.signed_token import encode_signed_token, decode_signed_token, is_signed_token
+
+
+# 세션 캐시에 저장하지 않는 컬럼
+_SESSION_SNAPSHOT_EXCLUDED = {"password_hash"}
+
+# last_seen_at 갱신 최소 간격 (매 요청마다 쓰지 않도록)
+SESSION_LAST_SEEN_RESOLUTION = timedelta(minutes=5)
+
+
+def _user_snapshot(user: User) -> Dict[str, Any]:
+    return {
+        column.key: getattr(user, column.key)
+        for column in User.__table__.columns
+        if column.key not in _SESSION_SNAPSHOT_EXCLUDED
+    }
+
+
+def _signed_mode() -> bool:
+    return settings.SESSION_TOKEN_MODE == "signed"
 
 
 class AuthService:
-    def __init__(self, user_repo: UserRepository):
+    def __init__(self, user_repo: UserRepository, session_repo: SessionRepository):
         self.user_repo = user_repo
+        self.session_repo = session_repo
 
     def _generate_session_token(self) -> str:
         """랜덤 세션 토큰 생성 (256비트)"""
         return secrets.token_urlsafe(32)
 
+    def _issue_signed_token(self, user: User) -> str:
+        """서명된 세션 토큰 발급 (사용자 ID, 발급/만료 시각, 토큰 버전)"""
+        issued_at = int(time.time())
+        return encode_signed_token(
+            {
+                "sub": str(user.id),
+                "iat": issued_at,
+                "exp": issued_at + settings.SESSION_EXPIRE_HOURS * 3600,
+                "ver": user.token_version or 0,
+            },
+            settings.JWT_SECRET_KEY,
+            settings.JWT_ALGORITHM,
+        )
+
+    async def _start_sessions(self, users: List[User]) -> List[str]:
+        """
+        사용자별 새 세션 토큰 발급
+        - 불투명 토큰은 sessions 테이블에 해시로 저장 (단일 INSERT)
+        - 서명 토큰은 저장하지 않음
+        """
+        if _signed_mode():
+            return [self._issue_signed_token(user) for user in users]
+
+        tokens = [self._generate_session_token() for _ in users]
+        expires_at = datetime.now(timezone.utc) + timedelta(hours=settings.SESSION_EXPIRE_HOURS)
+        await self.session_repo.create_many([
+            {
+                "user_id": user.id,
+                "token_hash": hash_session_token(token),
+                "expires_at": expires_at,
+            }
+            for user, token in zip(users, tokens)
+        ])
+        return tokens
+
+    async def is_nickname_available(self, nickname: str) -> bool:
+        """
+        닉네임 사용 가능 여부
+        - 블룸 필터에 없으면 DB 조회 없이 사용 가능으로 판단
+        """
+        if not get_nickname_index().might_exist(nickname):
+            return True
+        return await self.user_repo.get_by_nickname(nickname) is None
+
     async def register(self, user_data: UserRegister) -> User:
         """회원가입"""
-        # 닉네임 중복 체크
-        existing_user = await self.user_repo.get_by_nickname(user_data.nickname)
-        if existing_user:
+        # 닉네임 중복 체크 (해싱 전에 확인)
+        if not await self.is_nickname_available(user_data.nickname):
             raise ValueError("이미 사용 중인 닉네임입니다")
 
         # 비밀번호 해싱
-        password_hash_value = hash_password(user_data.password)
+        password_hash_value = await hash_password_async(user_data.password)
 
-        new_user = User(
-            nickname=user_data.nickname,
-            password_hash=password_hash_value,
-            session_token=None,
-        )
+        # 동시 가입으로 닉네임이 선점된 경우 유니크 인덱스에서 걸러짐
+        created = await self.user_repo.create_many_skip_existing([
+            {
+                "nickname": user_data.nickname,
+                "password_hash": password_hash_value,
+            }
+        ])
+        get_nickname_index().add(user_data.nickname)
+        if not created:
+            raise ValueError("이미 사용 중인 닉네임입니다")
+
+        return created[0]
 
-        return await self.user_repo.create(new_user)
+    async def login(self, login_data: UserLogin) -> Tuple[User, str]:
+        """
+        로그인
+        - 기존 기기의 세션은 유지하고 새 세션을 추가
 
-    async def login(self, login_data: UserLogin) -> User:
-        """로그인"""
+        Returns:
+            (사용자, 새 세션 토큰)
+        """
         # 사용자 조회
         user = await self.user_repo.get_by_nickname(login_data.nickname)
         if not user:
             raise ValueError("닉네임 또는 비밀번호가 일치하지 않습니다")
 
-        # 비밀번호 검증
-        if not verify_password(login_data.password, user.password_hash):
+        # 비밀번호 검증 (익명 사용자는 비밀번호 로그인 불가)
+        if not is_password_usable(user.password_hash):
+            raise ValueError("닉네임 또는 비밀번호가 일치하지 않습니다")
+        if not await verify_password_async(login_data.password, user.password_hash):
             raise ValueError("닉네임 또는 비밀번호가 일치하지 않습니다")
 
-        # 세션 토큰 생성
-        session_token = self._generate_session_token()
-        user.session_token = session_token
-        user.session_created_at = datetime.now(timezone.utc)
-        await self.user_repo.update(user)
-
-        return user
-
-    async def create_anonymous_user(self, user_data: AnonymousUserCreate) -> User:
-        """익명 사용자 생성 (기존 방식 - 하위 호환성)"""
-        session_token = self._generate_session_token()
+        session_token, = await self._start_sessions([user])
+        return user, session_token
 
-        # 임시 비밀번호 생성 (익명 사용자용)
-        temp_password = secrets.token_urlsafe(16)
-        password_hash_value = hash_password(temp_password)
+    async def create_anonymous_user(self, user_data: AnonymousUserCreate) -> Tuple[User, str]:
+        """
+        익명 사용자 생성 (기존 방식 - 하위 호환성)
 
+        Returns:
+            (사용자, 세션 토큰)
+        """
+        # 익명 사용자는 비밀번호 로그인이 불가능하므로 해싱 없이 표식만 저장
         new_user = User(
             nickname=user_data.nickname,
-            password_hash=password_hash_value,
-            session_token=session_token,
-            session_created_at=datetime.now(timezone.utc),
+            password_hash=UNUSABLE_PASSWORD,
+            session_token=None,
         )
+        new_user = await self.user_repo.create(new_user)
+        get_nickname_index().add(new_user.nickname)
 
-        return await self.user_repo.create(new_user)
+        session_token, = await self._start_sessions([new_user])
+        return new_user, session_token
+
+    async def create_anonymous_users(
+        self,
+        batch_data: AnonymousUserBatchCreate,
+    ) -> Tuple[List[Tuple[User, str]], List[str]]:
+        """
+        익명 사용자 일괄 생성 (사용자/세션 각각 단일 INSERT)
+
+        Returns:
+            ([(생성된 사용자, 세션 토큰)], 이미 사용 중이라 건너뛴 닉네임 목록)
+        """
+        nicknames = list(dict.fromkeys(batch_data.nicknames))
+        created = await self.user_repo.create_many_skip_existing([
+            {
+                "nickname": nickname,
+                "password_hash": UNUSABLE_PASSWORD,
+            }
+            for nickname in nicknames
+        ])
+
+        nickname_index = get_nickname_index()
+        for nickname in nicknames:
+            nickname_index.add(nickname)
+
+        order = {nickname: index for index, nickname in enumerate(nicknames)}
+        created.sort(key=lambda user: order[user.nickname])
+        tokens = await self._start_sessions(created)
+
+        created_nicknames = {user.nickname for user in created}
+        skipped = [nickname for nickname in nicknames if nickname not in created_nicknames]
+        return list(zip(created, tokens)), skipped
 
     async def validate_session(self, session_token: str) -> Optional[User]:
-        """세션 토큰 검증"""
-        user = await self.user_repo.get_by_session_token(session_token)
+        """
+        세션 토큰 검증
+        - 캐시 적중 시 DB 조회 없이 사용자 스냅샷 반환 (세션에 연결되지 않은 객체)
+        - 서명 토큰 모드에서는 서명/만료/폐기 여부를 메모리에서 검증
+        - 만료된 세션은 조회에서 제외만 하고 삭제는 정리 작업(session_sweeper)이 담당
+        """
+        if _signed_mode() and is_signed_token(session_token):
+            return await self._validate_signed_token(session_token)
 
-        if not user:
+        token_hash = hash_session_token(session_token)
+        session_cache = get_session_cache()
+        user_id = session_cache.get(token_hash)
+        if user_id is not None:
+            snapshot = get_user_snapshot_cache().get(user_id)
+            if snapshot is not None:
+                return User(**snapshot)
+
+        now = datetime.now(timezone.utc)
+        found = await self.session_repo.get_active_with_user(token_hash, now)
+        if not found:
+            return None
+        session, user = found
+
+        if now - session.last_seen_at >= SESSION_LAST_SEEN_RESOLUTION:
+            await self.session_repo.touch(session.id, now)
+
+        # 캐시 항목은 세션 만료 시각을 넘기지 않음
+        remaining_seconds = (session.expires_at - now).total_seconds()
+        session_cache.set(
+            token_hash,
+            user.id,
+            ttl_seconds=min(settings.SESSION_CACHE_TTL_SECONDS, remaining_seconds),
+        )
+        get_user_snapshot_cache().set(user.id, _user_snapshot(user))
+        return user
+
+    async def _validate_signed_token(self, session_token: str) -> Optional[User]:
+        """서명 토큰 검증 (캐시 미스 시에만 사용자 조회)"""
+        try:
+            payload = decode_signed_token(session_token, settings.JWT_SECRET_KEY, settings.JWT_ALGORITHM)
+            user_id = int(payload["sub"])
+            version = int(payload.get("ver", 0))
+        except (ValueError, KeyError, TypeError):
             return None
 
-        # 세션 만료 체크 (설정된 시간 기준)
-        session_start = user.session_created_at or user.created_at
-        session_expire_time = session_start + timedelta(hours=settings.SESSION_EXPIRE_HOURS)
-        now = datetime.now(session_start.tzinfo or timezone.utc)
-        if now > session_expire_time:
-            user.session_token = None
-            user.session_created_at = None
-            await self.user_repo.update(user)
+        revocation_list = get_token_revocation_list()
+        if revocation_list.is_revoked(user_id, version):
             return None
 
+        snapshot_cache = get_user_snapshot_cache()
+        snapshot = snapshot_cache.get(user_id)
+        if snapshot is not None:
+            # 다른 프로세스의 폐기가 아직 동기화되지 않았어도 캐시된 버전이 더 높으면 거부
+            if snapshot["token_version"] > version:
+                revocation_list.set_version(user_id, snapshot["token_version"])
+                return None
+            return User(**snapshot)
+
+        user = await self.user_repo.get_by_id(user_id)
+        if not user:
+            return None
+        if user.token_version > version:
+            revocation_list.set_version(user.id, user.token_version)
+            return None
+
+        snapshot_cache.set(user.id, _user_snapshot(user))
         return user
 
+    async def logout(self, user_id: int, session_token: str, all_devices: bool = False) -> None:
+        """
+        로그아웃
+        - 현재 기기 세션만 종료 (all_devices=True면 모든 기기)
+        - 서명 토큰은 개별 폐기가 불가능하므로 토큰 버전을 올려 해당 사용자의 서명 토큰 전체 폐기
+        """
+        if all_devices:
+            token_hashes = await self.session_repo.delete_by_user_id(user_id)
+            invalidate_session_cache(*token_hashes)
+        elif not is_signed_token(session_token):
+            token_hash = hash_session_token(session_token)
+            await self.session_repo.delete_by_token_hash(token_hash)
+            invalidate_session_cache(token_hash)
+
+        if all_devices or is_signed_token(session_token):
+            version = await self.user_repo.increment_token_version(user_id)
+            if version is not None:
+                get_token_revocation_list().set_version(user_id, version)
+            invalidate_user_snapshot_cache(user_id)
+
     async def update_user(self, user_id: int, update_data: UserUpdate) -> Optional[User]:
         """사용자 정보 업데이트"""
         user = await self.user_repo.get_by_id(user_id)
@@ -98,13 +290,17 @@ class AuthService:
 
         # 닉네임 변경 시 중복 체크
         if update_data.nickname and update_data.nickname != user.nickname:
-            existing_user = await self.user_repo.get_by_nickname(update_data.nickname)
-            if existing_user:
+            if not await self.is_nickname_available(update_data.nickname):
+                raise ValueError("이미 사용 중인 닉네임입니다")
+            # 블룸 필터는 다른 프로세스의 변경을 늦게 반영하므로 유니크 인덱스 충돌로 최종 확인
+            if not await self.user_repo.rename(user, update_data.nickname):
+                get_nickname_index().add(update_data.nickname)
                 raise ValueError("이미 사용 중인 닉네임입니다")
-            user.nickname = update_data.nickname
+            get_nickname_index().add(update_data.nickname)
 
         # 선호 언어 업데이트
         if update_data.preferred_language:
             user.preferred_language = update_data.preferred_language
 
+        invalidate_user_snapshot_cache(user.id)
         return await self.user_repo.update(user)
@@ -1,10 +1,13 @@
-from typing import Optional, List
+from datetime import datetime
+from typing import Optional, Dict, Any, AsyncIterator, Tuple
 from fastapi import HTTPException, status
 
+from app.core.hot_score_refresher import get_hot_score_refresher
 from app.models.comment import Comment
 from app.repositories.comment_repository import CommentRepository
 from app.repositories.post_repository import PostRepository
-from app.schemas.comment_schema import CommentCreate
+from app.schemas.comment_schema import CommentCreate, CommentResponse
+from app.utils.cursor import encode_cursor, decode_cursor
 
 
 class CommentService:
@@ -38,16 +41,65 @@ class CommentService:
             is_anonymous=comment_data.is_anonymous,
         )
 
-        return await self.comment_repo.create(new_comment)
+        comment = await self.comment_repo.create(new_comment)
+        await self.post_repo.adjust_comment_count(post_id, 1)
+        self.post_repo.run_after_commit(get_hot_score_refresher().mark, post_id)
+        return comment
 
     async def get_comments_by_post(
         self,
         post_id: int,
         skip: int = 0,
-        limit: int = 100
-    ) -> List[Comment]:
-        """게시글별 댓글 목록 조회"""
-        return await self.comment_repo.get_by_post_id(post_id, skip, limit)
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """게시글별 댓글 목록 조회
+        - cursor가 있으면 키셋 페이지네이션 (skip 무시)
+        """
+        decoded_cursor = None
+        if cursor is not None:
+            try:
+                decoded_cursor = decode_cursor(cursor)
+            except ValueError:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Invalid cursor"
+                )
+            skip = 0
+
+        # 다음 페이지 존재 여부 확인을 위해 1건 더 조회
+        comments = await self.comment_repo.get_by_post_id(post_id, skip, limit + 1, decoded_cursor)
+
+        next_cursor = None
+        if len(comments) > limit:
+            comments = comments[:limit]
+            last_comment = comments[-1]
+            next_cursor = encode_cursor(last_comment.created_at, last_comment.id)
+
+        return {
+            "comments": comments,
+            "next_cursor": next_cursor,
+        }
+
+    async def ensure_post_exists(self, post_id: int) -> None:
+        """게시글이 없으면 404 (스트리밍 응답 시작 전 확인용)"""
+        if not await self.post_repo.exists(post_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Post not found"
+            )
+
+    async def stream_comments_ndjson(self, post_id: int) -> AsyncIterator[bytes]:
+        """게시글별 전체 댓글을 NDJSON 줄 단위로 생성 (메모리 사용량 일정)"""
+        async for row in self.comment_repo.stream_by_post_id(post_id):
+            yield CommentResponse.model_validate(dict(row)).model_dump_json().encode() + b"\n"
+
+    async def get_comments_version(
+        self,
+        post_id: int,
+    ) -> Tuple[int, Optional[datetime]]:
+        """게시글별 댓글 목록 버전 조회 (ETag / Last-Modified 생성용)"""
+        return await self.post_repo.get_comments_version(post_id)
 
     async def update_comment(
         self,
@@ -68,7 +120,9 @@ class CommentService:
             )
 
         comment.content = content
-        return await self.comment_repo.update(comment)
+        updated = await self.comment_repo.update(comment)
+        await self.post_repo.touch_comments(comment.post_id)
+        return updated
 
     async def delete_comment(self, comment_id: int, user_id: int, post_id: int) -> bool:
         """댓글 삭제 (작성자만 가능)"""
@@ -86,4 +140,8 @@ class CommentService:
                 detail="You don't have permission to delete this comment"
             )
 
-        return await self.comment_repo.delete(comment_id)
+        deleted = await self.comment_repo.delete(comment_id)
+        if deleted:
+            await self.post_repo.adjust_comment_count(post_id, -1)
+            self.post_repo.run_after_commit(get_hot_score_refresher().mark, post_id)
+        return deleted
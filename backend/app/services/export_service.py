@@ -0,0 +1,109 @@
+import json
+import zlib
+from datetime import datetime
+from typing import Any, AsyncIterator, Mapping, Optional, Sequence
+
+from app.core.database import AsyncSessionLocal
+from app.repositories.comment_repository import CommentRepository
+from app.repositories.post_repository import PostRepository
+from app.repositories.reaction_repository import ReactionRepository
+
+EXPORT_TYPES = ("posts", "comments", "reactions")
+EXPORT_CHUNK_BYTES = 64 * 1024  # 응답으로 내보낼 최소 청크 크기
+EXPORT_BATCH_SIZE = 1000  # 서버 측 커서에서 한 번에 가져올 행 수
+
+
+def _json_default(value: Any) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _ndjson_line(record_type: str, row: Mapping[str, Any]) -> bytes:
+    return json.dumps(
+        {"type": record_type, **row},
+        default=_json_default,
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode() + b"\n"
+
+
+class ExportService:
+    def __init__(
+        self,
+        post_repo: PostRepository,
+        comment_repo: CommentRepository,
+        reaction_repo: ReactionRepository,
+    ):
+        self.post_repo = post_repo
+        self.comment_repo = comment_repo
+        self.reaction_repo = reaction_repo
+
+    async def _rows(
+        self,
+        types: Sequence[str],
+        since: Optional[datetime],
+        reactions_after_id: Optional[int],
+    ) -> AsyncIterator[bytes]:
+        if "posts" in types:
+            async for row in self.post_repo.stream_for_export(since, EXPORT_BATCH_SIZE):
+                yield _ndjson_line("post", row)
+        if "comments" in types:
+            async for row in self.comment_repo.stream_for_export(since, EXPORT_BATCH_SIZE):
+                yield _ndjson_line("comment", row)
+        if "reactions" in types:
+            async for row in self.reaction_repo.stream_for_export(reactions_after_id, EXPORT_BATCH_SIZE):
+                yield _ndjson_line("reaction", row)
+
+    async def stream_ndjson(
+        self,
+        types: Sequence[str] = EXPORT_TYPES,
+        since: Optional[datetime] = None,
+        reactions_after_id: Optional[int] = None,
+        compress: bool = False,
+    ) -> AsyncIterator[bytes]:
+        """
+        게시글/댓글/반응을 NDJSON으로 생성 (한 줄에 레코드 하나, "type" 필드로 구분)
+        - 서버 측 커서로 배치 조회하므로 전체 크기와 무관하게 메모리 사용량 일정
+        - compress=True면 gzip 스트림으로 압축
+        """
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS) if compress else None
+        buffer = bytearray()
+
+        async for line in self._rows(types, since, reactions_after_id):
+            buffer += line
+            if len(buffer) < EXPORT_CHUNK_BYTES:
+                continue
+            chunk = compressor.compress(bytes(buffer)) if compressor else bytes(buffer)
+            buffer.clear()
+            if chunk:
+                yield chunk
+
+        tail = bytes(buffer)
+        if compressor:
+            tail = compressor.compress(tail) + compressor.flush()
+        if tail:
+            yield tail
+
+
+async def export_ndjson(
+    types: Sequence[str] = EXPORT_TYPES,
+    since: Optional[datetime] = None,
+    reactions_after_id: Optional[int] = None,
+    compress: bool = False,
+) -> AsyncIterator[bytes]:
+    """
+    별도 세션으로 내보내기 스트림 생성
+    - 읽기 전용 REPEATABLE READ 트랜잭션이라 여러 테이블이 같은 스냅샷 기준으로 내보내짐
+    """
+    async with AsyncSessionLocal() as session:
+        await session.connection(
+            execution_options={"isolation_level": "REPEATABLE READ", "postgresql_readonly": True}
+        )
+        export_service = ExportService(
+            PostRepository(session),
+            CommentRepository(session),
+            ReactionRepository(session),
+        )
+        async for chunk in export_service.stream_ndjson(types, since, reactions_after_id, compress):
+            yield chunk
@@ -3,15 +3,28 @@
 GPT-4o Vision 기반 OCR + 번역 + 설명 서비스
 """
 from openai import AsyncOpenAI
+import asyncio
 import base64
-from typing import Dict, Optional
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional
 import logging
 import os
 from dotenv import load_dotenv
 
+from app.core.config import settings
+from app.core.image_preprocessor import get_image_preprocessor
+from app.core.ocr_cache import get_ocr_cache, make_ocr_cache_key
+from app.utils.incremental_json import IncrementalJSONParser
+
 load_dotenv()
 logger = logging.getLogger(__name__)
 
+OPENAI_TIMEOUT_SECONDS = 90.0
+
+
+class OCRAnalysisError(Exception):
+    """문서 분석 실패 (fallback_to_mock=False일 때)"""
+
 
 class GPTVisionService:
     """GPT-4o Vision을 사용한 문서 분석 서비스"""
@@ -19,6 +32,7 @@ class GPTVisionService:
     _instance = None
     _client = None
     _use_mock = False
+    _upstream_slots = None
     
     def __new__(cls):
         if cls._instance is None:
@@ -27,6 +41,8 @@ class GPTVisionService:
     
     def __init__(self):
         """OpenAI 클라이언트 초기화"""
+        if self._upstream_slots is None:
+            GPTVisionService._upstream_slots = asyncio.Semaphore(settings.OCR_JOB_MAX_WORKERS)
         if self._client is None:
             api_key = os.getenv("OPENAI_API_KEY")
             use_mock = os.getenv("USE_MOCK_OCR", "false").lower() == "true"
@@ -42,32 +58,23 @@ class GPTVisionService:
                     logger.warning(f"⚠️ OpenAI 초기화 실패. Mock 모드로 전환: {str(e)}")
                     self._use_mock = True
     
-    async def analyze_document(
-        self,
-        image_data: bytes,
-        source_lang: str = "ko",
-        target_lang: str = "vi"
-    ) -> Dict[str, any]:
-        """문서 이미지 분석: 텍스트 추출 + 번역 + 설명"""
+    @staticmethod
+    def _build_prompt(source_lang: str, target_lang: str) -> str:
+        """
+        문서 분석 프롬프트 (응답은 JSON 객체 하나)
+        - 스트리밍 시 짧은 필드(문서 종류, 요약)가 먼저 도착하도록 긴 텍스트 앞에 배치
+        """
+        lang_names = {
+            "ko": "한국어",
+            "vi": "베트남어",
+            "en": "영어",
+            "ne": "네팔어"
+        }
         
-        if self._use_mock:
-            logger.info("🔧 Mock 모드로 문서 분석 (테스트용)")
-            return self._get_mock_result(source_lang, target_lang)
+        source_name = lang_names.get(source_lang, "한국어")
+        target_name = lang_names.get(target_lang, "베트남어")
         
-        try:
-            base64_image = base64.b64encode(image_data).decode('utf-8')
-            
-            lang_names = {
-                "ko": "한국어",
-                "vi": "베트남어",
-                "en": "영어",
-                "ne": "네팔어"
-            }
-            
-            source_name = lang_names.get(source_lang, "한국어")
-            target_name = lang_names.get(target_lang, "베트남어")
-            
-            prompt = f"""
+        prompt = f"""
 이 이미지를 분석해주세요:
 
 1. **문서 종류 파악**: 이 문서가 무엇인지 식별 (예: 근로계약서, 비자 신청서, 임금명세서 등)
@@ -88,9 +95,9 @@ class GPTVisionService:
 다음 JSON 형식으로 응답해주세요:
 {{
     "document_type": "문서 종류",
+    "summary": "{target_name}로 작성된 요약",
     "original_text": "{source_name} 원문",
     "translated_text": "{target_name} 번역문",
-    "summary": "{target_name}로 작성된 요약",
     "key_info": {{
         "company": "회사명 (있다면)",
         "date": "날짜 (있다면)",
@@ -102,62 +109,148 @@ class GPTVisionService:
 
 **중요**: 반드시 위 JSON 형식만 출력하고, 다른 설명은 추가하지 마세요.
 """
-            
-            logger.info("🔄 GPT-4o API 호출 시작...")
-            
-            # 👈 중복된 초기화 라인 삭제, timeout 중복 제거
-            response = await self._client.chat.completions.create(
-                model="gpt-4o",
-                messages=[
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": prompt
-                            },
-                            {
-                                "type": "image_url",
-                                "image_url": {
-                                    "url": f"data:image/jpeg;base64,{base64_image}",
-                                    "detail": "high"
-                                }
-                            }
-                        ]
-                    }
-                ],
-                max_tokens=2000,
-                temperature=0.2,
-                timeout=90.0
+        return prompt
+
+    async def analyze_document(
+        self,
+        image_data: bytes,
+        source_lang: str = "ko",
+        target_lang: str = "vi",
+        fallback_to_mock: bool = True
+    ) -> Dict[str, any]:
+        """
+        문서 이미지 분석: 텍스트 추출 + 번역 + 설명
+
+        Raises:
+            OCRAnalysisError: fallback_to_mock=False이고 GPT 호출이 실패한 경우
+        """
+        result = None
+        async for event in self.stream_document(image_data, source_lang, target_lang, fallback_to_mock):
+            if event["event"] == "result":
+                result = event["data"]
+            elif event["event"] == "error":
+                if not fallback_to_mock:
+                    raise OCRAnalysisError(event["detail"])
+                # 부분 결과를 받은 뒤 실패 (호출자에게 전달된 부분 결과가 없으므로 기존처럼 Mock 반환)
+                logger.info("🔧 에러 발생으로 Mock 데이터 반환")
+                result = self._get_mock_result(source_lang, target_lang)
+        return result
+
+    async def stream_document(
+        self,
+        image_data: bytes,
+        source_lang: str = "ko",
+        target_lang: str = "vi",
+        fallback_to_mock: bool = True
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        문서 이미지 분석 (스트리밍)
+
+        이벤트:
+        - {"event": "delta", "field", "text"}: 문자열 필드의 새로 도착한 부분
+        - {"event": "field", "field", "value"}: 완성된 필드
+        - {"event": "result", "data"}: 최종 결과 (analyze_document 반환값과 동일)
+        - {"event": "error", "detail"}: 부분 결과를 보낸 뒤 실패했거나 fallback_to_mock=False일 때 실패
+        마지막 이벤트는 항상 result 또는 error
+        """
+        if self._use_mock:
+            logger.info("🔧 Mock 모드로 문서 분석 (테스트용)")
+            for event in self._replay(self._get_mock_result(source_lang, target_lang)):
+                yield event
+            return
+
+        # 같은 이미지/언어 조합은 캐시된 결과 재사용
+        cache = get_ocr_cache()
+        cache_key = make_ocr_cache_key(image_data, source_lang, target_lang) if cache else None
+        if cache:
+            cached = await cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"⚡ OCR 캐시 적중: {cached.get('document_type', 'Unknown')}")
+                for event in self._replay(cached):
+                    yield event
+                return
+
+        result_parts = []
+        streamed = False
+        try:
+            # 회전/축소/재인코딩으로 전송 크기와 토큰 비용 절감
+            prepared = await get_image_preprocessor().prepare(image_data)
+            base64_image = base64.b64encode(prepared.data).decode('utf-8')
+            logger.info(
+                f"🖼️ 이미지 전처리: {prepared.original_bytes} → {len(prepared.data)} bytes "
+                f"({prepared.width}x{prepared.height}, detail={prepared.detail})"
             )
-            
+
+            # 동기/스트리밍/작업 큐 모든 경로의 GPT-4o 동시 호출 수 제한
+            async with self._upstream_slots:
+                logger.info("🔄 GPT-4o API 호출 시작...")
+
+                stream = await self._client.chat.completions.create(
+                    model="gpt-4o",
+                    messages=[
+                        {
+                            "role": "user",
+                            "content": [
+                                {
+                                    "type": "text",
+                                    "text": self._build_prompt(source_lang, target_lang)
+                                },
+                                {
+                                    "type": "image_url",
+                                    "image_url": {
+                                        "url": f"data:{prepared.mime_type};base64,{base64_image}",
+                                        "detail": prepared.detail
+                                    }
+                                }
+                            ]
+                        }
+                    ],
+                    max_tokens=2000,
+                    temperature=0.2,
+                    timeout=OPENAI_TIMEOUT_SECONDS,
+                    stream=True
+                )
+
+                # 코드 펜스는 파서가 건너뛰고, 필드가 완성되는 대로 전달
+                parser = IncrementalJSONParser()
+                deadline = time.monotonic() + OPENAI_TIMEOUT_SECONDS
+                try:
+                    async for chunk in stream:
+                        if time.monotonic() > deadline:
+                            raise TimeoutError("GPT-4o 응답 시간 초과")
+                        if not chunk.choices or not chunk.choices[0].delta.content:
+                            continue
+                        text = chunk.choices[0].delta.content
+                        result_parts.append(text)
+                        for kind, field_name, value in parser.feed(text):
+                            streamed = True
+                            if kind == "delta":
+                                yield {"event": "delta", "field": field_name, "text": value}
+                            else:
+                                yield {"event": "field", "field": field_name, "value": value}
+                finally:
+                    await stream.close()
+
             logger.info("✅ GPT-4o API 응답 받음")
-            
-            result_text = response.choices[0].message.content
-            
-            import json
-            
-            if "```json" in result_text:
-                result_text = result_text.split("```json")[1].split("```")[0].strip()
-            elif "```" in result_text:
-                result_text = result_text.split("```")[1].split("```")[0].strip()
-            
-            result = json.loads(result_text)
-            
+
+            result = parser.finish()
             result["confidence"] = 0.95
             result["source_lang"] = source_lang
             result["target_lang"] = target_lang
             
             logger.info(f"✅ 문서 분석 완료: {result.get('document_type', 'Unknown')}")
+
+            # 정상 응답만 캐시 (파싱 실패/Mock 결과는 제외)
+            if cache:
+                await cache.set(cache_key, result)
             
-            return result
-            
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             logger.error(f"❌ JSON 파싱 실패: {str(e)}")
-            return {
+            result_text = "".join(result_parts)
+            result = {
                 "document_type": "분석 완료",
-                "original_text": result_text if 'result_text' in locals() else "",
-                "translated_text": result_text if 'result_text' in locals() else "",
+                "original_text": result_text,
+                "translated_text": result_text,
                 "summary": "문서를 분석했습니다",
                 "key_info": {},
                 "confidence": 0.90,
@@ -166,8 +259,24 @@ class GPTVisionService:
             }
         except Exception as e:
             logger.error(f"❌ GPT Vision 분석 실패: {str(e)}")
+            if streamed or not fallback_to_mock:
+                # 실제 부분 결과가 이미 전달됐으므로 테스트용 데이터로 바꾸지 않고 실패로 종료
+                yield {"event": "error", "detail": "문서 분석 실패"}
+                return
             logger.info("🔧 에러 발생으로 Mock 데이터 반환")
-            return self._get_mock_result(source_lang, target_lang)
+            result = self._get_mock_result(source_lang, target_lang)
+
+        yield {"event": "result", "data": result}
+
+    @staticmethod
+    def _replay(result: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """완성된 결과를 스트리밍 이벤트로 변환 (캐시/Mock)"""
+        events = [
+            {"event": "field", "field": field_name, "value": value}
+            for field_name, value in result.items()
+        ]
+        events.append({"event": "result", "data": result})
+        return events
     
     def _get_mock_result(self, source_lang: str, target_lang: str) -> Dict[str, any]:
         """Mock 결과 반환 (테스트용)"""
@@ -7,10 +7,12 @@ from uuid import uuid4
 
 from fastapi import HTTPException, UploadFile, status
 
+from app.core.cache import invalidate_feed_cache
 from app.core.config import settings
 from app.models.post_image import PostImage
 from app.repositories.post_image_repository import PostImageRepository
 from app.repositories.post_repository import PostRepository
+from app.utils.sort_order import SORT_ORDER_GAP, plan_sort_orders
 
 
 class PostImageService:
@@ -51,7 +53,7 @@ class PostImageService:
             )
 
         existing_images = await self.post_image_repo.get_by_post_id(post_id)
-        start_order = len(existing_images)
+        start_order = existing_images[-1].sort_order + SORT_ORDER_GAP if existing_images else 0
         urls: List[str] = []
 
         for upload_file in files:
@@ -76,6 +78,56 @@ class PostImageService:
             post.image_url = urls[0]
             await self.post_repo.update(post)
 
+        self.post_repo.run_after_commit(invalidate_feed_cache, post.category_id)
+        return images
+
+    async def reorder_image(
+        self,
+        post_id: int,
+        user_id: int,
+        image_id: int,
+        position: int,
+    ) -> List[PostImage]:
+        """
+        이미지 순서 변경 (작성자만 가능)
+        - 이웃 sort_order 사이 값을 사용해 보통 이동한 이미지 한 행만 갱신
+        """
+        post = await self.post_repo.get_by_id(post_id)
+        if not post:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Post not found",
+            )
+
+        if post.user_id != user_id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You don't have permission to reorder images for this post",
+            )
+
+        images = list(post.images)
+        image = next((image for image in images if image.id == image_id), None)
+        if image is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Image not found",
+            )
+
+        images.remove(image)
+        position = min(position, len(images))
+        images.insert(position, image)
+
+        current_orders = [other.sort_order if other is not image else None for other in images]
+        for target, order in zip(images, plan_sort_orders(current_orders)):
+            if target.sort_order != order:
+                target.sort_order = order
+
+        post.images = images
+        if post.image_url != images[0].url:
+            post.image_url = images[0].url
+        await self.post_repo.update(post)
+
+        self.post_repo.run_after_commit(invalidate_feed_cache, post.category_id)
         return images
 
     async def _save_upload_file(self, upload_file: UploadFile, destination: Path) -> None:
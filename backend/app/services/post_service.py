@@ -1,13 +1,31 @@
+from collections import defaultdict, deque
+from datetime import datetime, timezone
 from typing import Optional, Dict, Any, List
 from fastapi import HTTPException, status
+from sqlalchemy.orm.attributes import set_committed_value
 import math
 
+from app.core.cache import get_feed_cache, invalidate_feed_cache
+from app.core.config import settings
+from app.core.hot_score_refresher import get_hot_score_refresher
+from app.core.view_count_buffer import get_view_count_buffer
 from app.models.post import Post
+from app.models.post_image import PostImage
 from app.repositories.post_repository import PostRepository
 from app.repositories.post_image_repository import PostImageRepository
 from app.repositories.reaction_repository import ReactionRepository
-from app.models.reaction import Reaction
-from app.schemas.post_schema import PostCreate, PostUpdate
+from app.repositories.category_post_count_repository import CategoryPostCountRepository
+from app.schemas.post_schema import PostCreate, PostUpdate, PostListResponse
+from app.utils.cursor import (
+    encode_cursor,
+    decode_cursor,
+    encode_score_cursor,
+    decode_score_cursor,
+    encode_search_cursor,
+    decode_search_cursor,
+)
+from app.utils.hot_score import compute_hot_score
+from app.utils.sort_order import plan_sort_orders
 
 
 class PostService:
@@ -16,10 +34,12 @@ class PostService:
         post_repo: PostRepository,
         post_image_repo: PostImageRepository,
         reaction_repo: ReactionRepository,
+        post_count_repo: CategoryPostCountRepository,
     ):
         self.post_repo = post_repo
         self.post_image_repo = post_image_repo
         self.reaction_repo = reaction_repo
+        self.post_count_repo = post_count_repo
 
     def _normalize_image_urls(
         self,
@@ -32,6 +52,29 @@ class PostService:
             return [image_url] if image_url else []
         return None
 
+    def _sync_images(self, post: Post, urls: List[str]) -> None:
+        """
+        게시글 이미지를 urls 순서로 맞춤 (변경분만 반영)
+        - 유지되는 이미지는 재사용하고, 추가/삭제/순서 변경된 행만 flush 시 기록
+        """
+        available: Dict[str, deque] = defaultdict(deque)
+        for image in post.images:
+            available[image.url].append(image)
+
+        matched = [available[url].popleft() if available[url] else None for url in urls]
+        orders = plan_sort_orders([image.sort_order if image else None for image in matched])
+
+        images = []
+        for url, image, order in zip(urls, matched, orders):
+            if image is None:
+                image = PostImage(url=url, sort_order=order)
+            elif image.sort_order != order:
+                image.sort_order = order
+            images.append(image)
+
+        # 목록에서 빠진 이미지는 delete-orphan으로 삭제됨
+        post.images = images
+
     async def create_post(self, user_id: int, post_data: PostCreate) -> Post:
         """게시글 생성"""
         normalized_urls = self._normalize_image_urls(
@@ -49,9 +92,13 @@ class PostService:
             content=post_data.content,
             image_url=primary_image,
             is_anonymous=post_data.is_anonymous,
+            # 참여도 0 기준 초기 인기 점수 (이후 hot_score_refresher가 갱신)
+            hot_score=compute_hot_score(0, 0, 0, datetime.now(timezone.utc)),
         )
 
         post = await self.post_repo.create(new_post)
+        await self.post_count_repo.adjust(post.category_id, 1)
+        self.post_repo.run_after_commit(invalidate_feed_cache, post.category_id)
 
         if normalized_urls:
             images = await self.post_image_repo.create_many(post.id, normalized_urls)
@@ -60,31 +107,78 @@ class PostService:
         return post
 
     async def get_post_by_id(self, post_id: int, increment_view: bool = False) -> Optional[Post]:
-        """게시글 조회 (선택적 조회수 증가)"""
+        """게시글 조회 (선택적 조회수 증가)
+        - 조회수는 버퍼에 누적 후 주기적으로 DB에 반영
+        """
         post = await self.post_repo.get_by_id(post_id)
 
         if post and increment_view:
-            updated_count = await self.post_repo.increment_view_count(post_id)
-            if updated_count is not None:
-                post.view_count = updated_count
+            view_count_buffer = get_view_count_buffer()
+            view_count_buffer.add(post_id)
+            # 응답에는 미반영 증가분 포함 (세션 변경 추적 없이 설정)
+            set_committed_value(
+                post,
+                "view_count",
+                post.view_count + view_count_buffer.pending(post_id),
+            )
 
         return post
 
+    async def get_posts_by_ids(self, post_ids: List[int]) -> List[Post]:
+        """게시글 일괄 조회 (요청 순서 유지, 없는 게시글은 제외, 조회수 증가 없음)"""
+        posts = await self.post_repo.get_by_ids(post_ids)
+        posts_by_id = {post.id: post for post in posts}
+        return [posts_by_id[post_id] for post_id in post_ids if post_id in posts_by_id]
+
     async def get_posts_paginated(
         self,
         page: int = 1,
         page_size: int = 20,
-        category_id: Optional[int] = None
+        category_id: Optional[int] = None,
+        cursor: Optional[str] = None,
+        sort: str = "recent",
     ) -> Dict[str, Any]:
-        """게시글 목록 조회 (페이지네이션)"""
-        skip = (page - 1) * page_size
+        """게시글 목록 조회 (페이지네이션)
+        - cursor가 있으면 키셋 페이지네이션, 없으면 page 기반 조회
+        - sort: recent(최신순) 또는 hot(인기순)
+        - 본문은 발췌만 반환 (전체 본문은 상세 조회)
+        """
+        category_id = category_id or None
+        skip = (page - 1) * page_size if cursor is None else 0
+
+        decoded_cursor = None
+        if cursor is not None:
+            try:
+                if sort == "hot":
+                    decoded_cursor = decode_score_cursor(cursor)
+                else:
+                    decoded_cursor = decode_cursor(cursor)
+            except ValueError:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Invalid cursor"
+                )
 
-        if category_id:
-            posts = await self.post_repo.get_by_category(category_id, skip, page_size)
-            total = await self.post_repo.count_by_category(category_id)
-        else:
-            posts = await self.post_repo.get_all_ordered(skip, page_size)
-            total = await self.post_repo.count()
+        # 다음 페이지 존재 여부 확인을 위해 1건 더 조회
+        posts = await self.post_repo.get_feed_rows(
+            skip,
+            page_size + 1,
+            category_id,
+            sort,
+            decoded_cursor,
+            excerpt_length=settings.FEED_CONTENT_EXCERPT_LENGTH,
+        )
+
+        next_cursor = None
+        if len(posts) > page_size:
+            posts = posts[:page_size]
+            last_post = posts[-1]
+            if sort == "hot":
+                next_cursor = encode_score_cursor(last_post.hot_score, last_post.id)
+            else:
+                next_cursor = encode_cursor(last_post.created_at, last_post.id)
+
+        total = await self.post_count_repo.get_count(category_id)
 
         total_pages = math.ceil(total / page_size) if total > 0 else 0
 
@@ -94,6 +188,72 @@ class PostService:
             "page": page,
             "page_size": page_size,
             "total_pages": total_pages,
+            "next_cursor": next_cursor,
+        }
+
+    async def get_posts_page_json(
+        self,
+        page: int = 1,
+        page_size: int = 20,
+        category_id: Optional[int] = None,
+        cursor: Optional[str] = None,
+        sort: str = "recent",
+    ) -> bytes:
+        """게시글 목록 조회 (직렬화된 JSON, 앞쪽 페이지와 커서 페이지는 캐시 사용)"""
+        category_id = category_id or None
+        cacheable = cursor is not None or page <= settings.FEED_CACHE_MAX_PAGES
+        cache_key = (category_id, sort, page if cursor is None else 0, cursor, page_size)
+
+        feed_cache = get_feed_cache()
+        if cacheable:
+            cached = feed_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        result = await self.get_posts_paginated(page, page_size, category_id, cursor, sort)
+        body = PostListResponse.model_validate(result).model_dump_json().encode()
+
+        if cacheable:
+            feed_cache.set(cache_key, body)
+        return body
+
+    async def search_posts(
+        self,
+        query: str,
+        page_size: int = 20,
+        category_id: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """게시글 검색 (유사도순, 키셋 페이지네이션)"""
+        query = query.strip()
+        decoded_cursor = None
+        if cursor is not None:
+            try:
+                decoded_cursor = decode_search_cursor(cursor)
+            except ValueError:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Invalid cursor"
+                )
+
+        rows = await self.post_repo.search(
+            query,
+            page_size + 1,
+            category_id or None,
+            decoded_cursor,
+        )
+
+        next_cursor = None
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            last_post, last_rank = rows[-1]
+            next_cursor = encode_search_cursor(last_rank, last_post.created_at, last_post.id)
+
+        return {
+            "posts": [post for post, _ in rows],
+            "query": query,
+            "page_size": page_size,
+            "next_cursor": next_cursor,
         }
 
     async def update_post(
@@ -119,22 +279,20 @@ class PostService:
             post.title = post_data.title
         if post_data.content is not None:
             post.content = post_data.content
-        if post_data.category_id is not None:
+        if post_data.category_id is not None and post_data.category_id != post.category_id:
+            await self.post_count_repo.adjust(post.category_id, -1)
+            await self.post_count_repo.adjust(post_data.category_id, 1)
+            self.post_repo.run_after_commit(invalidate_feed_cache, post.category_id)
             post.category_id = post_data.category_id
         normalized_urls = self._normalize_image_urls(
             post_data.image_urls,
             post_data.image_url,
         )
         if normalized_urls is not None:
-            await self.post_image_repo.delete_by_post_id(post_id)
-            if normalized_urls:
-                images = await self.post_image_repo.create_many(post_id, normalized_urls)
-                post.images = images
-                post.image_url = normalized_urls[0]
-            else:
-                post.images = []
-                post.image_url = None
+            self._sync_images(post, normalized_urls)
+            post.image_url = normalized_urls[0] if normalized_urls else None
 
+        self.post_repo.run_after_commit(invalidate_feed_cache, post.category_id)
         return await self.post_repo.update(post)
 
     async def delete_post(self, post_id: int, user_id: int) -> bool:
@@ -150,38 +308,28 @@ class PostService:
                 detail="You don't have permission to delete this post"
             )
 
-        return await self.post_repo.delete(post_id)
+        deleted = await self.post_repo.delete(post_id)
+        if deleted:
+            await self.post_count_repo.adjust(post.category_id, -1)
+            self.post_repo.run_after_commit(invalidate_feed_cache, post.category_id)
+        return deleted
 
     async def toggle_like(self, post_id: int, user_id: int) -> Dict[str, Any]:
         """좋아요 토글"""
-        post = await self.post_repo.get_by_id(post_id)
+        result = await self.reaction_repo.toggle_like(post_id, user_id)
 
-        if not post:
+        if result is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Post not found"
             )
 
-        existing_reaction = await self.reaction_repo.get_by_post_user_type(
-            post_id,
-            user_id,
-            "like",
-        )
-        if existing_reaction:
-            await self.reaction_repo.delete_reaction(existing_reaction)
-            updated_count = await self.post_repo.decrement_like_count(post_id)
-            action = "Like removed"
-        else:
-            reaction = Reaction(post_id=post_id, user_id=user_id, type="like")
-            await self.reaction_repo.create(reaction)
-            updated_count = await self.post_repo.increment_like_count(post_id)
-            action = "Like added"
-
-        if updated_count is None:
-            updated_count = post.like_count
+        updated_count, liked = result
+        # 커밋 전에 표시하면 갱신 작업이 이전 상태로 계산한 뒤 표시를 지울 수 있음
+        self.post_repo.run_after_commit(get_hot_score_refresher().mark, post_id)
 
         return {
             "post_id": post_id,
             "like_count": updated_count,
-            "message": action
+            "message": "Like added" if liked else "Like removed"
         }
@@ -0,0 +1,31 @@
+# app/tasks/comment_count_reconciler.py
+"""
+게시글 댓글 수(posts.comment_count) 보정 명령
+- 사용법: python -m app.tasks.comment_count_reconciler
+"""
+import asyncio
+import logging
+
+from app.core.database import AsyncSessionLocal
+from app.repositories.post_repository import PostRepository
+
+logger = logging.getLogger(__name__)
+
+
+async def reconcile_comment_counts() -> int:
+    """댓글 수를 실제 댓글 수로 한 번 보정"""
+    async with AsyncSessionLocal() as session:
+        try:
+            corrected = await PostRepository(session).reconcile_comment_counts()
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+
+    logger.info(f"🔧 댓글 수 보정: {corrected}건")
+    return corrected
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(levelname)s:     %(message)s')
+    asyncio.run(reconcile_comment_counts())
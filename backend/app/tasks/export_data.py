@@ -0,0 +1,62 @@
+# app/tasks/export_data.py
+"""
+게시글/댓글/반응 NDJSON 내보내기 명령
+- 사용법: python -m app.tasks.export_data [--types posts,comments] [--since 2026-01-01T00:00:00+09:00] [--gzip] [-o export.ndjson.gz]
+- 출력 파일을 지정하지 않으면 stdout으로 출력
+- --since는 내용 수정(updated_at) 기준이며 조회수/좋아요/댓글 수 등 카운터 변경은 반영하지 않음
+"""
+import argparse
+import asyncio
+import logging
+import sys
+from datetime import datetime
+from typing import BinaryIO
+
+from app.services.export_service import EXPORT_TYPES, export_ndjson
+
+logger = logging.getLogger(__name__)
+
+
+async def export_data(output: BinaryIO, args: argparse.Namespace) -> int:
+    """내보내기 스트림을 output에 기록하고 기록한 바이트 수 반환"""
+    written = 0
+    async for chunk in export_ndjson(args.types, args.since, args.reactions_after_id, args.gzip):
+        output.write(chunk)
+        written += len(chunk)
+
+    logger.info(f"📦 내보내기 완료: {written} bytes")
+    return written
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="게시글/댓글/반응 NDJSON 내보내기")
+    parser.add_argument(
+        "--types",
+        type=lambda value: [item.strip() for item in value.split(",") if item.strip()],
+        default=list(EXPORT_TYPES),
+    )
+    parser.add_argument(
+        "--since",
+        type=datetime.fromisoformat,
+        default=None,
+        help="이 시각 이후 내용이 수정된 게시글/댓글만 (카운터 변경은 제외)",
+    )
+    parser.add_argument("--reactions-after-id", type=int, default=None)
+    parser.add_argument("--gzip", action="store_true")
+    parser.add_argument("-o", "--output", default=None)
+    args = parser.parse_args()
+
+    invalid = [value for value in args.types if value not in EXPORT_TYPES]
+    if not args.types or invalid:
+        parser.error(f"--types must be a comma-separated subset of {','.join(EXPORT_TYPES)}")
+    return args
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(levelname)s:     %(message)s', stream=sys.stderr)
+    args = _parse_args()
+    if args.output:
+        with open(args.output, "wb") as output:
+            asyncio.run(export_data(output, args))
+    else:
+        asyncio.run(export_data(sys.stdout.buffer, args))
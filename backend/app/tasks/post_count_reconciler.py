@@ -0,0 +1,42 @@
+# app/tasks/post_count_reconciler.py
+"""
+카테고리별 게시글 수 카운터 주기적 보정 작업
+"""
+import asyncio
+import logging
+
+from app.core.database import AsyncSessionLocal
+from app.repositories.category_post_count_repository import CategoryPostCountRepository
+
+logger = logging.getLogger(__name__)
+
+
+async def reconcile_post_counts() -> dict:
+    """카운터를 실제 게시글 수로 한 번 보정"""
+    async with AsyncSessionLocal() as session:
+        try:
+            corrections = await CategoryPostCountRepository(session).reconcile()
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+
+    if corrections:
+        logger.info(f"🔧 게시글 수 카운터 보정: {corrections}")
+    return corrections
+
+
+async def run_post_count_reconciler(interval_seconds: int) -> None:
+    """interval_seconds 간격으로 카운터 보정 반복 (태스크 취소 시 종료)"""
+    while True:
+        try:
+            await reconcile_post_counts()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"❌ 게시글 수 카운터 보정 실패: {str(e)}")
+        await asyncio.sleep(interval_seconds)
+
+
+if __name__ == "__main__":
+    asyncio.run(reconcile_post_counts())
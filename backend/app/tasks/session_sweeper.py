@@ -0,0 +1,56 @@
+# app/tasks/session_sweeper.py
+"""
+만료된 세션 정리 작업
+- batch_size개씩 나눠 삭제하고 배치마다 커밋 (긴 잠금/트랜잭션 방지)
+- 사용법: python -m app.tasks.session_sweeper
+"""
+import asyncio
+import logging
+from datetime import datetime, timezone
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.repositories.session_repository import SessionRepository
+
+logger = logging.getLogger(__name__)
+
+
+async def sweep_expired_sessions(batch_size: int) -> int:
+    """만료된 세션을 모두 삭제하고 삭제한 수 반환"""
+    now = datetime.now(timezone.utc)
+    total = 0
+    while True:
+        async with AsyncSessionLocal() as session:
+            try:
+                deleted = await SessionRepository(session).delete_expired(now, batch_size)
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+
+        total += deleted
+        if deleted < batch_size:
+            break
+        # 배치 사이에 다른 작업에 양보
+        await asyncio.sleep(0)
+
+    if total:
+        logger.info(f"🧹 만료 세션 정리: {total}건")
+    return total
+
+
+async def run_session_sweeper(interval_seconds: int, batch_size: int) -> None:
+    """interval_seconds 간격으로 만료 세션 정리 반복 (태스크 취소 시 종료)"""
+    while True:
+        try:
+            await sweep_expired_sessions(batch_size)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"❌ 만료 세션 정리 실패: {str(e)}")
+        await asyncio.sleep(interval_seconds)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(levelname)s:     %(message)s')
+    asyncio.run(sweep_expired_sessions(settings.SESSION_SWEEP_BATCH_SIZE))
@@ -0,0 +1,88 @@
+"""
+키셋(커서) 페이지네이션용 커서 인코딩/디코딩 유틸리티
+"""
+import base64
+from datetime import datetime
+from typing import List, Tuple
+
+CURSOR_SEPARATOR = "|"
+
+
+def _encode(*parts: str) -> str:
+    raw = CURSOR_SEPARATOR.join(parts)
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode(cursor: str, size: int) -> List[str]:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    raw = base64.urlsafe_b64decode(padded.encode()).decode()
+    parts = raw.split(CURSOR_SEPARATOR)
+    if len(parts) != size:
+        raise ValueError("Invalid cursor")
+    return parts
+
+
+def encode_cursor(created_at: datetime, id: int) -> str:
+    """
+    (created_at, id) 쌍을 불투명한 커서 문자열로 인코딩합니다
+
+    Returns:
+        URL-safe base64 문자열 (패딩 제거)
+    """
+    return _encode(created_at.isoformat(), str(id))
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    커서 문자열을 (created_at, id) 쌍으로 디코딩합니다
+
+    Raises:
+        ValueError: 커서 형식이 올바르지 않은 경우
+    """
+    try:
+        created_at_str, id_str = _decode(cursor, 2)
+        return datetime.fromisoformat(created_at_str), int(id_str)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def encode_score_cursor(score: float, id: int) -> str:
+    """
+    점수순 목록용 (score, id) 커서 인코딩
+    """
+    return _encode(repr(score), str(id))
+
+
+def decode_score_cursor(cursor: str) -> Tuple[float, int]:
+    """
+    점수순 목록용 커서 디코딩
+
+    Raises:
+        ValueError: 커서 형식이 올바르지 않은 경우
+    """
+    try:
+        score_str, id_str = _decode(cursor, 2)
+        return float(score_str), int(id_str)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def encode_search_cursor(rank: float, created_at: datetime, id: int) -> str:
+    """
+    검색 결과용 (rank, created_at, id) 커서 인코딩
+    """
+    return _encode(repr(rank), created_at.isoformat(), str(id))
+
+
+def decode_search_cursor(cursor: str) -> Tuple[float, datetime, int]:
+    """
+    검색 결과용 커서 디코딩
+
+    Raises:
+        ValueError: 커서 형식이 올바르지 않은 경우
+    """
+    try:
+        rank_str, created_at_str, id_str = _decode(cursor, 3)
+        return float(rank_str), datetime.fromisoformat(created_at_str), int(id_str)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
@@ -0,0 +1,42 @@
+"""
+인기(hot) 게시글 점수 계산 유틸리티
+- score = log10(max(참여도, 1)) + (작성 시각 - 기준 시각) / HOT_DECAY_SECONDS
+- 작성 시각이 점수에 고정 가산되므로 시간이 흘러도 점수를 재계산할 필요가 없고,
+  참여도(좋아요/댓글/조회수)가 바뀐 게시글만 갱신하면 됩니다.
+"""
+import math
+from datetime import datetime
+
+from sqlalchemy import Float, cast, func
+
+HOT_LIKE_WEIGHT = 3.0
+HOT_COMMENT_WEIGHT = 2.0
+HOT_VIEW_WEIGHT = 0.1
+HOT_DECAY_SECONDS = 45000.0  # 참여도 10배 = 12.5시간 최신 효과
+HOT_EPOCH_BASE = 1767225600.0  # 2026-01-01T00:00:00Z
+
+
+def compute_hot_score(
+    like_count: int,
+    view_count: int,
+    comment_count: int,
+    created_at: datetime,
+) -> float:
+    """인기 점수 계산 (hot_score_expression과 동일한 식)"""
+    engagement = (
+        like_count * HOT_LIKE_WEIGHT
+        + comment_count * HOT_COMMENT_WEIGHT
+        + view_count * HOT_VIEW_WEIGHT
+    )
+    return math.log10(max(engagement, 1.0)) + (created_at.timestamp() - HOT_EPOCH_BASE) / HOT_DECAY_SECONDS
+
+
+def hot_score_expression(like_count, view_count, comment_count, created_at):
+    """인기 점수 SQL 표현식 (compute_hot_score와 동일한 식)"""
+    engagement = (
+        like_count * HOT_LIKE_WEIGHT
+        + comment_count * HOT_COMMENT_WEIGHT
+        + view_count * HOT_VIEW_WEIGHT
+    )
+    age = cast(func.extract("epoch", created_at), Float) - HOT_EPOCH_BASE
+    return func.log(func.greatest(cast(engagement, Float), 1.0)) + age / HOT_DECAY_SECONDS
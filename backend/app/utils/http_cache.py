@@ -0,0 +1,56 @@
+"""
+HTTP 조건부 요청(ETag / Last-Modified) 유틸리티
+"""
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from typing import Any, Dict, Optional
+
+
+def make_etag(*parts: Any, weak: bool = False) -> str:
+    """
+    리소스 버전 정보로 ETag를 생성합니다
+
+    Returns:
+        "hash" 또는 W/"hash" 형식의 ETag
+    """
+    raw = "|".join(
+        part.isoformat() if isinstance(part, datetime) else str(part)
+        for part in parts
+    )
+    digest = hashlib.sha256(raw.encode()).hexdigest()[:32]
+    return f'W/"{digest}"' if weak else f'"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더와 ETag 비교 (약한 비교)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    def _opaque(tag: str) -> str:
+        tag = tag.strip()
+        return tag[2:] if tag.startswith("W/") else tag
+
+    target = _opaque(etag)
+    return any(_opaque(candidate) == target for candidate in if_none_match.split(","))
+
+
+def format_http_date(value: datetime) -> str:
+    """datetime을 HTTP 날짜 형식(RFC 7231)으로 변환"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def cache_headers(
+    etag: str,
+    cache_control: str,
+    last_modified: Optional[datetime] = None,
+) -> Dict[str, str]:
+    """조건부 요청 응답 헤더 생성"""
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_http_date(last_modified)
+    return headers
@@ -0,0 +1,122 @@
+"""
+GPT Vision 업로드 전 이미지 전처리 유틸리티
+- 디코딩 → EXIF 회전 적용 → 모델이 실제로 보는 해상도로 축소 → 재인코딩
+- GPT-4o는 high detail에서 2048x2048 안에 맞춘 뒤 짧은 변을 768px로 줄이므로 그 이상은 전송해도 버려짐
+"""
+import io
+import logging
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+logger = logging.getLogger(__name__)
+
+VISION_MAX_SIDE = 2048
+VISION_MAX_SHORT_SIDE = 768
+# 이 크기 이하면 타일 1개로 충분하므로 low detail 사용
+VISION_LOW_DETAIL_MAX_SIDE = 512
+# 회전이 필요 없는 이 크기 이하의 원본은 그대로 전송
+SMALL_IMAGE_PASSTHROUGH_BYTES = 256 * 1024
+
+# 재인코딩 없이 그대로 보낼 수 있는 형식
+_PASSTHROUGH_MIME_TYPES = {
+    "JPEG": "image/jpeg",
+    "PNG": "image/png",
+    "WEBP": "image/webp",
+}
+
+
+@dataclass(frozen=True)
+class PreparedImage:
+    data: bytes
+    mime_type: str
+    detail: str  # "low" 또는 "high"
+    width: int
+    height: int
+    original_bytes: int
+
+
+def vision_target_size(width: int, height: int) -> Tuple[int, int]:
+    """GPT Vision high detail 기준 유효 해상도 (확대하지 않음)"""
+    scale = min(1.0, VISION_MAX_SIDE / max(width, height))
+    short_side = min(width, height) * scale
+    if short_side > VISION_MAX_SHORT_SIDE:
+        scale *= VISION_MAX_SHORT_SIDE / short_side
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+
+def _detail_for(width: int, height: int) -> str:
+    return "low" if max(width, height) <= VISION_LOW_DETAIL_MAX_SIDE else "high"
+
+
+def _has_alpha(image: Image.Image) -> bool:
+    """실제로 투명한 픽셀이 있는지 (모두 불투명한 RGBA는 JPEG로 보냄)"""
+    if image.mode == "P":
+        return "transparency" in image.info
+    if image.mode in ("RGBA", "LA", "PA"):
+        return image.getchannel("A").getextrema()[0] < 255
+    return False
+
+
+def _encode(image: Image.Image, image_format: str, quality: Optional[int] = None) -> bytes:
+    buffer = io.BytesIO()
+    if quality is None:
+        image.save(buffer, format=image_format, optimize=True)
+    else:
+        image.save(buffer, format=image_format, quality=quality, optimize=True)
+    return buffer.getvalue()
+
+
+def prepare_image(data: bytes, jpeg_quality: int = 85) -> PreparedImage:
+    """
+    업로드 이미지를 GPT Vision 전송용으로 변환
+
+    - 투명도가 있으면 PNG, 그 외에는 JPEG로 재인코딩 (JPEG가 아닌 원본은 PNG와 비교해 작은 쪽)
+    - 회전이 필요 없고 원본이 작거나 재인코딩 결과보다 작으면 원본 그대로 사용
+    - Pillow가 읽지 못하는 형식이면 원본을 high detail로 전송 (기존 동작)
+    """
+    try:
+        image = Image.open(io.BytesIO(data))
+        source_format = image.format
+        target_size = vision_target_size(*image.size)
+        # EXIF 방향 태그(0x0112)가 1이 아니면 회전/반전 필요
+        rotated = image.getexif().get(0x0112, 1) != 1
+        passthrough_mime: Optional[str] = _PASSTHROUGH_MIME_TYPES.get(source_format)
+
+        # 이미 작은 파일은 디코딩/재인코딩 비용이 절감량보다 큼
+        if not rotated and passthrough_mime and len(data) <= SMALL_IMAGE_PASSTHROUGH_BYTES:
+            return PreparedImage(data, passthrough_mime, _detail_for(*target_size), *target_size, len(data))
+
+        # JPEG는 디코딩 단계에서 1/2~1/8로 줄여 읽어 메모리/시간 절약 (EXIF 회전 전이므로 긴 변 기준)
+        if source_format == "JPEG":
+            long_side = max(target_size)
+            image.draft("RGB", (long_side, long_side))
+        image.load()
+    except (UnidentifiedImageError, OSError, Image.DecompressionBombError) as e:
+        logger.warning(f"⚠️ 이미지 전처리 건너뜀 (디코딩 실패): {str(e)}")
+        return PreparedImage(data, "image/jpeg", "high", 0, 0, len(data))
+
+    image = ImageOps.exif_transpose(image)
+
+    target_size = vision_target_size(*image.size)
+    if image.size != target_size:
+        image = image.resize(target_size, Image.Resampling.LANCZOS)
+
+    if _has_alpha(image):
+        encoded, mime_type = _encode(image, "PNG"), "image/png"
+    else:
+        if image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+        encoded, mime_type = _encode(image, "JPEG", jpeg_quality), "image/jpeg"
+        # 무손실 원본(스캔/스크린샷)은 단색 영역이 많아 PNG가 더 작을 수 있음
+        if source_format != "JPEG":
+            png = _encode(image, "PNG")
+            if len(png) < len(encoded):
+                encoded, mime_type = png, "image/png"
+
+    # 축소만 필요한 경우 원본이 더 작으면 원본 전송 (모델 쪽에서 같은 해상도로 줄이므로 토큰 동일)
+    if not rotated and passthrough_mime and len(data) <= len(encoded):
+        encoded, mime_type = data, passthrough_mime
+
+    return PreparedImage(encoded, mime_type, _detail_for(*image.size), *image.size, len(data))
@@ -0,0 +1,214 @@
+"""
+스트리밍 응답용 점진적 JSON 파서
+- 최상위 JSON 객체를 조각 단위로 받아, 필드가 만들어지는 대로 이벤트로 돌려줌
+  - 문자열 값: 도착한 부분을 ("delta", 키, 텍스트)로, 끝나면 ("field", 키, 전체 값)
+  - 그 외 값(객체/배열/숫자 등): 끝난 뒤 ("field", 키, 값) 한 번
+- 객체 앞뒤의 텍스트(```json 코드 펜스 등)는 무시
+- 문자열 안의 이스케이프되지 않은 줄바꿈은 허용 (모델 출력에서 흔함)
+"""
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+ParserEvent = Tuple[str, str, Any]
+
+_BEFORE_OBJECT = "before_object"
+_EXPECT_KEY = "expect_key"
+_KEY = "key"
+_EXPECT_COLON = "expect_colon"
+_EXPECT_VALUE = "expect_value"
+_STRING_VALUE = "string_value"
+_RAW_VALUE = "raw_value"
+_AFTER_VALUE = "after_value"
+_DONE = "done"
+
+_SIMPLE_ESCAPES = {
+    '"': '"',
+    "\\": "\\",
+    "/": "/",
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+}
+_WHITESPACE = " \t\r\n"
+
+
+class IncrementalJSONParser:
+    """최상위 JSON 객체 하나를 점진적으로 파싱 (형식 오류 시 ValueError)"""
+
+    def __init__(self):
+        self.result: Dict[str, Any] = {}
+        self._state = _BEFORE_OBJECT
+        self._key: Optional[str] = None
+        self._chars: List[str] = []
+        # 문자열 디코딩 상태
+        self._escape: Optional[str] = None  # 처리 중인 이스케이프 ("" 또는 \\u 뒤 16진수)
+        self._high_surrogate: Optional[int] = None
+        # 문자열이 아닌 값의 원문 추적 상태
+        self._depth = 0
+        self._in_string = False
+        self._string_escape = False
+
+    @property
+    def done(self) -> bool:
+        return self._state == _DONE
+
+    def _decode_string_char(self, ch: str) -> Tuple[Optional[str], bool]:
+        """
+        문자열 내부 문자 하나 처리
+
+        Returns:
+            (추가할 텍스트 또는 None, 문자열 종료 여부)
+        """
+        if self._escape is not None:
+            if self._escape == "":
+                if ch == "u":
+                    self._escape = "u"
+                    return None, False
+                if ch not in _SIMPLE_ESCAPES:
+                    raise ValueError(f"Invalid escape: \\{ch}")
+                self._escape = None
+                return _SIMPLE_ESCAPES[ch], False
+
+            self._escape += ch
+            if len(self._escape) < 5:
+                return None, False
+            code = int(self._escape[1:], 16)
+            self._escape = None
+            if 0xD800 <= code < 0xDC00:
+                self._high_surrogate = code
+                return None, False
+            if 0xDC00 <= code < 0xE000 and self._high_surrogate is not None:
+                code = 0x10000 + ((self._high_surrogate - 0xD800) << 10) + (code - 0xDC00)
+            self._high_surrogate = None
+            return chr(code), False
+
+        if ch == "\\":
+            self._escape = ""
+            return None, False
+        if ch == '"':
+            return None, True
+        return ch, False
+
+    def _start_raw_value(self, ch: str) -> None:
+        self._state = _RAW_VALUE
+        self._chars = [ch]
+        self._depth = 1 if ch in "{[" else 0
+        self._in_string = ch == '"'
+        self._string_escape = False
+
+    def _finish_value(self, value: Any, events: List[ParserEvent]) -> None:
+        self.result[self._key] = value
+        events.append(("field", self._key, value))
+        self._state = _AFTER_VALUE
+
+    def _raw_value_ends_before(self, ch: str) -> bool:
+        """숫자/true/false/null 같은 스칼라 값이 ch 앞에서 끝나는지"""
+        return self._depth == 0 and not self._in_string and (ch in _WHITESPACE or ch in ",}")
+
+    def _feed_raw_value(self, ch: str) -> bool:
+        """
+        문자열이 아닌 값의 원문 누적
+
+        Returns:
+            값이 ch를 포함해 끝났으면 True
+        """
+        self._chars.append(ch)
+        if self._in_string:
+            if self._string_escape:
+                self._string_escape = False
+            elif ch == "\\":
+                self._string_escape = True
+            elif ch == '"':
+                self._in_string = False
+            return False
+
+        if ch == '"':
+            self._in_string = True
+        elif ch in "{[":
+            self._depth += 1
+        elif ch in "}]":
+            self._depth -= 1
+            return self._depth == 0
+        return False
+
+    def feed(self, chunk: str) -> List[ParserEvent]:
+        """텍스트 조각 처리 후 새로 생긴 이벤트 반환"""
+        events: List[ParserEvent] = []
+        delta: List[str] = []
+        index = 0
+
+        while index < len(chunk):
+            ch = chunk[index]
+            state = self._state
+
+            if state == _BEFORE_OBJECT:
+                if ch == "{":
+                    self._state = _EXPECT_KEY
+            elif state == _EXPECT_KEY:
+                if ch == '"':
+                    self._state = _KEY
+                    self._chars = []
+                elif ch == "}":
+                    self._state = _DONE
+                elif ch not in _WHITESPACE and not (ch == "," and self.result):
+                    raise ValueError(f"Expected object key, got {ch!r}")
+            elif state == _KEY:
+                text, closed = self._decode_string_char(ch)
+                if closed:
+                    self._key = "".join(self._chars)
+                    self._state = _EXPECT_COLON
+                elif text is not None:
+                    self._chars.append(text)
+            elif state == _EXPECT_COLON:
+                if ch == ":":
+                    self._state = _EXPECT_VALUE
+                elif ch not in _WHITESPACE:
+                    raise ValueError(f"Expected ':', got {ch!r}")
+            elif state == _EXPECT_VALUE:
+                if ch == '"':
+                    self._state = _STRING_VALUE
+                    self._chars = []
+                elif ch not in _WHITESPACE:
+                    self._start_raw_value(ch)
+                    if self._depth == 0 and ch in "}]":
+                        raise ValueError(f"Unexpected {ch!r}")
+            elif state == _STRING_VALUE:
+                text, closed = self._decode_string_char(ch)
+                if closed:
+                    if delta:
+                        events.append(("delta", self._key, "".join(delta)))
+                        delta = []
+                    self._finish_value("".join(self._chars), events)
+                elif text is not None:
+                    self._chars.append(text)
+                    delta.append(text)
+            elif state == _RAW_VALUE:
+                if self._raw_value_ends_before(ch):
+                    # 구분 문자는 다음 상태에서 다시 처리
+                    self._finish_value(json.loads("".join(self._chars)), events)
+                    continue
+                if self._feed_raw_value(ch):
+                    self._finish_value(json.loads("".join(self._chars)), events)
+            elif state == _AFTER_VALUE:
+                if ch == ",":
+                    self._state = _EXPECT_KEY
+                elif ch == "}":
+                    self._state = _DONE
+                elif ch not in _WHITESPACE:
+                    raise ValueError(f"Expected ',' or '}}', got {ch!r}")
+            else:
+                break
+
+            index += 1
+
+        if delta:
+            events.append(("delta", self._key, "".join(delta)))
+        return events
+
+    def finish(self) -> Dict[str, Any]:
+        """입력 종료 (객체가 닫히지 않았으면 ValueError)"""
+        if self._state != _DONE:
+            raise ValueError("Incomplete JSON object")
+        return self.result
@@ -8,6 +8,9 @@ PBKDF2_ALGORITHM = "pbkdf2_sha256"
 PBKDF2_ITERATIONS = 260000
 PBKDF2_SALT_BYTES = 16
 
+# 로그인할 수 없는 계정(익명 사용자)의 password_hash 값
+UNUSABLE_PASSWORD = "!"
+
 
 def hash_password(password: str) -> str:
     """
@@ -26,6 +29,19 @@ def hash_password(password: str) -> str:
     return f"{PBKDF2_ALGORITHM}${PBKDF2_ITERATIONS}${salt.hex()}${pwd_hash.hex()}"
 
 
+def is_password_usable(password_hash: str) -> bool:
+    """비밀번호 로그인이 가능한 계정인지 확인합니다"""
+    return bool(password_hash) and password_hash != UNUSABLE_PASSWORD
+
+
+def hash_session_token(session_token: str) -> str:
+    """
+    세션 토큰을 저장/조회용 해시로 변환합니다 (SHA-256 hex)
+    - 토큰 자체가 256비트 난수이므로 솔트/반복 없이 충분
+    """
+    return hashlib.sha256(session_token.encode()).hexdigest()
+
+
 def verify_password(password: str, password_hash: str) -> bool:
     """
     비밀번호를 검증합니다
@@ -0,0 +1,71 @@
+"""
+서명된 세션 토큰(JWT 호환, HMAC) 인코딩/검증 유틸리티
+"""
+import base64
+import hashlib
+import hmac
+import json
+import time
+from typing import Any, Dict
+
+HMAC_ALGORITHMS = {
+    "HS256": hashlib.sha256,
+    "HS384": hashlib.sha384,
+    "HS512": hashlib.sha512,
+}
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).decode().rstrip("=")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def _sign(signing_input: bytes, secret: str, algorithm: str) -> bytes:
+    digest = HMAC_ALGORITHMS.get(algorithm)
+    if digest is None:
+        raise ValueError(f"Unsupported algorithm: {algorithm}")
+    return hmac.new(secret.encode(), signing_input, digest).digest()
+
+
+def is_signed_token(token: str) -> bool:
+    """서명된 토큰 형식(header.payload.signature)인지 확인합니다"""
+    return token.count(".") == 2
+
+
+def encode_signed_token(payload: Dict[str, Any], secret: str, algorithm: str = "HS256") -> str:
+    """
+    payload를 서명된 토큰으로 인코딩합니다
+
+    Returns:
+        header.payload.signature 형식 문자열
+    """
+    header = _b64encode(json.dumps({"alg": algorithm, "typ": "JWT"}, separators=(",", ":")).encode())
+    body = _b64encode(json.dumps(payload, separators=(",", ":")).encode())
+    signing_input = f"{header}.{body}".encode()
+    return f"{header}.{body}.{_b64encode(_sign(signing_input, secret, algorithm))}"
+
+
+def decode_signed_token(token: str, secret: str, algorithm: str = "HS256") -> Dict[str, Any]:
+    """
+    서명과 만료 시각(exp)을 검증하고 payload를 반환합니다
+
+    Raises:
+        ValueError: 형식/서명이 올바르지 않거나 만료된 경우
+    """
+    try:
+        header, body, signature = token.split(".")
+        signing_input = f"{header}.{body}".encode()
+        if not hmac.compare_digest(_b64decode(signature), _sign(signing_input, secret, algorithm)):
+            raise ValueError("Invalid token signature")
+        if json.loads(_b64decode(header)).get("alg") != algorithm:
+            raise ValueError("Invalid token algorithm")
+        payload = json.loads(_b64decode(body))
+    except (ValueError, TypeError, UnicodeDecodeError) as e:
+        raise ValueError("Invalid token") from e
+
+    if not isinstance(payload, dict) or payload.get("exp", 0) <= time.time():
+        raise ValueError("Token expired")
+    return payload
@@ -0,0 +1,76 @@
+"""
+희소(sparse) 정렬 순서 유틸리티
+- sort_order를 SORT_ORDER_GAP 간격으로 배정해 두고, 이동 시 이웃 값 사이의 값을 사용해
+  이동한 항목 한 행만 갱신합니다. 사이 값이 없을 때만 전체를 재배정합니다.
+"""
+from typing import List, Optional
+
+SORT_ORDER_GAP = 1024
+
+
+def respace_sort_orders(count: int) -> List[int]:
+    """count개 항목의 정렬 순서를 일정 간격으로 재배정"""
+    return [index * SORT_ORDER_GAP for index in range(count)]
+
+
+def _spread(before: Optional[int], after: Optional[int], count: int) -> Optional[List[int]]:
+    """before와 after 사이에 count개 값 배정 (공간이 없으면 None)"""
+    if before is None and after is None:
+        return respace_sort_orders(count)
+    if before is None:
+        return [after - (count - index) * SORT_ORDER_GAP for index in range(count)]
+    if after is None:
+        return [before + (index + 1) * SORT_ORDER_GAP for index in range(count)]
+
+    step = (after - before) // (count + 1)
+    if step < 1:
+        return None
+    return [before + step * (index + 1) for index in range(count)]
+
+
+def _increasing_subsequence(values: List[Optional[int]]) -> List[int]:
+    """None이 아닌 값 중 가장 긴 증가 부분 수열의 인덱스"""
+    best: List[List[int]] = []
+    for index, value in enumerate(values):
+        chain: List[int] = []
+        if value is not None:
+            for previous, previous_chain in enumerate(best):
+                if values[previous] is not None and values[previous] < value and len(previous_chain) > len(chain):
+                    chain = previous_chain
+            chain = chain + [index]
+        best.append(chain)
+    return max(best, key=len, default=[])
+
+
+def plan_sort_orders(current: List[Optional[int]]) -> List[int]:
+    """
+    원하는 순서로 나열된 항목들의 새 정렬 순서를 계산합니다
+
+    Args:
+        current: 원하는 순서대로의 기존 sort_order (새 항목은 None)
+
+    Returns:
+        새 sort_order 목록 (가능한 한 많은 기존 값을 유지)
+    """
+    result: List[Optional[int]] = [None] * len(current)
+    for index in _increasing_subsequence(current):
+        result[index] = current[index]
+
+    start = 0
+    while start < len(result):
+        if result[start] is not None:
+            start += 1
+            continue
+        end = start
+        while end < len(result) and result[end] is None:
+            end += 1
+
+        before = result[start - 1] if start > 0 else None
+        after = result[end] if end < len(result) else None
+        values = _spread(before, after, end - start)
+        if values is None:
+            return respace_sort_orders(len(current))
+        result[start:end] = values
+        start = end
+
+    return result
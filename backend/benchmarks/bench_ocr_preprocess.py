@@ -0,0 +1,159 @@
+# benchmarks/bench_ocr_preprocess.py
+"""
+OCR 이미지 전처리 전후 전송 크기/지연 시간 비교
+- 기준: 원본 그대로 base64 전송 (image/jpeg, detail=high)
+- 전처리: prepare_image (EXIF 회전, 유효 해상도로 축소, 재인코딩, detail 자동 선택)
+- 지연 시간 = 전처리 시간 + 업로드 시간(--uplink-mbps 기준 추정)
+- --live 지정 시 OPENAI_API_KEY로 실제 GPT-4o 호출 시간도 측정 (max_tokens=1)
+- 사용법 (backend 디렉터리에서): python -m benchmarks.bench_ocr_preprocess [이미지 경로 ...] [--uplink-mbps 10] [--live]
+"""
+import argparse
+import asyncio
+import base64
+import io
+import math
+import os
+import random
+import time
+from typing import List, Tuple
+
+from PIL import Image, ImageDraw
+
+from app.utils.image_preprocess import (
+    VISION_LOW_DETAIL_MAX_SIDE,
+    prepare_image,
+    vision_target_size,
+)
+
+REPEATS = 3
+
+
+def synthetic_document(width: int, height: int, photo: bool) -> Image.Image:
+    """글자 줄이 있는 문서 이미지 (photo=True면 조명 그라데이션과 센서 노이즈 추가)"""
+    rng = random.Random(width * height)
+    image = Image.new("L", (width, height), 245)
+    draw = ImageDraw.Draw(image)
+    line_height = max(height // 60, 8)
+    margin = width // 12
+    for y in range(margin, height - margin, line_height * 2):
+        x = margin
+        while x < width - margin:
+            word = rng.randint(line_height, line_height * 5)
+            draw.rectangle([x, y, min(x + word, width - margin), y + line_height], fill=rng.randint(20, 60))
+            x += word + line_height // 2
+
+    if photo:
+        shade = Image.linear_gradient("L").resize((width, height)).point(lambda v: 200 + v // 5)
+        noise = Image.effect_noise((width, height), 12)
+        image = Image.blend(Image.blend(image, shade, 0.3), noise, 0.15)
+    return image.convert("RGB")
+
+
+def synthetic_samples() -> List[Tuple[str, bytes]]:
+    samples = []
+
+    # 휴대폰 촬영 (4032x3024, 세로로 찍어 EXIF 방향 6)
+    buffer = io.BytesIO()
+    exif = Image.Exif()
+    exif[0x0112] = 6
+    synthetic_document(4032, 3024, photo=True).save(buffer, format="JPEG", quality=92, exif=exif)
+    samples.append(("phone_photo_4032x3024.jpg", buffer.getvalue()))
+
+    # 스캔 문서 (A4 200dpi PNG)
+    buffer = io.BytesIO()
+    synthetic_document(1654, 2339, photo=False).save(buffer, format="PNG")
+    samples.append(("scan_a4_200dpi.png", buffer.getvalue()))
+
+    # 작은 스크린샷
+    buffer = io.BytesIO()
+    synthetic_document(480, 320, photo=False).save(buffer, format="PNG")
+    samples.append(("screenshot_480x320.png", buffer.getvalue()))
+    return samples
+
+
+def image_tokens(width: int, height: int, detail: str) -> int:
+    """GPT-4o 이미지 입력 토큰 (512px 타일당 170 + 기본 85)"""
+    if detail == "low":
+        return 85
+    width, height = vision_target_size(width, height)
+    return 85 + 170 * math.ceil(width / 512) * math.ceil(height / 512)
+
+
+def upload_ms(payload_bytes: int, uplink_mbps: float) -> float:
+    return payload_bytes * 8 / (uplink_mbps * 1_000_000) * 1000
+
+
+async def live_call_ms(data: bytes, mime_type: str, detail: str) -> float:
+    from openai import AsyncOpenAI
+
+    client = AsyncOpenAI(api_key=os.environ["OPENAI_API_KEY"])
+    started = time.perf_counter()
+    await client.chat.completions.create(
+        model="gpt-4o",
+        messages=[{
+            "role": "user",
+            "content": [
+                {"type": "text", "text": "문서 종류만 한 단어로 답하세요."},
+                {
+                    "type": "image_url",
+                    "image_url": {
+                        "url": f"data:{mime_type};base64,{base64.b64encode(data).decode()}",
+                        "detail": detail,
+                    },
+                },
+            ],
+        }],
+        max_tokens=1,
+        timeout=90.0,
+    )
+    return (time.perf_counter() - started) * 1000
+
+
+async def run_sample(name: str, data: bytes, uplink_mbps: float, live: bool) -> None:
+    timings = []
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        prepared = prepare_image(data)
+        timings.append((time.perf_counter() - started) * 1000)
+    preprocess_ms = min(timings)
+
+    with Image.open(io.BytesIO(data)) as original:
+        original_size = original.size
+
+    baseline_payload = len(base64.b64encode(data))
+    prepared_payload = len(base64.b64encode(prepared.data))
+    baseline_total = upload_ms(baseline_payload, uplink_mbps)
+    prepared_total = preprocess_ms + upload_ms(prepared_payload, uplink_mbps)
+
+    print(f"\n{name} ({original_size[0]}x{original_size[1]})")
+    print(f"  baseline : {baseline_payload:>10,} B base64, detail=high, "
+          f"tokens={image_tokens(*original_size, 'high')}, est. {baseline_total:.0f} ms")
+    print(f"  prepared : {prepared_payload:>10,} B base64, detail={prepared.detail}, "
+          f"{prepared.width}x{prepared.height} {prepared.mime_type}, "
+          f"tokens={image_tokens(prepared.width, prepared.height, prepared.detail)}, "
+          f"est. {prepared_total:.0f} ms (preprocess {preprocess_ms:.0f} ms)")
+
+    if live:
+        baseline_live = await live_call_ms(data, "image/jpeg", "high")
+        prepared_live = preprocess_ms + await live_call_ms(prepared.data, prepared.mime_type, prepared.detail)
+        print(f"  live     : baseline {baseline_live:.0f} ms, prepared {prepared_live:.0f} ms")
+
+
+async def main(paths: List[str], uplink_mbps: float, live: bool) -> None:
+    if paths:
+        samples = [(os.path.basename(path), open(path, "rb").read()) for path in paths]
+    else:
+        samples = synthetic_samples()
+
+    print(f"uplink={uplink_mbps} Mbps, low detail <= {VISION_LOW_DETAIL_MAX_SIDE}px, live={live}")
+    for name, data in samples:
+        await run_sample(name, data, uplink_mbps, live)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="OCR 이미지 전처리 전후 전송 크기/지연 시간 비교")
+    parser.add_argument("paths", nargs="*", help="측정할 이미지 (없으면 합성 이미지 사용)")
+    parser.add_argument("--uplink-mbps", type=float, default=10.0)
+    parser.add_argument("--live", action="store_true", help="실제 GPT-4o 호출 시간 측정 (OPENAI_API_KEY 필요)")
+    args = parser.parse_args()
+    asyncio.run(main(args.paths, args.uplink_mbps, args.live))
@@ -0,0 +1,91 @@
+# benchmarks/bench_password_hashing.py
+"""
+로그인 폭주 중 다른 엔드포인트 지연 시간 측정
+- 동기 해싱(이벤트 루프에서 직접 실행)과 해싱 풀(PasswordHasher)을 비교
+- DB 없이 ASGI 앱을 프로세스 내에서 호출 (httpx.ASGITransport)
+- 사용법 (backend 디렉터리에서): python -m benchmarks.bench_password_hashing [--logins 20] [--pings 200]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+os.environ.setdefault("BACKEND_PORT", "8000")
+os.environ.setdefault("ALLOWED_ORIGINS", "http://localhost")
+
+import httpx
+from fastapi import FastAPI
+
+from app.core.config import settings
+from app.core.password_hasher import PasswordHasher
+from app.utils.password import hash_password, verify_password
+
+STORED_HASH = hash_password("benchmark-password")
+PING_INTERVAL_SECONDS = 0.01
+
+
+def build_app(hasher: PasswordHasher) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    @app.post("/login/sync")
+    async def login_sync():
+        return {"ok": verify_password("benchmark-password", STORED_HASH)}
+
+    @app.post("/login/pool")
+    async def login_pool():
+        return {"ok": await hasher.verify("benchmark-password", STORED_HASH)}
+
+    return app
+
+
+async def run_scenario(mode: str, logins: int, pings: int) -> dict:
+    hasher = PasswordHasher(
+        max_workers=settings.PASSWORD_HASH_MAX_WORKERS,
+        queue_timeout_seconds=60.0,
+    )
+    transport = httpx.ASGITransport(app=build_app(hasher))
+    latencies = []
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def ping_loop():
+            # 예정 시각 기준으로 측정 (루프가 막혀 늦게 보낸 요청의 대기 시간도 포함)
+            scheduled = time.perf_counter()
+            for _ in range(pings):
+                scheduled += PING_INTERVAL_SECONDS
+                await asyncio.sleep(max(scheduled - time.perf_counter(), 0))
+                await client.get("/ping")
+                latencies.append((time.perf_counter() - scheduled) * 1000)
+
+        started = time.perf_counter()
+        burst = [client.post(f"/login/{mode}") for _ in range(logins)]
+        await asyncio.gather(ping_loop(), *burst)
+        elapsed = time.perf_counter() - started
+
+    hasher.shutdown()
+    latencies.sort()
+    return {
+        "mode": mode,
+        "elapsed_s": round(elapsed, 2),
+        "ping_p50_ms": round(statistics.median(latencies), 2),
+        "ping_p95_ms": round(latencies[int(len(latencies) * 0.95) - 1], 2),
+        "ping_max_ms": round(latencies[-1], 2),
+    }
+
+
+async def main(logins: int, pings: int) -> None:
+    print(f"logins={logins} pings={pings} workers={settings.PASSWORD_HASH_MAX_WORKERS}")
+    for mode in ("sync", "pool"):
+        print(await run_scenario(mode, logins, pings))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="로그인 폭주 중 /ping 지연 시간 비교")
+    parser.add_argument("--logins", type=int, default=20)
+    parser.add_argument("--pings", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.logins, args.pings))
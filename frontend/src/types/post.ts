@@ -9,6 +9,7 @@ export interface Post {
   is_anonymous: boolean;
   view_count: number;
   like_count: number;
+  comment_count: number;
   created_at: string;
   updated_at: string;
 }
@@ -43,10 +44,15 @@ export interface PostUpdate {
   is_anonymous?: boolean;
 }
 
+export interface PostListItem extends Post {
+  content_truncated: boolean;
+}
+
 export interface PostListResponse {
-  posts: Post[];
+  posts: PostListItem[];
   total: number;
   page: number;
   page_size: number;
   total_pages: number;
+  next_cursor?: string | null;
 }